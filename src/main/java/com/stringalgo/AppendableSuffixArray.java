@@ -0,0 +1,220 @@
+package com.stringalgo;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.stream.IntStream;
+
+/**
+ * Text index that grows by appending, without rebuilding over the whole
+ * text on every append.
+ * 
+ * The text is split into consecutive levels, each with its own
+ * {@link SuffixArray} over its part of the text, kept like the digits of
+ * a binary counter:
+ * - appended text is indexed lazily, at the first query after an append,
+ *   as a new last level
+ * - the new level absorbs the levels before it while the previous level
+ *   is shorter than twice the text gathered so far, and is then built
+ *   once over the whole run
+ * Afterwards every level is at least twice as long as the next, so there
+ * are O(log n) levels. A level is absorbed only by a run longer than half
+ * of it, so each absorption grows the level of its symbols by at least
+ * half, and every symbol is rebuilt O(log n) times however appends and
+ * queries interleave.
+ * 
+ * An occurrence lies entirely in one level or starts in a level and
+ * crosses its end; the latter start within m - 1 positions of the end of
+ * a level and are checked directly.
+ * 
+ * Time Complexity: O(appended) per append plus amortized O(log n) per
+ *                  appended symbol for level builds; O(m log² n + m² log n)
+ *                  per count
+ * Space Complexity: O(n)
+ */
+public final class AppendableSuffixArray {
+    
+    /**
+     * A part of the text with its own suffix array.
+     */
+    private static final class Level {
+        final int start;
+        final int length;
+        final SuffixArray index;
+        
+        Level(int start, String part) {
+            this.start = start;
+            this.length = part.length();
+            this.index = new SuffixArray(part, true);
+            index.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        }
+    }
+    
+    private final StringBuilder text;
+    private final List<Level> levels = new ArrayList<>();
+    private int indexed;
+    private long rebuiltSymbols;
+    
+    /**
+     * Creates an empty index.
+     */
+    public AppendableSuffixArray() {
+        this("");
+    }
+    
+    /**
+     * @param text the initial text, indexed right away
+     */
+    public AppendableSuffixArray(String text) {
+        this.text = new StringBuilder(text);
+        merge();
+    }
+    
+    /**
+     * Appends text to the end of the indexed text. It is indexed at the
+     * next query.
+     * 
+     * @param appended the text to append
+     */
+    public void append(CharSequence appended) {
+        text.append(appended);
+    }
+    
+    /**
+     * Rebuilds the index over the whole text as a single level.
+     * 
+     * Time Complexity: O(n)
+     */
+    public void merge() {
+        levels.clear();
+        indexed = 0;
+        if (text.length() > 0) {
+            build(0);
+        }
+    }
+    
+    /**
+     * Indexes the text appended since the last query, absorbing the
+     * levels that are shorter than twice the run being built.
+     */
+    private void indexAppended() {
+        if (indexed == text.length()) {
+            return;
+        }
+        int from = indexed;
+        while (!levels.isEmpty()) {
+            Level last = levels.get(levels.size() - 1);
+            if (last.length >= 2L * (text.length() - from)) {
+                break;
+            }
+            levels.remove(levels.size() - 1);
+            from = last.start;
+        }
+        build(from);
+    }
+    
+    private void build(int from) {
+        levels.add(new Level(from, text.substring(from)));
+        rebuiltSymbols += text.length() - from;
+        indexed = text.length();
+    }
+    
+    /**
+     * Counts the occurrences of a pattern in the whole text.
+     * 
+     * @param pattern the pattern to count
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(String pattern) {
+        if (pattern.isEmpty()) {
+            return text.length() + 1;
+        }
+        indexAppended();
+        int count = 0;
+        for (Level level : levels) {
+            count += level.index.count(pattern);
+        }
+        return count + (int) crossing(pattern).count();
+    }
+    
+    /**
+     * Streams the start position of every occurrence of a pattern: those
+     * within each level come first, level by level in suffix array order,
+     * then those across the ends of levels.
+     * 
+     * @param pattern the pattern to locate
+     * @return the positions of all occurrences
+     */
+    public IntStream locateAll(String pattern) {
+        if (pattern.isEmpty()) {
+            return IntStream.rangeClosed(0, text.length());
+        }
+        indexAppended();
+        IntStream result = IntStream.empty();
+        for (Level level : levels) {
+            int offset = level.start;
+            result = IntStream.concat(result, level.index.locateAll(pattern).map(p -> p + offset));
+        }
+        return IntStream.concat(result, crossing(pattern));
+    }
+    
+    /**
+     * @return the occurrences that start in a level and end after it
+     */
+    private IntStream crossing(String pattern) {
+        int m = pattern.length();
+        List<Level> snapshot = new ArrayList<>(levels);
+        return IntStream.range(0, snapshot.size() - 1).flatMap(l -> {
+            Level level = snapshot.get(l);
+            int end = level.start + level.length;
+            int from = Math.max(level.start, end - m + 1);
+            int to = Math.min(end, text.length() - m + 1);
+            return IntStream.range(from, Math.max(from, to)).filter(p -> matchesAt(p, pattern));
+        });
+    }
+    
+    private boolean matchesAt(int position, String pattern) {
+        for (int k = 0; k < pattern.length(); k++) {
+            if (text.charAt(position + k) != pattern.charAt(k)) {
+                return false;
+            }
+        }
+        return true;
+    }
+    
+    /**
+     * @return the length of the whole text
+     */
+    public int length() {
+        return text.length();
+    }
+    
+    /**
+     * @return the length of the text outside the first, longest level,
+     *         including text not indexed yet
+     */
+    public int deltaLength() {
+        return levels.isEmpty() ? text.length() : text.length() - levels.get(0).length;
+    }
+    
+    /**
+     * @return the number of levels built so far; text appended since the
+     *         last query is not counted
+     */
+    public int levelCount() {
+        return levels.size();
+    }
+    
+    /**
+     * @return the total length of all levels built so far
+     */
+    long rebuiltSymbols() {
+        return rebuiltSymbols;
+    }
+    
+    /**
+     * @return the whole text
+     */
+    public String getText() {
+        return text.toString();
+    }
+}
@@ -0,0 +1,79 @@
+package com.stringalgo;
+
+import java.util.Arrays;
+
+/**
+ * LCP array stored in one byte per entry.
+ * 
+ * Values below 255 are stored directly in a byte array. The byte 255
+ * marks an overflow: the full value is kept in a table of (index, value)
+ * pairs sorted by index and found with binary search. Typical texts have
+ * few LCP values of 255 or more, so the array takes about a quarter of
+ * the memory of an int array.
+ * 
+ * Time Complexity: O(1) per access, O(log k) for the k overflowed entries
+ * Space Complexity: O(n) bytes plus 8 bytes per overflowed entry
+ */
+public final class CompactLCPArray implements LCPArray {
+    
+    private static final int ESCAPE = 0xFF;
+    
+    private final byte[] values;
+    private final int[] overflowIndex;
+    private final int[] overflowValue;
+    
+    /**
+     * Packs the given LCP values.
+     * 
+     * @param lcp the LCP values, all non-negative
+     */
+    public CompactLCPArray(int[] lcp) {
+        this.values = new byte[lcp.length];
+        
+        int overflows = 0;
+        for (int value : lcp) {
+            if (value < 0) {
+                throw new IllegalArgumentException("Negative LCP value: " + value);
+            }
+            if (value >= ESCAPE) {
+                overflows++;
+            }
+        }
+        this.overflowIndex = new int[overflows];
+        this.overflowValue = new int[overflows];
+        
+        // Indices are visited in increasing order, so the table is sorted
+        int k = 0;
+        for (int i = 0; i < lcp.length; i++) {
+            if (lcp[i] < ESCAPE) {
+                values[i] = (byte) lcp[i];
+            } else {
+                values[i] = (byte) ESCAPE;
+                overflowIndex[k] = i;
+                overflowValue[k] = lcp[i];
+                k++;
+            }
+        }
+    }
+    
+    @Override
+    public int length() {
+        return values.length;
+    }
+    
+    @Override
+    public int get(int i) {
+        int value = values[i] & 0xFF;
+        if (value != ESCAPE) {
+            return value;
+        }
+        return overflowValue[Arrays.binarySearch(overflowIndex, i)];
+    }
+    
+    /**
+     * @return the number of entries kept in the overflow table
+     */
+    public int overflowCount() {
+        return overflowIndex.length;
+    }
+}
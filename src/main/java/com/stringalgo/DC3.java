@@ -0,0 +1,244 @@
+package com.stringalgo;
+
+import java.util.Arrays;
+
+/**
+ * Suffix array construction with the DC3 (skew) algorithm of
+ * Kärkkäinen and Sanders (2003).
+ * 
+ * Suffixes starting at positions i mod 3 != 0 are sorted recursively on
+ * a string of triple names, the remaining suffixes are sorted from them
+ * with one radix pass, and the two groups are merged. Symbols may come
+ * from an integer alphabet of any size: they are first renamed to
+ * 1..σ' with counting or radix sort, so the algorithm never allocates
+ * buckets for symbols that do not occur.
+ * 
+ * Time Complexity: O(n)
+ * Space Complexity: O(n)
+ */
+final class DC3 {
+    
+    private static final int DIGIT_BITS = 16;
+    private static final int DIGIT_MASK = (1 << DIGIT_BITS) - 1;
+    
+    private DC3() {
+    }
+    
+    /**
+     * Sorts all suffixes of the given text.
+     * 
+     * @param text the symbols to sort, all non-negative
+     * @param sa output suffix array, length text.length()
+     */
+    static void sort(SymbolText text, int[] sa) {
+        int n = text.length();
+        if (n == 0) {
+            return;
+        }
+        if (n == 1) {
+            sa[0] = 0;
+            return;
+        }
+        
+        // The recursion reads up to three symbols past the end, which
+        // must be zero and therefore smaller than every renamed symbol.
+        int[] s = new int[n + 3];
+        int k = rename(text, s);
+        sort(s, sa, n, k);
+    }
+    
+    /**
+     * Maps the symbols of the text to 1..k in an order-preserving way.
+     * 
+     * @return k, the number of distinct symbols
+     */
+    private static int rename(SymbolText text, int[] s) {
+        int n = text.length();
+        int upper = 0;
+        for (int i = 0; i < n; i++) {
+            upper = Math.max(upper, text.symbolAt(i));
+        }
+        
+        // Small alphabet: direct lookup table
+        if (upper <= Math.max(n, DIGIT_MASK)) {
+            int[] name = new int[upper + 1];
+            for (int i = 0; i < n; i++) {
+                name[text.symbolAt(i)] = 1;
+            }
+            int k = 0;
+            for (int c = 0; c <= upper; c++) {
+                if (name[c] != 0) {
+                    name[c] = ++k;
+                }
+            }
+            for (int i = 0; i < n; i++) {
+                s[i] = name[text.symbolAt(i)];
+            }
+            return k;
+        }
+        
+        // Large alphabet: LSD radix sort of the positions, 16 bits per pass
+        int[] order = new int[n];
+        int[] sorted = new int[n];
+        for (int i = 0; i < n; i++) {
+            sorted[i] = i;
+        }
+        int[] count = new int[DIGIT_MASK + 2];
+        for (int shift = 0; shift < Integer.SIZE; shift += DIGIT_BITS) {
+            Arrays.fill(count, 0);
+            for (int i = 0; i < n; i++) {
+                count[((text.symbolAt(i) >>> shift) & DIGIT_MASK) + 1]++;
+            }
+            for (int d = 0; d <= DIGIT_MASK; d++) {
+                count[d + 1] += count[d];
+            }
+            for (int i = 0; i < n; i++) {
+                int p = sorted[i];
+                order[count[(text.symbolAt(p) >>> shift) & DIGIT_MASK]++] = p;
+            }
+            int[] swap = sorted;
+            sorted = order;
+            order = swap;
+        }
+        
+        int k = 0;
+        int prev = -1;
+        for (int i = 0; i < n; i++) {
+            int c = text.symbolAt(sorted[i]);
+            if (c != prev) {
+                k++;
+                prev = c;
+            }
+            s[sorted[i]] = k;
+        }
+        return k;
+    }
+    
+    /**
+     * Sorts the suffixes of s[0..n-1], where symbols are in 1..k,
+     * s[n] = s[n+1] = s[n+2] = 0 and n >= 2.
+     */
+    private static void sort(int[] s, int[] sa, int n, int k) {
+        int n0 = (n + 2) / 3;
+        int n1 = (n + 1) / 3;
+        int n2 = n / 3;
+        int n02 = n0 + n2;
+        
+        int[] s12 = new int[n02 + 3];
+        int[] sa12 = new int[n02 + 3];
+        int[] s0 = new int[n0];
+        int[] sa0 = new int[n0];
+        
+        // Step 1: Radix sort the mod 1 and mod 2 triples. A dummy mod 1
+        // suffix is added when n0 > n1 so both groups line up.
+        for (int i = 0, j = 0; i < n + (n0 - n1); i++) {
+            if (i % 3 != 0) {
+                s12[j++] = i;
+            }
+        }
+        radixPass(s12, sa12, s, 2, n02, k);
+        radixPass(sa12, s12, s, 1, n02, k);
+        radixPass(s12, sa12, s, 0, n02, k);
+        
+        // Step 2: Name the triples, mod 1 names first then mod 2 names
+        int name = 0;
+        int c0 = -1;
+        int c1 = -1;
+        int c2 = -1;
+        for (int i = 0; i < n02; i++) {
+            int p = sa12[i];
+            if (s[p] != c0 || s[p + 1] != c1 || s[p + 2] != c2) {
+                name++;
+                c0 = s[p];
+                c1 = s[p + 1];
+                c2 = s[p + 2];
+            }
+            if (p % 3 == 1) {
+                s12[p / 3] = name;
+            } else {
+                s12[p / 3 + n0] = name;
+            }
+        }
+        
+        // Step 3: Recurse if the names are not yet unique
+        if (name < n02) {
+            sort(s12, sa12, n02, name);
+            for (int i = 0; i < n02; i++) {
+                s12[sa12[i]] = i + 1;
+            }
+        } else {
+            for (int i = 0; i < n02; i++) {
+                sa12[s12[i] - 1] = i;
+            }
+        }
+        
+        // Step 4: Sort mod 0 suffixes by (first symbol, rank of suffix i+1)
+        for (int i = 0, j = 0; i < n02; i++) {
+            if (sa12[i] < n0) {
+                s0[j++] = 3 * sa12[i];
+            }
+        }
+        radixPass(s0, sa0, s, 0, n0, k);
+        
+        // Step 5: Merge the mod 0 and mod 1/2 suffixes
+        for (int p = 0, t = n0 - n1, idx = 0; idx < n; idx++) {
+            int i = position(sa12[t], n0);
+            int j = sa0[p];
+            boolean takeS12 = (sa12[t] < n0)
+                ? leq(s[i], s12[sa12[t] + n0], s[j], s12[j / 3])
+                : leq(s[i], s[i + 1], s12[sa12[t] - n0 + 1],
+                      s[j], s[j + 1], s12[j / 3 + n0]);
+            
+            if (takeS12) {
+                sa[idx] = i;
+                t++;
+                if (t == n02) {
+                    for (idx++; p < n0; p++, idx++) {
+                        sa[idx] = sa0[p];
+                    }
+                }
+            } else {
+                sa[idx] = j;
+                p++;
+                if (p == n0) {
+                    for (idx++; t < n02; t++, idx++) {
+                        sa[idx] = position(sa12[t], n0);
+                    }
+                }
+            }
+        }
+    }
+    
+    /**
+     * Maps an index of the reduced string back to a text position.
+     */
+    private static int position(int reduced, int n0) {
+        return reduced < n0 ? reduced * 3 + 1 : (reduced - n0) * 3 + 2;
+    }
+    
+    /**
+     * Stable counting sort of a[0..n-1] into b by key r[a[i] + offset].
+     */
+    private static void radixPass(int[] a, int[] b, int[] r, int offset, int n, int k) {
+        int[] count = new int[k + 1];
+        for (int i = 0; i < n; i++) {
+            count[r[a[i] + offset]]++;
+        }
+        for (int i = 0, sum = 0; i <= k; i++) {
+            int t = count[i];
+            count[i] = sum;
+            sum += t;
+        }
+        for (int i = 0; i < n; i++) {
+            b[count[r[a[i] + offset]]++] = a[i];
+        }
+    }
+    
+    private static boolean leq(int a1, int a2, int b1, int b2) {
+        return a1 < b1 || (a1 == b1 && a2 <= b2);
+    }
+    
+    private static boolean leq(int a1, int a2, int a3, int b1, int b2, int b3) {
+        return a1 < b1 || (a1 == b1 && leq(a2, a3, b2, b3));
+    }
+}
@@ -0,0 +1,194 @@
+package com.stringalgo;
+
+import java.util.Arrays;
+import java.util.PriorityQueue;
+
+/**
+ * Document listing over a {@link GeneralizedSuffixArray}: the documents
+ * that contain a pattern, each reported once, and the documents where it
+ * occurs most often.
+ * 
+ * Listing follows Muthukrishnan (2002). With prev[i] the largest j < i
+ * whose suffix lies in the same document as suffix i, or -1, a document
+ * has an occurrence in [lo, hi) exactly once with prev[i] < lo. The
+ * minimum of prev over the interval is found with a range minimum query;
+ * if it is below lo its document is reported and both sides are searched
+ * the same way, otherwise no new document is left in the interval. Every
+ * query either reports a document or ends a branch, so the cost follows
+ * the number of documents, not of occurrences.
+ * 
+ * For frequencies, the suffix array indices of each document are kept
+ * in order, and the occurrences of a document in [lo, hi) are counted by
+ * two binary searches in its list.
+ * 
+ * Time Complexity: O(N) construction, O(m log N + ndoc) listing,
+ *                  O(m log N + ndoc log N) top-k
+ * Space Complexity: O(N), two int arrays plus the range minimum structure
+ */
+public final class DocumentListing {
+    
+    private final GeneralizedSuffixArray index;
+    private final int[] documentArray;
+    private final int[] previous;
+    private final RangeMinimum previousMin;
+    private final int[] documentRows;
+    private final int[] documentStart;
+    
+    /**
+     * @param index the generalized suffix array to list documents of
+     */
+    public DocumentListing(GeneralizedSuffixArray index) {
+        this.index = index;
+        this.documentArray = index.getDocumentArray();
+        int n = documentArray.length;
+        int documents = index.documentCount();
+        
+        // Step 1: Previous suffix array index of the same document; the
+        // empty suffix is never reported
+        this.previous = new int[n];
+        int[] last = new int[documents];
+        Arrays.fill(last, -1);
+        for (int i = 0; i < n; i++) {
+            int d = documentArray[i];
+            if (d < 0) {
+                previous[i] = Integer.MAX_VALUE;
+            } else {
+                previous[i] = last[d];
+                last[d] = i;
+            }
+        }
+        this.previousMin = new RangeMinimum(i -> previous[i], n);
+        
+        // Step 2: Suffix array indices grouped by document, in order
+        this.documentStart = new int[documents + 1];
+        for (int d : documentArray) {
+            if (d >= 0) {
+                documentStart[d + 1]++;
+            }
+        }
+        for (int d = 0; d < documents; d++) {
+            documentStart[d + 1] += documentStart[d];
+        }
+        this.documentRows = new int[documentStart[documents]];
+        int[] next = Arrays.copyOf(documentStart, documents);
+        for (int i = 0; i < n; i++) {
+            int d = documentArray[i];
+            if (d >= 0) {
+                documentRows[next[d]++] = i;
+            }
+        }
+    }
+    
+    /**
+     * Lists every document that contains a pattern, once each, in no
+     * particular order.
+     * 
+     * Time Complexity: O(m log N + ndoc)
+     * 
+     * @param pattern the pattern to search
+     * @return the documents containing the pattern
+     */
+    public int[] listDocuments(String pattern) {
+        int[] range = index.findRange(pattern);
+        return listDocuments(range[0], range[1]);
+    }
+    
+    private int[] listDocuments(int lo, int hi) {
+        int[] result = new int[16];
+        int count = 0;
+        int[] stack = new int[32];
+        int top = 0;
+        if (lo < hi) {
+            stack[top++] = lo;
+            stack[top++] = hi - 1;
+        }
+        
+        while (top > 0) {
+            int b = stack[--top];
+            int a = stack[--top];
+            int i = previousMin.argmin(a, b);
+            if (previous[i] >= lo) {
+                continue;
+            }
+            
+            if (count == result.length) {
+                result = Arrays.copyOf(result, count * 2);
+            }
+            result[count++] = documentArray[i];
+            
+            if (top + 4 > stack.length) {
+                stack = Arrays.copyOf(stack, stack.length * 2);
+            }
+            if (a < i) {
+                stack[top++] = a;
+                stack[top++] = i - 1;
+            }
+            if (i < b) {
+                stack[top++] = i + 1;
+                stack[top++] = b;
+            }
+        }
+        return Arrays.copyOf(result, count);
+    }
+    
+    /**
+     * @return the number of suffixes of a document in [lo, hi)
+     */
+    private int frequency(int document, int lo, int hi) {
+        int from = documentStart[document];
+        int to = documentStart[document + 1];
+        return lowerBound(from, to, hi) - lowerBound(from, to, lo);
+    }
+    
+    private int lowerBound(int from, int to, int key) {
+        int position = Arrays.binarySearch(documentRows, from, to, key);
+        return position < 0 ? -position - 1 : position;
+    }
+    
+    /**
+     * @param pattern the pattern to count
+     * @param document a document number
+     * @return the number of occurrences of the pattern in the document
+     */
+    public int frequency(String pattern, int document) {
+        int[] range = index.findRange(pattern);
+        return frequency(document, range[0], range[1]);
+    }
+    
+    /**
+     * Finds the k documents in which a pattern occurs most often. Ties go
+     * to the lower document number.
+     * 
+     * Time Complexity: O(m log N + ndoc log N)
+     * 
+     * @param pattern the pattern to search
+     * @param k the number of documents to report, at least 1
+     * @return up to k pairs {document, occurrences}, most occurrences first
+     */
+    public int[][] topDocuments(String pattern, int k) {
+        if (k < 1) {
+            throw new IllegalArgumentException("k must be positive: " + k);
+        }
+        int[] range = index.findRange(pattern);
+        int[] documents = listDocuments(range[0], range[1]);
+        
+        // Keep the k best seen so far, with the worst of them on top
+        PriorityQueue<int[]> best = new PriorityQueue<>(
+            (x, y) -> x[1] != y[1] ? Integer.compare(x[1], y[1]) : Integer.compare(y[0], x[0]));
+        for (int d : documents) {
+            int[] entry = {d, frequency(d, range[0], range[1])};
+            if (best.size() < k) {
+                best.add(entry);
+            } else if (best.comparator().compare(entry, best.peek()) > 0) {
+                best.poll();
+                best.add(entry);
+            }
+        }
+        
+        int[][] result = new int[best.size()][];
+        for (int i = result.length - 1; i >= 0; i--) {
+            result[i] = best.poll();
+        }
+        return result;
+    }
+}
@@ -0,0 +1,261 @@
+package com.stringalgo;
+
+import java.util.Arrays;
+
+/**
+ * Enhanced suffix array of Abouelhoda, Kurtz and Ohlebusch (2004): the
+ * suffix array and LCP array plus a child table, which together simulate
+ * a suffix tree without any pointer-based nodes.
+ * 
+ * Every internal node of the suffix tree is an lcp-interval [lo, hi) of
+ * the suffix array. Its children are separated by the l-indices, the
+ * positions i in (lo, hi) whose lcp[i] equals the interval's LCP. The
+ * child table stores, for each position:
+ * - up / down: the first l-index of the interval ending or starting here
+ * - nextLIndex: the next l-index of the same interval
+ * All three are computed in two stack passes over the LCP array.
+ * 
+ * Time Complexity: O(n) construction, O(m σ) top-down search
+ * Space Complexity: O(n), three int arrays on top of the suffix array
+ */
+public final class EnhancedSuffixArray {
+    
+    private final int n;
+    private final int[] sa;
+    private final LCPArray lcp;
+    private final SymbolText symbols;
+    private final int[] up;
+    private final int[] down;
+    private final int[] nextLIndex;
+    
+    /**
+     * Receives the lcp-intervals of a bottom-up traversal.
+     */
+    @FunctionalInterface
+    public interface IntervalVisitor {
+        /**
+         * @param lcp the length of the prefix shared by the interval
+         * @param lo first suffix array index of the interval
+         * @param hi index after the last one; hi - lo >= 2
+         */
+        void visit(int lcp, int lo, int hi);
+    }
+    
+    /**
+     * Builds the child table of a suffix array, building its LCP array
+     * first if needed.
+     * 
+     * @param suffixArray a suffix array whose construction has run
+     */
+    public EnhancedSuffixArray(SuffixArray suffixArray) {
+        if (suffixArray.getLCPArray() == null) {
+            suffixArray.buildLCP();
+        }
+        this.sa = suffixArray.getSuffixArray();
+        this.lcp = suffixArray.getLCPArray();
+        this.symbols = suffixArray.symbols();
+        this.n = sa.length;
+        this.up = new int[n + 1];
+        this.down = new int[n + 1];
+        this.nextLIndex = new int[n + 1];
+        buildChildTable();
+    }
+    
+    /**
+     * LCP with -1 at both ends, so every interval is closed by the stack.
+     */
+    private int lcpAt(int i) {
+        return (i == 0 || i == n) ? -1 : lcp.get(i);
+    }
+    
+    private void buildChildTable() {
+        Arrays.fill(up, -1);
+        Arrays.fill(down, -1);
+        Arrays.fill(nextLIndex, -1);
+        int[] stack = new int[n + 1];
+        
+        // Step 1: up and down values
+        int top = 0;
+        stack[0] = 0;
+        int lastIndex = -1;
+        for (int i = 1; i <= n; i++) {
+            while (lcpAt(i) < lcpAt(stack[top])) {
+                lastIndex = stack[top--];
+                if (lcpAt(i) <= lcpAt(stack[top]) &&
+                    lcpAt(stack[top]) != lcpAt(lastIndex)) {
+                    down[stack[top]] = lastIndex;
+                }
+            }
+            if (lastIndex != -1) {
+                up[i] = lastIndex;
+                lastIndex = -1;
+            }
+            stack[++top] = i;
+        }
+        
+        // Step 2: next l-index values
+        top = 0;
+        stack[0] = 0;
+        for (int i = 1; i <= n; i++) {
+            while (lcpAt(i) < lcpAt(stack[top])) {
+                top--;
+            }
+            if (lcpAt(i) == lcpAt(stack[top])) {
+                nextLIndex[stack[top--]] = i;
+            }
+            stack[++top] = i;
+        }
+    }
+    
+    /**
+     * @return the first l-index of the interval [lo, hi), hi - lo >= 2
+     */
+    private int firstLIndex(int lo, int hi) {
+        int last = hi - 1;
+        if (lo < up[last + 1] && up[last + 1] <= last) {
+            return up[last + 1];
+        }
+        return down[lo];
+    }
+    
+    /**
+     * Finds the suffix array interval of all suffixes starting with the
+     * pattern by walking down the virtual suffix tree: at each node the
+     * child starting with the next pattern symbol is chosen among at most
+     * σ children, and the symbols up to the child's depth are compared
+     * once against a single suffix.
+     * 
+     * Time Complexity: O(m σ), independent of n
+     * 
+     * @param pattern the pattern to search
+     * @return {lo, hi}, the half-open interval of matching SA indices;
+     *         {0, 0} if the pattern does not occur
+     */
+    public int[] findRange(String pattern) {
+        return findRange(SymbolText.of(pattern));
+    }
+    
+    /**
+     * Integer symbol version of {@link #findRange(String)}.
+     * 
+     * @param pattern the symbols to search
+     * @return {lo, hi}, the half-open interval of matching SA indices
+     */
+    public int[] findRange(int[] pattern) {
+        return findRange(SymbolText.of(pattern, Integer.MAX_VALUE));
+    }
+    
+    /**
+     * @param pattern the pattern to count
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(String pattern) {
+        int[] range = findRange(pattern);
+        return range[1] - range[0];
+    }
+    
+    private int[] findRange(SymbolText pattern) {
+        int m = pattern.length();
+        int lo = 0, hi = n;
+        int matched = 0;
+        
+        while (matched < m) {
+            if (hi - lo == 1) {
+                // A leaf: the rest of the pattern is compared directly
+                return matches(sa[lo], pattern, matched, m)
+                    ? new int[] {lo, hi} : new int[] {0, 0};
+            }
+            
+            // Step 1: Compare the pattern up to the depth of this node
+            int first = firstLIndex(lo, hi);
+            int depth = lcp.get(first);
+            int end = Math.min(depth, m);
+            if (!matches(sa[lo], pattern, matched, end)) {
+                return new int[] {0, 0};
+            }
+            matched = end;
+            if (matched == m) {
+                break;
+            }
+            
+            // Step 2: Descend into the child whose next symbol matches
+            int c = pattern.symbolAt(depth);
+            int childLo = lo;
+            int childHi = first;
+            while (!startsWith(sa[childLo], depth, c)) {
+                if (childHi == hi) {
+                    return new int[] {0, 0};
+                }
+                childLo = childHi;
+                int next = nextLIndex[childLo];
+                childHi = (next != -1 && next < hi) ? next : hi;
+            }
+            lo = childLo;
+            hi = childHi;
+            matched = depth + 1;
+        }
+        return new int[] {lo, hi};
+    }
+    
+    /**
+     * @return whether symbols [from, to) of the suffix at start equal
+     *         those of the pattern
+     */
+    private boolean matches(int start, SymbolText pattern, int from, int to) {
+        int length = symbols.length();
+        for (int k = from; k < to; k++) {
+            if (start + k >= length || symbols.symbolAt(start + k) != pattern.symbolAt(k)) {
+                return false;
+            }
+        }
+        return true;
+    }
+    
+    private boolean startsWith(int start, int depth, int c) {
+        return start + depth < symbols.length() && symbols.symbolAt(start + depth) == c;
+    }
+    
+    /**
+     * Reports every lcp-interval, the internal nodes of the suffix tree,
+     * bottom-up: each interval after all intervals nested inside it. The
+     * root is reported last. Useful for repeat analysis, as an interval
+     * of LCP l and width w is a substring of length l occurring w times
+     * that cannot be extended to the right without losing an occurrence.
+     * The root [0, n) is reported once, with the length of the prefix all
+     * suffixes share, which is 0 unless every suffix starts alike, as in
+     * "$$$$" with an explicit '$'.
+     * 
+     * Time Complexity: O(n)
+     * 
+     * @param visitor receives each interval
+     */
+    public void forEachInterval(IntervalVisitor visitor) {
+        int[] stackLcp = new int[n + 1];
+        int[] stackLo = new int[n + 1];
+        int top = 0;
+        stackLcp[0] = 0;
+        stackLo[0] = 0;
+        boolean rootVisited = false;
+        
+        for (int i = 1; i <= n; i++) {
+            int current = (i == n) ? -1 : lcp.get(i);
+            int lo = i - 1;
+            while (top >= 0 && current < stackLcp[top]) {
+                lo = stackLo[top];
+                // The lcp-0 bottom entry is not an interval when one with a
+                // longer shared prefix already spans [0, n)
+                boolean root = (lo == 0 && i == n);
+                if (i - lo >= 2 && !(root && rootVisited)) {
+                    visitor.visit(stackLcp[top], lo, i);
+                    rootVisited |= root;
+                }
+                top--;
+            }
+            if (top < 0 || current > stackLcp[top]) {
+                top++;
+                stackLcp[top] = current;
+                stackLo[top] = lo;
+            }
+        }
+    }
+}
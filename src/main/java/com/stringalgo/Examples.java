@@ -141,6 +141,10 @@ public class Examples {
         long distinct = sa.countDistinctSubstrings();
         System.out.println("Total distinct substrings: " + distinct);
         
+        // Index every k-mer up to k=8 within 64 KB to jump-start searches
+        int k = sa.buildKmerTable(8, 64 * 1024);
+        System.out.println("k-mer table built for k = " + k);
+        
         // Search for specific patterns
         String[] motifs = {"ACGT", "CGTA", "AAAA", "TTTT"};
         System.out.println("\nMotif search:");
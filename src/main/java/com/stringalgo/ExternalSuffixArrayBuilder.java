@@ -0,0 +1,367 @@
+package com.stringalgo;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.Closeable;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.IOException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardCopyOption;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Comparator;
+import java.util.List;
+import java.util.PriorityQueue;
+import java.util.stream.Collectors;
+import java.util.stream.Stream;
+
+/**
+ * Disk-backed suffix array construction for texts larger than memory.
+ * 
+ * Uses prefix doubling where every round is a pair of external sorts:
+ * 1. Pair each name[i] with name[i+k] by scanning the name file twice
+ * 2. Sort the pairs in bounded-size runs, spill them to temp files and
+ *    k-way merge them, giving every group of equal pairs a new name
+ * 3. Sort the new names back into text order the same way
+ * Rounds stop once all names are unique; the merged order of the last
+ * round is the suffix array.
+ * 
+ * Memory is bounded by the run length, or the text length if smaller:
+ * about 48 bytes per record of run length, plus one read buffer per run.
+ * 
+ * The text is read as unsigned bytes followed by a virtual sentinel, so
+ * the output matches an in-memory {@link SuffixArray} over the same
+ * symbols. The result file holds big-endian ints, one per suffix, and is
+ * read by {@link SuffixArrayFile}.
+ * 
+ * Time Complexity: O(n log² n) CPU, O(n log n) sequential I/O
+ * Space Complexity: O(min(runLength, n)) memory, O(n) disk
+ */
+public final class ExternalSuffixArrayBuilder {
+    
+    /** Default number of records sorted in memory per run. */
+    public static final int DEFAULT_RUN_LENGTH = 1 << 22;
+    
+    private static final int BUFFER_SIZE = 1 << 16;
+    private static final int DIGIT_BITS = 16;
+    private static final int DIGIT_MASK = (1 << DIGIT_BITS) - 1;
+    
+    private final Path tempDir;
+    private final int runLength;
+    
+    /**
+     * @param tempDir directory for sorted runs and intermediate files
+     */
+    public ExternalSuffixArrayBuilder(Path tempDir) {
+        this(tempDir, DEFAULT_RUN_LENGTH);
+    }
+    
+    /**
+     * @param tempDir directory for sorted runs and intermediate files
+     * @param runLength number of records sorted in memory per run
+     */
+    public ExternalSuffixArrayBuilder(Path tempDir, int runLength) {
+        if (runLength < 1) {
+            throw new IllegalArgumentException("Run length must be positive: " + runLength);
+        }
+        this.tempDir = tempDir;
+        this.runLength = runLength;
+    }
+    
+    /**
+     * Builds the suffix array of a file and writes it to another file.
+     * 
+     * @param textFile the text, one symbol per byte, less than 2 GiB
+     * @param output file receiving length + 1 big-endian ints, the first
+     *        being the position of the virtual sentinel
+     * @throws IOException if reading or writing fails
+     */
+    public void build(Path textFile, Path output) throws IOException {
+        long size = Files.size(textFile);
+        if (size >= Integer.MAX_VALUE) {
+            throw new IllegalArgumentException("Text too large: " + size + " bytes");
+        }
+        int length = (int) size;
+        
+        Path workDir = Files.createTempDirectory(tempDir, "suffix-array");
+        try {
+            Path names = workDir.resolve("names");
+            Path order = workDir.resolve("order");
+            writeInitialNames(textFile, names, length);
+            
+            // Each round sorts length records, so a short text never
+            // needs the full run buffers
+            int capacity = Math.max(1, Math.min(runLength, length));
+            RunSorter byPair = new RunSorter(workDir, capacity);
+            RunSorter byPosition = new RunSorter(workDir, capacity);
+            
+            for (int k = 1; ; k *= 2) {
+                // Step 1: Pair every name with the name k positions later
+                byPair.reset();
+                try (DataInputStream first = openInput(names);
+                     DataInputStream second = openInput(names)) {
+                    for (int i = 0; i < Math.min(k, length); i++) {
+                        second.readInt();
+                    }
+                    for (int i = 0; i < length; i++) {
+                        long high = first.readInt();
+                        long low = (i + k < length) ? second.readInt() : 0;
+                        byPair.add((high << 32) | low, i);
+                    }
+                }
+                
+                // Step 2: Merge pairs, name groups of equal pairs
+                byPosition.reset();
+                Renamer renamer;
+                try (DataOutputStream out = openOutput(order)) {
+                    out.writeInt(length); // Virtual sentinel sorts first
+                    renamer = new Renamer(out, byPosition);
+                    byPair.merge(renamer);
+                }
+                
+                if (renamer.groups == length) {
+                    Files.move(order, output, StandardCopyOption.REPLACE_EXISTING);
+                    return;
+                }
+                
+                // Step 3: Bring the new names back into text order
+                try (DataOutputStream out = openOutput(names)) {
+                    byPosition.merge((position, name) -> out.writeInt(name));
+                }
+            }
+        } finally {
+            deleteRecursively(workDir);
+        }
+    }
+    
+    private static void writeInitialNames(Path textFile, Path names, int length)
+            throws IOException {
+        try (BufferedInputStream in = new BufferedInputStream(
+                 Files.newInputStream(textFile), BUFFER_SIZE);
+             DataOutputStream out = openOutput(names)) {
+            for (int i = 0; i < length; i++) {
+                int b = in.read();
+                if (b < 0) {
+                    throw new IOException("Text file shrank while reading: " + textFile);
+                }
+                out.writeInt(b + 1); // Name 0 is reserved for end of text
+            }
+        }
+    }
+    
+    private static DataInputStream openInput(Path file) throws IOException {
+        return new DataInputStream(new BufferedInputStream(
+            Files.newInputStream(file), BUFFER_SIZE));
+    }
+    
+    private static DataOutputStream openOutput(Path file) throws IOException {
+        return new DataOutputStream(new BufferedOutputStream(
+            Files.newOutputStream(file), BUFFER_SIZE));
+    }
+    
+    private static void deleteRecursively(Path dir) throws IOException {
+        List<Path> paths;
+        try (Stream<Path> walk = Files.walk(dir)) {
+            paths = walk.sorted(Comparator.reverseOrder()).collect(Collectors.toList());
+        }
+        for (Path path : paths) {
+            Files.deleteIfExists(path);
+        }
+    }
+    
+    @FunctionalInterface
+    private interface RecordConsumer {
+        void accept(long key, int value) throws IOException;
+    }
+    
+    /**
+     * Receives pairs in sorted order. Each record is named one plus the
+     * index of the first record of its group, so names stay below 2^31.
+     */
+    private static final class Renamer implements RecordConsumer {
+        private final DataOutputStream order;
+        private final RunSorter byPosition;
+        private long previousKey = -1;
+        private int index;
+        private int name;
+        private int groups;
+        
+        Renamer(DataOutputStream order, RunSorter byPosition) {
+            this.order = order;
+            this.byPosition = byPosition;
+        }
+        
+        @Override
+        public void accept(long key, int position) throws IOException {
+            if (key != previousKey) {
+                name = index + 1;
+                groups++;
+                previousKey = key;
+            }
+            index++;
+            order.writeInt(position);
+            byPosition.add(position, name);
+        }
+    }
+    
+    /**
+     * External sorter for (long key, int value) records. Records are
+     * radix sorted in memory in runs of up to capacity records, spilled to
+     * temp files and streamed back through a k-way merge.
+     */
+    private static final class RunSorter {
+        private final Path dir;
+        private final int capacity;
+        private long[] keys;
+        private int[] values;
+        private long[] keyScratch;
+        private int[] valueScratch;
+        private final int[] count = new int[DIGIT_MASK + 2];
+        private final List<Path> runs = new ArrayList<>();
+        private final List<Integer> runSizes = new ArrayList<>();
+        private int size;
+        
+        RunSorter(Path dir, int capacity) {
+            this.dir = dir;
+            this.capacity = capacity;
+            this.keys = new long[capacity];
+            this.values = new int[capacity];
+            this.keyScratch = new long[capacity];
+            this.valueScratch = new int[capacity];
+        }
+        
+        void reset() throws IOException {
+            for (Path run : runs) {
+                Files.deleteIfExists(run);
+            }
+            runs.clear();
+            runSizes.clear();
+            size = 0;
+        }
+        
+        void add(long key, int value) throws IOException {
+            if (size == capacity) {
+                spill();
+            }
+            keys[size] = key;
+            values[size] = value;
+            size++;
+        }
+        
+        /**
+         * Streams all records to the consumer in key order.
+         */
+        void merge(RecordConsumer consumer) throws IOException {
+            if (runs.isEmpty()) {
+                // Everything fit in memory, no need to touch the disk
+                sortBuffer();
+                for (int i = 0; i < size; i++) {
+                    consumer.accept(keys[i], values[i]);
+                }
+                return;
+            }
+            if (size > 0) {
+                spill();
+            }
+            
+            PriorityQueue<RunReader> queue =
+                new PriorityQueue<>(Comparator.comparingLong((RunReader r) -> r.key));
+            List<RunReader> readers = new ArrayList<>();
+            try {
+                for (int i = 0; i < runs.size(); i++) {
+                    RunReader reader = new RunReader(runs.get(i), runSizes.get(i));
+                    readers.add(reader);
+                    if (reader.advance()) {
+                        queue.add(reader);
+                    }
+                }
+                while (!queue.isEmpty()) {
+                    RunReader reader = queue.poll();
+                    consumer.accept(reader.key, reader.value);
+                    if (reader.advance()) {
+                        queue.add(reader);
+                    }
+                }
+            } finally {
+                for (RunReader reader : readers) {
+                    reader.close();
+                }
+            }
+        }
+        
+        private void spill() throws IOException {
+            sortBuffer();
+            Path run = Files.createTempFile(dir, "run", ".bin");
+            try (DataOutputStream out = openOutput(run)) {
+                for (int i = 0; i < size; i++) {
+                    out.writeLong(keys[i]);
+                    out.writeInt(values[i]);
+                }
+            }
+            runs.add(run);
+            runSizes.add(size);
+            size = 0;
+        }
+        
+        /**
+         * LSD radix sort of the buffer by key, 16 bits per pass.
+         */
+        private void sortBuffer() {
+            long max = 0;
+            for (int i = 0; i < size; i++) {
+                max = Math.max(max, keys[i]);
+            }
+            
+            for (int shift = 0; shift < Long.SIZE && (max >>> shift) != 0; shift += DIGIT_BITS) {
+                Arrays.fill(count, 0);
+                for (int i = 0; i < size; i++) {
+                    count[(int) ((keys[i] >>> shift) & DIGIT_MASK) + 1]++;
+                }
+                for (int d = 0; d <= DIGIT_MASK; d++) {
+                    count[d + 1] += count[d];
+                }
+                for (int i = 0; i < size; i++) {
+                    int p = count[(int) ((keys[i] >>> shift) & DIGIT_MASK)]++;
+                    keyScratch[p] = keys[i];
+                    valueScratch[p] = values[i];
+                }
+                
+                long[] swapKeys = keys;
+                keys = keyScratch;
+                keyScratch = swapKeys;
+                int[] swapValues = values;
+                values = valueScratch;
+                valueScratch = swapValues;
+            }
+        }
+    }
+    
+    private static final class RunReader implements Closeable {
+        private final DataInputStream in;
+        private int remaining;
+        private long key;
+        private int value;
+        
+        RunReader(Path file, int count) throws IOException {
+            this.in = openInput(file);
+            this.remaining = count;
+        }
+        
+        boolean advance() throws IOException {
+            if (remaining == 0) {
+                return false;
+            }
+            key = in.readLong();
+            value = in.readInt();
+            remaining--;
+            return true;
+        }
+        
+        @Override
+        public void close() throws IOException {
+            in.close();
+        }
+    }
+}
@@ -0,0 +1,387 @@
+package com.stringalgo;
+
+import java.util.Arrays;
+import java.util.stream.IntStream;
+
+/**
+ * FM-index of Ferragina and Manzini (2000), derived from a built
+ * {@link SuffixArray} in one pass and independent of it afterwards.
+ * 
+ * Components:
+ * - BWT: the symbol preceding each suffix in suffix array order, with
+ *   code 0 for the end of text
+ * - C array: C[c] = number of BWT symbols smaller than c
+ * - Rank structure, whichever takes less room per row:
+ *   - occurrence samples: the BWT one byte per row, with counts
+ *     of every symbol in the BWT prefix before each multiple of the sample
+ *     rate; counts in between are completed by scanning at most
+ *     sampleRate - 1 BWT bytes. The counts are split in two levels: full
+ *     int counts at every superblock of up to 2^16 rows, and char counts
+ *     relative to the superblock at every sample
+ *   - a {@link WaveletMatrix} over the BWT, whose 1.5 ⌈log(σ+1)⌉ bits per
+ *     row replace both the byte BWT and the per-symbol counts that grow
+ *     with σ
+ *   The samples are used while the byte BWT and their counts, about
+ *   1 + 2(σ+1)/sampleRate bytes per row, take no more than the wavelet
+ *   matrix. The wavelet matrix stays under a byte per row up to 31
+ *   symbols, so small alphabets such as DNA, and at the default rate
+ *   every alphabet, use it; the samples pay off only for alphabets of
+ *   dozens to 255 symbols at sparse rates, such as ASCII text at rate
+ *   1024.
+ * - Suffix array samples: the entries of every text position divisible by
+ *   the locate sample rate s, with a bitmap marking their rows
+ * 
+ * Backward search processes the pattern from its last symbol, narrowing
+ * the row interval with two rank queries per symbol. Locating a row walks
+ * the LF-mapping, LF(i) = C[bwt[i]] + rank(bwt[i], i), which moves to the
+ * row of the suffix one position earlier in the text, until it reaches a
+ * sampled row; at most s - 1 steps are needed.
+ * 
+ * Neither the text nor the suffix array is kept, so with the default
+ * locate sample rate an index takes about n (1.5 ⌈log(σ+1)⌉/8 + 4/32 + 3/16)
+ * bytes with the wavelet matrix, or n (1 + 2(σ+1)/r + 4/32 + 3/16) with
+ * occurrence samples at rate r, against 5n or more for a text and its int
+ * suffix array.
+ * 
+ * Time Complexity: O(n) construction; per count O(m · sampleRate) worst
+ *                  case with occurrence samples, O(m log σ) with the
+ *                  wavelet matrix; per located occurrence s times the
+ *                  cost of one rank
+ * Space Complexity: n bytes plus 2(σ+1) bytes per sampleRate rows, or
+ *                   1.5 n ⌈log(σ+1)⌉ bits; plus 4 bytes per s rows
+ */
+public final class FMIndex {
+    
+    /** Default distance between occurrence count samples. */
+    public static final int DEFAULT_SAMPLE_RATE = 64;
+    
+    /** Default distance between sampled suffix array entries. */
+    public static final int DEFAULT_LOCATE_SAMPLE_RATE = 32;
+    
+    /** Largest alphabet stored one byte per BWT symbol. */
+    private static final int MAX_BYTE_SYMBOLS = 255;
+    
+    /** Rows per superblock, at most; relative counts then fit a char. */
+    private static final int SUPERBLOCK_ROWS = 1 << 16;
+    
+    private final int rows;
+    // Rows ahead of the suffix array's, 1 for the empty suffix after an
+    // appended '$'
+    private final int offset;
+    private final int sigma;
+    private final int sampleRate;
+    private final int superblockRate;
+    private final int[] alphabet;
+    private final int[] codeTable;
+    private final byte[] bwt;
+    private final int[] counts;
+    private final int[] superblockOcc;
+    private final char[] occ;
+    private final WaveletMatrix wavelet;
+    private final long[] sampledRows;
+    private final int[] sampledRank;
+    private final int[] samples;
+    
+    /**
+     * @param suffixArray a suffix array whose construction has run
+     */
+    public FMIndex(SuffixArray suffixArray) {
+        this(suffixArray, DEFAULT_SAMPLE_RATE);
+    }
+    
+    /**
+     * @param suffixArray a suffix array whose construction has run
+     * @param sampleRate rows between occurrence count samples; smaller
+     *        is faster and larger is smaller; unused by the wavelet matrix
+     */
+    public FMIndex(SuffixArray suffixArray, int sampleRate) {
+        this(suffixArray, sampleRate, DEFAULT_LOCATE_SAMPLE_RATE);
+    }
+    
+    /**
+     * @param suffixArray a suffix array whose construction has run
+     * @param sampleRate rows between occurrence count samples
+     * @param locateSampleRate text positions between suffix array samples;
+     *        1 keeps the whole suffix array, larger values trade locate
+     *        time for memory
+     */
+    public FMIndex(SuffixArray suffixArray, int sampleRate, int locateSampleRate) {
+        if (sampleRate < 1) {
+            throw new IllegalArgumentException("Sample rate must be positive: " + sampleRate);
+        }
+        if (locateSampleRate < 1) {
+            throw new IllegalArgumentException(
+                "Locate sample rate must be positive: " + locateSampleRate);
+        }
+        SymbolText text = suffixArray.symbols();
+        int[] sa = suffixArray.getSuffixArray();
+        int length = text.length();
+        
+        // Rows are the suffixes plus the empty one, which an appended '$'
+        // leaves out of the suffix array
+        this.rows = length + 1;
+        this.offset = rows - sa.length;
+        this.sampleRate = sampleRate;
+        
+        // Step 1: Number the symbols, in order, from the first symbols of
+        // the sorted suffixes
+        int[] symbols = new int[16];
+        int distinct = 0;
+        for (int start : sa) {
+            if (start < length) {
+                int c = text.symbolAt(start);
+                if (distinct == 0 || symbols[distinct - 1] != c) {
+                    if (distinct == symbols.length) {
+                        symbols = Arrays.copyOf(symbols, distinct * 2);
+                    }
+                    symbols[distinct++] = c;
+                }
+            }
+        }
+        this.alphabet = Arrays.copyOf(symbols, distinct);
+        this.sigma = distinct + 1;
+        int upper = (distinct == 0) ? 0 : alphabet[distinct - 1];
+        this.codeTable = (upper <= 0xFF) ? new int[upper + 1] : null;
+        if (codeTable != null) {
+            Arrays.fill(codeTable, -1);
+            for (int c = 0; c < distinct; c++) {
+                codeTable[alphabet[c]] = c + 1;
+            }
+        }
+        
+        // Step 2: BWT in one pass over the suffix array, with occurrence
+        // samples, symbol totals and suffix array samples along the way
+        boolean bytes = !useWaveletMatrix(sigma, sampleRate);
+        int[] codes = bytes ? null : new int[rows];
+        this.bwt = bytes ? new byte[rows] : null;
+        this.superblockRate = superblockRate(sampleRate);
+        this.superblockOcc = bytes ? new int[(rows / superblockRate + 1) * sigma] : null;
+        this.occ = bytes ? new char[(rows / sampleRate + 1) * sigma] : null;
+        this.sampledRows = new long[(rows + 63) >>> 6];
+        this.samples = new int[length / locateSampleRate + 1];
+        int[] running = new int[sigma];
+        int[] superblockBase = new int[sigma];
+        int sampleCount = 0;
+        for (int i = 0; i < rows; i++) {
+            int start = (i < offset) ? length : sa[i - offset];
+            int code = (start == 0) ? 0 : code(text.symbolAt(start - 1));
+            if (bytes) {
+                if (i % sampleRate == 0) {
+                    sampleOccurrences(i, running, superblockBase);
+                }
+                bwt[i] = (byte) code;
+            } else {
+                codes[i] = code;
+            }
+            running[code]++;
+            if (start % locateSampleRate == 0) {
+                sampledRows[i >>> 6] |= 1L << i;
+                samples[sampleCount++] = start;
+            }
+        }
+        if (bytes && rows % sampleRate == 0) {
+            sampleOccurrences(rows, running, superblockBase);
+        }
+        this.wavelet = bytes ? null : new WaveletMatrix(codes, sigma);
+        
+        // Step 3: C array from the symbol totals
+        this.counts = new int[sigma + 1];
+        for (int c = 0; c < sigma; c++) {
+            counts[c + 1] = counts[c] + running[c];
+        }
+        
+        // Step 4: Sampled rows before each bitmap word
+        this.sampledRank = new int[sampledRows.length];
+        for (int w = 1; w < sampledRows.length; w++) {
+            sampledRank[w] = sampledRank[w - 1] + Long.bitCount(sampledRows[w - 1]);
+        }
+    }
+    
+    private static int superblockRate(int sampleRate) {
+        return sampleRate * Math.max(1, SUPERBLOCK_ROWS / sampleRate);
+    }
+    
+    /**
+     * Compares the estimated bytes per row of the byte BWT and its
+     * occurrence counts with those of a wavelet matrix over the same codes,
+     * which replaces both.
+     * 
+     * @param sigma the number of codes, the end of text included
+     * @return whether the wavelet matrix is the smaller rank structure or
+     *         the codes do not fit a byte
+     */
+    static boolean useWaveletMatrix(int sigma, int sampleRate) {
+        if (sigma - 1 > MAX_BYTE_SYMBOLS) {
+            return true;
+        }
+        int levels = Math.max(1, 32 - Integer.numberOfLeadingZeros(sigma - 1));
+        double countBytes = 1 + 2.0 * sigma / sampleRate
+            + 4.0 * sigma / superblockRate(sampleRate);
+        double waveletBytes = 1.5 * levels / Byte.SIZE;
+        return countBytes > waveletBytes;
+    }
+    
+    /**
+     * Stores the counts of every code in bwt[0, i) for a row i at a
+     * multiple of the sample rate, starting a superblock where due.
+     */
+    private void sampleOccurrences(int i, int[] running, int[] superblockBase) {
+        if (i % superblockRate == 0) {
+            System.arraycopy(running, 0, superblockOcc, (i / superblockRate) * sigma, sigma);
+            System.arraycopy(running, 0, superblockBase, 0, sigma);
+        }
+        int base = (i / sampleRate) * sigma;
+        for (int c = 0; c < sigma; c++) {
+            occ[base + c] = (char) (running[c] - superblockBase[c]);
+        }
+    }
+    
+    /**
+     * @return the code 1..σ of a symbol of the text, or -1 if it does not
+     *         occur
+     */
+    private int code(int symbol) {
+        if (codeTable != null) {
+            return (symbol >= 0 && symbol < codeTable.length) ? codeTable[symbol] : -1;
+        }
+        int index = Arrays.binarySearch(alphabet, symbol);
+        return index < 0 ? -1 : index + 1;
+    }
+    
+    /**
+     * @return the number of times code c occurs in bwt[0, i)
+     */
+    int rank(int c, int i) {
+        if (wavelet != null) {
+            return wavelet.rank(c, i);
+        }
+        int block = i / sampleRate;
+        int result = superblockOcc[(i / superblockRate) * sigma + c] + occ[block * sigma + c];
+        for (int k = block * sampleRate; k < i; k++) {
+            if ((bwt[k] & 0xFF) == c) {
+                result++;
+            }
+        }
+        return result;
+    }
+    
+    /**
+     * @return the code of bwt[i]
+     */
+    private int bwtAt(int i) {
+        return (wavelet != null) ? wavelet.access(i) : bwt[i] & 0xFF;
+    }
+    
+    /**
+     * Counts the occurrences of a pattern with backward search.
+     * 
+     * Time Complexity: O(m) for a constant sample rate, O(m log σ) over a
+     *                  large alphabet
+     * 
+     * @param pattern the pattern to count
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(String pattern) {
+        int[] range = backwardSearch(SymbolText.of(pattern));
+        return range[1] - range[0];
+    }
+    
+    /**
+     * @param pattern the symbols to count
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(int[] pattern) {
+        int[] range = backwardSearch(SymbolText.of(pattern, Integer.MAX_VALUE));
+        return range[1] - range[0];
+    }
+    
+    /**
+     * @return {lo, hi}, the half-open row interval of the suffixes starting
+     *         with the pattern; empty if it does not occur. The empty
+     *         pattern matches the rows of the suffix array's suffixes, as
+     *         in {@link SuffixArray#findRange(String)}.
+     */
+    int[] backwardSearch(SymbolText pattern) {
+        if (pattern.length() == 0) {
+            return new int[] {offset, rows};
+        }
+        int lo = 0, hi = rows;
+        for (int k = pattern.length() - 1; k >= 0 && lo < hi; k--) {
+            int c = code(pattern.symbolAt(k));
+            if (c < 0) {
+                return new int[] {0, 0};
+            }
+            lo = counts[c] + rank(c, lo);
+            hi = counts[c] + rank(c, hi);
+        }
+        return lo < hi ? new int[] {lo, hi} : new int[] {0, 0};
+    }
+    
+    /**
+     * Streams the start position of every occurrence of a pattern. Positions
+     * come in suffix array order, not text order.
+     * 
+     * Time Complexity: O(m + occ · s) for a constant sample rate
+     * 
+     * @param pattern the pattern to locate
+     * @return the positions of all occurrences
+     */
+    public IntStream locateAll(String pattern) {
+        int[] range = backwardSearch(SymbolText.of(pattern));
+        return IntStream.range(range[0], range[1]).map(this::locate);
+    }
+    
+    /**
+     * @param pattern the symbols to locate
+     * @return the positions of all occurrences, in suffix array order
+     */
+    public IntStream locateAll(int[] pattern) {
+        int[] range = backwardSearch(SymbolText.of(pattern, Integer.MAX_VALUE));
+        return IntStream.range(range[0], range[1]).map(this::locate);
+    }
+    
+    /**
+     * Recovers the suffix array entry of a row by LF-mapping back to the
+     * nearest sampled text position.
+     * 
+     * @return the start position of the suffix at the row
+     */
+    int locate(int row) {
+        int steps = 0;
+        while ((sampledRows[row >>> 6] & (1L << row)) == 0) {
+            int c = bwtAt(row);
+            row = counts[c] + rank(c, row);
+            steps++;
+        }
+        int index = sampledRank[row >>> 6]
+            + Long.bitCount(sampledRows[row >>> 6] & ((1L << row) - 1));
+        return samples[index] + steps;
+    }
+    
+    /**
+     * @return whether ranks are answered by a wavelet matrix rather than
+     *         by occurrence samples
+     */
+    boolean usesWaveletMatrix() {
+        return wavelet != null;
+    }
+    
+    /**
+     * @return the number of rows, the text length plus one
+     */
+    public int size() {
+        return rows;
+    }
+    
+    /**
+     * @return the approximate heap footprint of the index in bytes
+     */
+    public long memoryBytes() {
+        long rankBytes = (wavelet != null)
+            ? wavelet.memoryBytes()
+            : bwt.length + 4L * superblockOcc.length + 2L * occ.length;
+        return rankBytes + 8L * sampledRows.length
+            + 4L * (counts.length + alphabet.length + sampledRank.length
+                    + samples.length + (codeTable != null ? codeTable.length : 0));
+    }
+}
@@ -0,0 +1,191 @@
+package com.stringalgo;
+
+import java.util.Arrays;
+import java.util.List;
+
+/**
+ * Generalized suffix array: one suffix array and one LCP array over a
+ * whole collection of documents, instead of one index object per document.
+ * 
+ * The documents are concatenated into a single integer text, each one
+ * followed by its own separator. Document d's separator is the symbol d,
+ * and a character c becomes the symbol D + c for D documents, so every
+ * separator is unique and smaller than every character. No common prefix
+ * can then run across a document boundary, and the suffix array and LCP
+ * array of the concatenation are those of the collection.
+ * 
+ * A document array records, for every suffix array index, the document its
+ * suffix starts in, so each hit maps back to (document, offset) in O(1).
+ * Suffixes starting at a separator belong to the document it ends, at an
+ * offset equal to the document's length.
+ * 
+ * Time Complexity: O(N) construction for N characters in total
+ * Space Complexity: O(N), four int arrays over the concatenation
+ */
+public final class GeneralizedSuffixArray {
+    
+    private final int documentCount;
+    private final int[] tokens;
+    private final int[] starts;
+    private final SuffixArray suffixArray;
+    private final int[] documentArray;
+    
+    /**
+     * Builds the index with SA-IS.
+     * 
+     * @param documents the documents to index, at least one; they may be empty
+     */
+    public GeneralizedSuffixArray(List<String> documents) {
+        this(documents, SuffixArray.Algorithm.SA_IS);
+    }
+    
+    /**
+     * @param documents the documents to index, at least one; they may be empty
+     * @param algorithm the suffix array construction algorithm
+     */
+    public GeneralizedSuffixArray(List<String> documents, SuffixArray.Algorithm algorithm) {
+        if (documents.isEmpty()) {
+            throw new IllegalArgumentException("No documents to index");
+        }
+        this.documentCount = documents.size();
+        
+        // Step 1: Concatenate the documents, each followed by its separator
+        this.starts = new int[documentCount + 1];
+        long total = 0;
+        for (int d = 0; d < documentCount; d++) {
+            total += documents.get(d).length() + 1;
+        }
+        if (total >= Integer.MAX_VALUE) {
+            throw new IllegalArgumentException("Collection too large: " + total + " symbols");
+        }
+        this.tokens = new int[(int) total];
+        int position = 0;
+        for (int d = 0; d < documentCount; d++) {
+            String document = documents.get(d);
+            starts[d] = position;
+            for (int i = 0; i < document.length(); i++) {
+                tokens[position++] = documentCount + document.charAt(i);
+            }
+            tokens[position++] = d;
+        }
+        starts[documentCount] = position;
+        
+        // Step 2: One suffix array and one LCP array for the collection;
+        // the LCP array takes over the inverse suffix array's memory
+        this.suffixArray = new SuffixArray(tokens);
+        suffixArray.buildSuffixArray(algorithm);
+        suffixArray.buildLCP(SuffixArray.LCPAlgorithm.PHI_IN_PLACE);
+        
+        // Step 3: Document array, through the document of every position;
+        // the empty suffix at the end belongs to none
+        int[] sa = suffixArray.getSuffixArray();
+        int[] documentOf = new int[sa.length];
+        for (int d = 0; d < documentCount; d++) {
+            Arrays.fill(documentOf, starts[d], starts[d + 1], d);
+        }
+        documentOf[tokens.length] = -1;
+        this.documentArray = new int[sa.length];
+        for (int i = 0; i < sa.length; i++) {
+            documentArray[i] = documentOf[sa[i]];
+        }
+    }
+    
+    /**
+     * @return the pattern as symbols of the concatenation
+     */
+    private int[] encode(String pattern) {
+        int[] symbols = new int[pattern.length()];
+        for (int i = 0; i < symbols.length; i++) {
+            symbols[i] = documentCount + pattern.charAt(i);
+        }
+        return symbols;
+    }
+    
+    /**
+     * Finds the suffix array interval of the occurrences of a pattern in
+     * any document.
+     * 
+     * Time Complexity: O(m log N)
+     * 
+     * @param pattern the pattern to search
+     * @return {lo, hi}, the half-open interval of matching SA indices
+     */
+    public int[] findRange(String pattern) {
+        return suffixArray.findRange(encode(pattern));
+    }
+    
+    /**
+     * @param pattern the pattern to count
+     * @return the number of occurrences over all documents
+     */
+    public int count(String pattern) {
+        int[] range = findRange(pattern);
+        return range[1] - range[0];
+    }
+    
+    /**
+     * @param index a suffix array index
+     * @return the document the suffix starts in, or -1 for the empty suffix
+     */
+    public int documentOf(int index) {
+        return documentArray[index];
+    }
+    
+    /**
+     * @param index a suffix array index
+     * @return the suffix's start within its document, or -1 for the empty
+     *         suffix
+     */
+    public int offsetOf(int index) {
+        int document = documentArray[index];
+        return document < 0 ? -1 : suffixArray.getSuffixArray()[index] - starts[document];
+    }
+    
+    /**
+     * @return the number of documents
+     */
+    public int documentCount() {
+        return documentCount;
+    }
+    
+    /**
+     * @param document a document number
+     * @return the document's text
+     */
+    public String getDocument(int document) {
+        StringBuilder sb = new StringBuilder(starts[document + 1] - starts[document] - 1);
+        for (int i = starts[document]; i < starts[document + 1] - 1; i++) {
+            sb.append((char) (tokens[i] - documentCount));
+        }
+        return sb.toString();
+    }
+    
+    /**
+     * @return the underlying index over the concatenation
+     */
+    SuffixArray suffixArray() {
+        return suffixArray;
+    }
+    
+    /**
+     * @return the suffix array of the concatenation, separators included
+     */
+    public int[] getSuffixArray() {
+        return suffixArray.getSuffixArray();
+    }
+    
+    /**
+     * @return the LCP array of the concatenation
+     */
+    public int[] getLCP() {
+        return suffixArray.getLCP();
+    }
+    
+    /**
+     * @return the document of each suffix array index, -1 for the empty
+     *         suffix
+     */
+    public int[] getDocumentArray() {
+        return documentArray;
+    }
+}
@@ -0,0 +1,160 @@
+package com.stringalgo;
+
+import java.util.Arrays;
+
+/**
+ * Lookup table from every k-symbol prefix to its suffix array interval.
+ * 
+ * Symbols that occur in the text are numbered 1..σ in sorted order, and
+ * 0 stands for end of text, so every suffix has a k-symbol code in base
+ * σ+1, padded with 0 when it is shorter than k. Codes never decrease
+ * along the suffix array, and bucket[v] holds the first SA index whose
+ * code is at least v. A pattern of at most k symbols then maps to its
+ * exact interval with two lookups, and a longer one to the interval of
+ * its first k symbols, where the binary search can start.
+ * 
+ * Time Complexity: O(n k log σ + (σ+1)^k) construction, O(k log σ) lookup
+ * Space Complexity: O((σ+1)^k) ints
+ */
+final class KmerTable {
+    
+    private final int k;
+    private final int[] alphabet;
+    private final int[] power;
+    private final int[] bucket;
+    
+    private KmerTable(SymbolText text, int[] sa, int k, int[] alphabet) {
+        this.k = k;
+        this.alphabet = alphabet;
+        this.power = new int[k + 1];
+        power[0] = 1;
+        for (int i = 1; i <= k; i++) {
+            power[i] = power[i - 1] * (alphabet.length + 1);
+        }
+        
+        // Codes grow along the suffix array, so one merge-like pass fills
+        // every bucket start
+        int size = power[k];
+        this.bucket = new int[size + 1];
+        int v = 0;
+        for (int i = 0; i < sa.length; i++) {
+            int code = code(text, sa[i]);
+            while (v <= code) {
+                bucket[v++] = i;
+            }
+        }
+        while (v <= size) {
+            bucket[v++] = sa.length;
+        }
+    }
+    
+    /**
+     * Builds the table for the largest k up to maxK whose buckets fit in
+     * maxBytes.
+     * 
+     * @param text the stored symbols, without a virtual sentinel
+     * @param sa the suffix array of the text
+     * @param maxK the largest prefix length to index, at least 1
+     * @param maxBytes memory budget for the bucket array
+     * @return the table
+     * @throws IllegalArgumentException if not even k = 1 fits
+     */
+    static KmerTable build(SymbolText text, int[] sa, int maxK, long maxBytes) {
+        if (maxK < 1) {
+            throw new IllegalArgumentException("Prefix length must be positive: " + maxK);
+        }
+        int[] alphabet = alphabet(text, sa);
+        
+        int k = 0;
+        long entries = 1;
+        while (k < maxK) {
+            long next = entries * (alphabet.length + 1);
+            if (next >= Integer.MAX_VALUE || (next + 1) * Integer.BYTES > maxBytes) {
+                break;
+            }
+            entries = next;
+            k++;
+        }
+        if (k == 0) {
+            throw new IllegalArgumentException("Memory budget of " + maxBytes +
+                                               " bytes is too small for a 1-mer table");
+        }
+        return new KmerTable(text, sa, k, alphabet);
+    }
+    
+    /**
+     * Collects the distinct symbols in sorted order from the first symbols
+     * of the suffixes, which the suffix array already lists sorted.
+     */
+    private static int[] alphabet(SymbolText text, int[] sa) {
+        int length = text.length();
+        int[] symbols = new int[16];
+        int count = 0;
+        for (int start : sa) {
+            if (start >= length) {
+                continue;
+            }
+            int c = text.symbolAt(start);
+            if (count == 0 || symbols[count - 1] != c) {
+                if (count == symbols.length) {
+                    symbols = Arrays.copyOf(symbols, count * 2);
+                }
+                symbols[count++] = c;
+            }
+        }
+        return Arrays.copyOf(symbols, count);
+    }
+    
+    private int code(SymbolText text, int start) {
+        int length = text.length();
+        int code = 0;
+        for (int i = 0; i < k; i++) {
+            int digit = (start + i < length)
+                ? Arrays.binarySearch(alphabet, text.symbolAt(start + i)) + 1
+                : 0;
+            code = code * (alphabet.length + 1) + digit;
+        }
+        return code;
+    }
+    
+    /**
+     * @return the number of indexed prefix symbols
+     */
+    int k() {
+        return k;
+    }
+    
+    /**
+     * @return the first SA index of the suffixes starting with the first
+     *         min(m, k) symbols of the pattern, or -1 if one of them does
+     *         not occur in the text
+     */
+    int lower(String pattern) {
+        int m = Math.min(pattern.length(), k);
+        int code = prefixCode(pattern, m);
+        return code < 0 ? -1 : bucket[code * power[k - m]];
+    }
+    
+    /**
+     * @return the SA index after the last suffix starting with the first
+     *         min(m, k) symbols of the pattern, or -1 if one of them does
+     *         not occur in the text
+     */
+    int upper(String pattern) {
+        int m = Math.min(pattern.length(), k);
+        int code = prefixCode(pattern, m);
+        return code < 0 ? -1 : bucket[(code + 1) * power[k - m]];
+    }
+    
+    private int prefixCode(String pattern, int m) {
+        int code = 0;
+        for (int i = 0; i < m; i++) {
+            int digit = Arrays.binarySearch(alphabet, pattern.charAt(i));
+            if (digit < 0) {
+                return -1;
+            }
+            code = code * (alphabet.length + 1) + digit + 1;
+        }
+        return code;
+    }
+}
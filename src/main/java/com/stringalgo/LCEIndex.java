@@ -0,0 +1,77 @@
+package com.stringalgo;
+
+/**
+ * Longest common extension queries: the length of the longest common
+ * prefix of any two suffixes, in constant time.
+ * 
+ * The LCP of suffixes i and j is the minimum of the LCP array between
+ * their ranks, so the index keeps the inverse suffix array and a range
+ * minimum structure over the LCP array. The text is never rescanned.
+ * 
+ * Time Complexity: O(n) construction, O(1) per query
+ * Space Complexity: O(n), the inverse suffix array plus about 2 words per
+ *                   suffix for the range minimum structure
+ */
+public final class LCEIndex {
+    
+    private final int length;
+    private final int[] rank;
+    private final RangeMinimum rmq;
+    
+    /**
+     * Indexes a suffix array, building its LCP array first if needed.
+     * 
+     * @param suffixArray a suffix array whose construction has run
+     */
+    public LCEIndex(SuffixArray suffixArray) {
+        if (suffixArray.getLCPArray() == null) {
+            suffixArray.buildLCP();
+        }
+        int[] sa = suffixArray.getSuffixArray();
+        LCPArray lcp = suffixArray.getLCPArray();
+        
+        this.length = suffixArray.symbols().length();
+        this.rank = new int[sa.length];
+        for (int i = 0; i < sa.length; i++) {
+            rank[sa[i]] = i;
+        }
+        this.rmq = new RangeMinimum(lcp::get, lcp.length());
+    }
+    
+    /**
+     * Returns the length of the longest common prefix of the suffixes
+     * starting at text positions i and j.
+     * 
+     * @param i first suffix position
+     * @param j second suffix position
+     * @return the longest common extension of i and j
+     */
+    public int lce(int i, int j) {
+        if (i == j) {
+            return Math.max(0, length - i);
+        }
+        int a = rank[i];
+        int b = rank[j];
+        return (a < b) ? rmq.min(a + 1, b) : rmq.min(b + 1, a);
+    }
+    
+    /**
+     * Answers a batch of queries, the k-th one for the pair (first[k],
+     * second[k]).
+     * 
+     * @param first first suffix position of each query
+     * @param second second suffix position of each query
+     * @return the longest common extension of each pair
+     */
+    public int[] lce(int[] first, int[] second) {
+        if (first.length != second.length) {
+            throw new IllegalArgumentException("Query arrays differ in length: " +
+                                               first.length + " and " + second.length);
+        }
+        int[] result = new int[first.length];
+        for (int k = 0; k < first.length; k++) {
+            result[k] = lce(first[k], second[k]);
+        }
+        return result;
+    }
+}
@@ -0,0 +1,44 @@
+package com.stringalgo;
+
+/**
+ * Read-only view of an LCP array, independent of how the values are
+ * stored.
+ * 
+ * Entry i is the length of the longest common prefix of the suffixes at
+ * positions i-1 and i of the suffix array; entry 0 is 0.
+ * 
+ * @see CompactLCPArray
+ */
+public interface LCPArray {
+    
+    /**
+     * @return the number of entries, equal to the suffix array length
+     */
+    int length();
+    
+    /**
+     * @param i index in suffix array order
+     * @return the LCP value at index i
+     */
+    int get(int i);
+    
+    /**
+     * Wraps a plain int array without copying it.
+     * 
+     * @param lcp the LCP values
+     * @return a view of the array
+     */
+    static LCPArray of(int[] lcp) {
+        return new LCPArray() {
+            @Override
+            public int length() {
+                return lcp.length;
+            }
+            
+            @Override
+            public int get(int i) {
+                return lcp[i];
+            }
+        };
+    }
+}
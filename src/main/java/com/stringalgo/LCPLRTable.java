@@ -0,0 +1,61 @@
+package com.stringalgo;
+
+/**
+ * Precomputed LCP-LR values for the suffix array search of Manber and
+ * Myers (1993).
+ * 
+ * Binary search over (-1, n) with midpoints (lo + hi) >>> 1 visits a
+ * fixed tree of intervals, and every index is the midpoint of exactly one
+ * of them. For that interval (lo, hi) the table keeps the LCP of the
+ * suffixes at lo and mid and of those at mid and hi, each the minimum of
+ * the LCP array over the range. Entries that involve a virtual endpoint
+ * -1 or n are 0 and never consulted.
+ * 
+ * Time Complexity: O(n) construction
+ * Space Complexity: O(n), two int arrays
+ */
+final class LCPLRTable {
+    
+    private final int n;
+    private final int[] left;
+    private final int[] right;
+    
+    /**
+     * @param lcp the LCP array of the suffix array being searched
+     */
+    LCPLRTable(LCPArray lcp) {
+        this.n = lcp.length();
+        this.left = new int[n];
+        this.right = new int[n];
+        fill(lcp, -1, n);
+    }
+    
+    /**
+     * Fills the entries of all midpoints inside (lo, hi).
+     * 
+     * @return the LCP of the suffixes at lo and hi
+     */
+    private int fill(LCPArray lcp, int lo, int hi) {
+        if (hi - lo == 1) {
+            return (lo < 0 || hi >= n) ? 0 : lcp.get(hi);
+        }
+        int mid = (lo + hi) >>> 1;
+        left[mid] = fill(lcp, lo, mid);
+        right[mid] = fill(lcp, mid, hi);
+        return Math.min(left[mid], right[mid]);
+    }
+    
+    /**
+     * @return the LCP of mid and the lower end of its search interval
+     */
+    int left(int mid) {
+        return left[mid];
+    }
+    
+    /**
+     * @return the LCP of mid and the upper end of its search interval
+     */
+    int right(int mid) {
+        return right[mid];
+    }
+}
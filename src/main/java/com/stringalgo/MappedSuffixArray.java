@@ -0,0 +1,519 @@
+package com.stringalgo;
+
+import java.io.Closeable;
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.channels.FileChannel;
+import java.nio.file.Path;
+import java.nio.file.StandardOpenOption;
+import java.util.function.IntUnaryOperator;
+import java.util.stream.IntStream;
+
+/**
+ * Versioned on-disk index file holding a text, its suffix array and
+ * optionally its LCP array, queried in place through memory mapping.
+ * 
+ * {@link #write(SuffixArray, Path)} saves a built {@link SuffixArray}.
+ * Opening a file reads only the header and maps each section with
+ * {@link FileChannel#map}, so startup takes constant time whatever the
+ * index size; searches then read the mapped pages directly, and the
+ * operating system shares them between processes that map the same file.
+ * 
+ * File layout, all values little-endian:
+ * 
+ *   offset  size  field
+ *   0       4     magic "SAIX" (0x53414958)
+ *   4       4     format version
+ *   8       4     symbol width in bytes: 1, 2 or 4
+ *   12      4     alphabet size
+ *   16      4     text length, in symbols
+ *   20      4     suffix array length: text length + 1 with a virtual sentinel
+ *   24      4     section count k
+ *   28      4     reserved, 0
+ *   32      24 k  section table: id (4), reserved (4), offset (8), length (8)
+ * 
+ * Sections start at multiples of 8 bytes. Section ids are 1 for the text,
+ * 2 for the suffix array and 3 for the LCP array. The text and suffix
+ * array are required; sections with unknown ids are skipped, so later
+ * versions can add auxiliary tables that older readers ignore. Sections
+ * are mapped in windows of 1 GiB, since a single mapping is limited to
+ * 2 GB, so the suffix array and LCP sections can hold every suffix of a
+ * text of up to Integer.MAX_VALUE symbols.
+ * 
+ * Instances are safe for concurrent queries.
+ * 
+ * Time Complexity: O(1) open, O(m log n) per search
+ * Space Complexity: O(1) heap; the file is paged in on demand
+ */
+public final class MappedSuffixArray implements Closeable {
+    
+    /** Current format version; files of a newer version are rejected. */
+    public static final int VERSION = 1;
+    
+    static final int MAGIC = 0x53414958;
+    static final int SECTION_TEXT = 1;
+    static final int SECTION_SUFFIX_ARRAY = 2;
+    static final int SECTION_LCP = 3;
+    
+    private static final int HEADER_BYTES = 32;
+    private static final int SECTION_ENTRY_BYTES = 24;
+    private static final int WRITE_BUFFER_BYTES = 1 << 16;
+    
+    /** Bytes per mapped window; a multiple of every value width. */
+    static final int CHUNK_BYTES = 1 << 30;
+    
+    /**
+     * A file section mapped as consecutive windows of chunkBytes bytes.
+     * Values are aligned to their width within the section, so none spans
+     * two windows.
+     */
+    private static final class Section {
+        final ByteBuffer[] chunks;
+        final int chunkShift;
+        final int chunkMask;
+        
+        Section(ByteBuffer[] chunks, int chunkBytes) {
+            this.chunks = chunks;
+            this.chunkShift = Integer.numberOfTrailingZeros(chunkBytes);
+            this.chunkMask = chunkBytes - 1;
+        }
+        
+        int getInt(long position) {
+            return chunks[(int) (position >>> chunkShift)].getInt((int) (position & chunkMask));
+        }
+        
+        int getChar(long position) {
+            return chunks[(int) (position >>> chunkShift)].getChar((int) (position & chunkMask));
+        }
+        
+        int getUnsignedByte(long position) {
+            return chunks[(int) (position >>> chunkShift)].get((int) (position & chunkMask)) & 0xFF;
+        }
+    }
+    
+    private final FileChannel channel;
+    private final int size;
+    private final int chunkBytes;
+    private final SymbolText text;
+    private final Section suffixArray;
+    private final Section lcp;
+    
+    /**
+     * Opens and maps an index file.
+     * 
+     * @param file a file written by {@link #write(SuffixArray, Path)}
+     * @throws IOException if the file cannot be read, is not an index
+     *         file, has a newer version or is inconsistent
+     */
+    public MappedSuffixArray(Path file) throws IOException {
+        this(file, CHUNK_BYTES);
+    }
+    
+    /**
+     * @param chunkBytes bytes per mapped window, a power of two of at
+     *        least 4
+     */
+    MappedSuffixArray(Path file, int chunkBytes) throws IOException {
+        if (chunkBytes < Integer.BYTES || Integer.bitCount(chunkBytes) != 1) {
+            throw new IllegalArgumentException("Invalid chunk size: " + chunkBytes);
+        }
+        this.chunkBytes = chunkBytes;
+        this.channel = FileChannel.open(file, StandardOpenOption.READ);
+        try {
+            long fileSize = channel.size();
+            
+            // Step 1: Header
+            ByteBuffer header = read(0, HEADER_BYTES, fileSize, file);
+            if (header.getInt(0) != MAGIC) {
+                throw new IOException("Not a suffix array index file: " + file);
+            }
+            int version = header.getInt(4);
+            if (version < 1 || version > VERSION) {
+                throw new IOException("Unsupported index file version " + version + ": " + file);
+            }
+            int width = header.getInt(8);
+            int alphabetSize = header.getInt(12);
+            int textLength = header.getInt(16);
+            this.size = header.getInt(20);
+            int sections = header.getInt(24);
+            if ((width != 1 && width != 2 && width != 4) || textLength < 0 ||
+                (size != textLength && size != textLength + 1) || sections < 0) {
+                throw new IOException("Corrupt index file header: " + file);
+            }
+            
+            // Step 2: Map the known sections, checking their sizes
+            ByteBuffer table = read(HEADER_BYTES, (long) sections * SECTION_ENTRY_BYTES,
+                                    fileSize, file);
+            Section textSection = null;
+            Section saSection = null;
+            Section lcpSection = null;
+            for (int s = 0; s < sections; s++) {
+                int id = table.getInt(s * SECTION_ENTRY_BYTES);
+                long offset = table.getLong(s * SECTION_ENTRY_BYTES + 8);
+                long length = table.getLong(s * SECTION_ENTRY_BYTES + 16);
+                switch (id) {
+                    case SECTION_TEXT:
+                        checkLength(length, (long) textLength * width, "text", file);
+                        textSection = map(offset, length, fileSize, file);
+                        break;
+                    case SECTION_SUFFIX_ARRAY:
+                        checkLength(length, (long) size * Integer.BYTES, "suffix array", file);
+                        saSection = map(offset, length, fileSize, file);
+                        break;
+                    case SECTION_LCP:
+                        checkLength(length, (long) size * Integer.BYTES, "LCP", file);
+                        lcpSection = map(offset, length, fileSize, file);
+                        break;
+                    default:
+                        // Written by a later version, not needed here
+                        break;
+                }
+            }
+            if (textSection == null || saSection == null) {
+                throw new IOException("Index file lacks its text or suffix array: " + file);
+            }
+            
+            // Step 3: Symbol view of the text
+            this.text = symbolView(textSection, textLength, width, alphabetSize);
+            this.suffixArray = saSection;
+            this.lcp = lcpSection;
+        } catch (IOException | RuntimeException e) {
+            channel.close();
+            throw e;
+        }
+    }
+    
+    private static void checkLength(long actual, long expected, String section, Path file)
+            throws IOException {
+        if (actual != expected) {
+            throw new IOException("Index file " + section + " section has " + actual +
+                                  " bytes instead of " + expected + ": " + file);
+        }
+    }
+    
+    /**
+     * Reads a small region of the file into a heap buffer.
+     */
+    private ByteBuffer read(long offset, long length, long fileSize, Path file)
+            throws IOException {
+        if (length > fileSize - offset) {
+            throw new IOException("Index file is truncated: " + file);
+        }
+        ByteBuffer buffer = ByteBuffer.allocate((int) length).order(ByteOrder.LITTLE_ENDIAN);
+        while (buffer.hasRemaining()) {
+            if (channel.read(buffer, offset + buffer.position()) < 0) {
+                throw new IOException("Index file is truncated: " + file);
+            }
+        }
+        return buffer;
+    }
+    
+    /**
+     * Maps a section as windows of chunkBytes bytes; the last one may be
+     * shorter.
+     */
+    private Section map(long offset, long length, long fileSize, Path file)
+            throws IOException {
+        if (offset < 0 || length < 0 || offset > fileSize - length) {
+            throw new IOException("Index file section out of bounds: " + file);
+        }
+        int count = (int) ((length + chunkBytes - 1) / chunkBytes);
+        ByteBuffer[] chunks = new ByteBuffer[count];
+        for (int c = 0; c < count; c++) {
+            long start = (long) c * chunkBytes;
+            long chunkLength = Math.min(chunkBytes, length - start);
+            chunks[c] = channel.map(FileChannel.MapMode.READ_ONLY, offset + start, chunkLength)
+                .order(ByteOrder.LITTLE_ENDIAN);
+        }
+        return new Section(chunks, chunkBytes);
+    }
+    
+    private static SymbolText symbolView(Section section, int length, int width,
+                                         int alphabetSize) {
+        return new SymbolText() {
+            @Override
+            public int length() {
+                return length;
+            }
+            
+            @Override
+            public int symbolAt(int i) {
+                if (width == 1) {
+                    return section.getUnsignedByte(i);
+                }
+                if (width == 2) {
+                    return section.getChar(2L * i);
+                }
+                return section.getInt(4L * i);
+            }
+            
+            @Override
+            public int alphabetSize() {
+                return alphabetSize;
+            }
+        };
+    }
+    
+    /**
+     * Saves a suffix array, with its text and, when built, its LCP array.
+     * Symbols are stored in the narrowest of 1, 2 or 4 bytes that holds
+     * the alphabet.
+     * 
+     * @param suffixArray a suffix array whose construction has run
+     * @param file the file to create or replace
+     * @throws IOException if writing fails
+     */
+    public static void write(SuffixArray suffixArray, Path file) throws IOException {
+        SymbolText symbols = suffixArray.symbols();
+        int[] sa = suffixArray.getSuffixArray();
+        LCPArray lcpArray = suffixArray.getLCPArray();
+        int alphabetSize = symbols.alphabetSize();
+        int width = alphabetSize <= 1 << Byte.SIZE ? 1
+            : alphabetSize <= Character.MAX_VALUE + 1 ? 2 : 4;
+        int sections = (lcpArray != null) ? 3 : 2;
+        
+        ByteBuffer header = ByteBuffer.allocate(HEADER_BYTES + sections * SECTION_ENTRY_BYTES)
+            .order(ByteOrder.LITTLE_ENDIAN);
+        header.putInt(MAGIC).putInt(VERSION).putInt(width).putInt(alphabetSize)
+            .putInt(symbols.length()).putInt(sa.length).putInt(sections).putInt(0);
+        
+        try (FileChannel out = FileChannel.open(file, StandardOpenOption.CREATE,
+                                                StandardOpenOption.TRUNCATE_EXISTING,
+                                                StandardOpenOption.WRITE)) {
+            long position = align(header.capacity());
+            position = writeSection(out, header, SECTION_TEXT, position,
+                                    symbols.length(), width, symbols::symbolAt);
+            position = writeSection(out, header, SECTION_SUFFIX_ARRAY, position,
+                                    sa.length, Integer.BYTES, i -> sa[i]);
+            if (lcpArray != null) {
+                writeSection(out, header, SECTION_LCP, position,
+                             lcpArray.length(), Integer.BYTES, lcpArray::get);
+            }
+            
+            header.flip();
+            writeFully(out, header, 0);
+        }
+    }
+    
+    /**
+     * Writes count values of the given width at position and records the
+     * section in the header.
+     * 
+     * @return the aligned position after the section
+     */
+    private static long writeSection(FileChannel out, ByteBuffer header, int id, long position,
+                                     int count, int width, IntUnaryOperator value)
+            throws IOException {
+        ByteBuffer buffer = ByteBuffer.allocate(WRITE_BUFFER_BYTES).order(ByteOrder.LITTLE_ENDIAN);
+        long offset = position;
+        for (int i = 0; i < count; i++) {
+            if (buffer.remaining() < width) {
+                buffer.flip();
+                offset += writeFully(out, buffer, offset);
+                buffer.clear();
+            }
+            int v = value.applyAsInt(i);
+            if (width == 1) {
+                buffer.put((byte) v);
+            } else if (width == 2) {
+                buffer.putChar((char) v);
+            } else {
+                buffer.putInt(v);
+            }
+        }
+        buffer.flip();
+        offset += writeFully(out, buffer, offset);
+        
+        header.putInt(id).putInt(0).putLong(position).putLong(offset - position);
+        return align(offset);
+    }
+    
+    private static int writeFully(FileChannel out, ByteBuffer buffer, long position)
+            throws IOException {
+        int written = 0;
+        while (buffer.hasRemaining()) {
+            written += out.write(buffer, position + written);
+        }
+        return written;
+    }
+    
+    private static long align(long position) {
+        return (position + 7) & ~7L;
+    }
+    
+    /**
+     * Searches for a pattern in the mapped index.
+     * 
+     * @param pattern the pattern to search
+     * @return the starting index of an occurrence, or -1 if not found
+     */
+    public int search(String pattern) {
+        return search(SymbolText.of(pattern));
+    }
+    
+    /**
+     * @param pattern the bytes to search; bytes are unsigned
+     * @return the starting index of an occurrence, or -1 if not found
+     */
+    public int search(byte[] pattern) {
+        return search(SymbolText.of(pattern));
+    }
+    
+    private int search(SymbolText pattern) {
+        int left = bound(pattern, false);
+        if (left < size && compareWithSuffix(get(left), pattern) == 0) {
+            return get(left);
+        }
+        return -1;
+    }
+    
+    /**
+     * @param pattern the pattern to search
+     * @return {lo, hi}, the half-open interval of matching SA indices
+     */
+    public int[] findRange(String pattern) {
+        return findRange(SymbolText.of(pattern));
+    }
+    
+    /**
+     * @param pattern the symbols to search
+     * @return {lo, hi}, the half-open interval of matching SA indices
+     */
+    public int[] findRange(int[] pattern) {
+        return findRange(SymbolText.of(pattern, Integer.MAX_VALUE));
+    }
+    
+    /**
+     * @param pattern the bytes to search; bytes are unsigned
+     * @return {lo, hi}, the half-open interval of matching SA indices
+     */
+    public int[] findRange(byte[] pattern) {
+        return findRange(SymbolText.of(pattern));
+    }
+    
+    private int[] findRange(SymbolText pattern) {
+        return new int[] {bound(pattern, false), bound(pattern, true)};
+    }
+    
+    /**
+     * @param pattern the pattern to count
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(String pattern) {
+        SymbolText symbols = SymbolText.of(pattern);
+        return bound(symbols, true) - bound(symbols, false);
+    }
+    
+    /**
+     * @param pattern the symbols to count
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(int[] pattern) {
+        int[] range = findRange(pattern);
+        return range[1] - range[0];
+    }
+    
+    /**
+     * @param pattern the bytes to count; bytes are unsigned
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(byte[] pattern) {
+        int[] range = findRange(pattern);
+        return range[1] - range[0];
+    }
+    
+    /**
+     * @param pattern the pattern to locate
+     * @return the positions of all occurrences, in suffix array order
+     */
+    public IntStream locateAll(String pattern) {
+        int[] range = findRange(pattern);
+        return IntStream.range(range[0], range[1]).map(this::get);
+    }
+    
+    /**
+     * Binary search as in {@link SuffixArray}, over the mapped arrays.
+     */
+    private int bound(SymbolText pattern, boolean upper) {
+        int left = 0, right = size;
+        while (left < right) {
+            int mid = (left + right) >>> 1;
+            int cmp = compareWithSuffix(get(mid), pattern);
+            if (cmp < 0 || (upper && cmp == 0)) {
+                left = mid + 1;
+            } else {
+                right = mid;
+            }
+        }
+        return left;
+    }
+    
+    private int compareWithSuffix(int start, SymbolText pattern) {
+        int length = text.length();
+        int m = pattern.length();
+        for (int k = 0; k < m; k++) {
+            if (start + k >= length) {
+                return -1;
+            }
+            int a = text.symbolAt(start + k);
+            int b = pattern.symbolAt(k);
+            if (a != b) {
+                return a < b ? -1 : 1;
+            }
+        }
+        return 0;
+    }
+    
+    /**
+     * @param i index in suffix array order
+     * @return the text position of the i-th smallest suffix
+     */
+    public int get(int i) {
+        return suffixArray.getInt((long) i * Integer.BYTES);
+    }
+    
+    /**
+     * @return the number of suffixes
+     */
+    public int size() {
+        return size;
+    }
+    
+    /**
+     * @return the text length in symbols
+     */
+    public int length() {
+        return text.length();
+    }
+    
+    /**
+     * @return the mapped LCP values, or null if the file has none
+     */
+    public LCPArray getLCPArray() {
+        if (lcp == null) {
+            return null;
+        }
+        Section values = lcp;
+        return new LCPArray() {
+            @Override
+            public int length() {
+                return size;
+            }
+            
+            @Override
+            public int get(int i) {
+                return values.getInt((long) i * Integer.BYTES);
+            }
+        };
+    }
+    
+    /**
+     * Closes the file. The mappings stay valid until they are garbage
+     * collected, as Java offers no explicit unmapping.
+     */
+    @Override
+    public void close() throws IOException {
+        channel.close();
+    }
+}
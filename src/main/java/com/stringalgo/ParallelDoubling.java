@@ -0,0 +1,274 @@
+package com.stringalgo;
+
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.function.IntUnaryOperator;
+
+/**
+ * Multi-threaded prefix doubling suffix array construction.
+ * 
+ * The array is split into one contiguous block per thread. Every phase of
+ * a doubling round runs block-parallel:
+ * 1. Compaction of the suffix array into second-key order
+ * 2. Stable LSD radix sort by first key, 16 bits per pass, with per-block
+ *    histograms whose prefix sums are taken in (digit, block) order
+ * 3. Rank renaming: blocks count group boundaries, a prefix sum over the
+ *    block counts gives each block its starting rank, then blocks write
+ *    their ranks independently
+ * 
+ * Every step is deterministic, so the result is identical to the
+ * sequential builders for any thread count.
+ * 
+ * Time Complexity: O(n log n / p + p · 2^16 log n) for p threads
+ * Space Complexity: O(n + p · 2^16)
+ */
+final class ParallelDoubling {
+    
+    private static final int DIGIT_BITS = 16;
+    private static final int RADIX = 1 << DIGIT_BITS;
+    private static final int DIGIT_MASK = RADIX - 1;
+    
+    private final int n;
+    private final int blocks;
+    private final ExecutorService pool;
+    private final int[][] histogram;
+    private final int[] blockCounts;
+    
+    private ParallelDoubling(int n, int threads, ExecutorService pool) {
+        this.n = n;
+        this.blocks = Math.max(1, Math.min(threads, n));
+        this.pool = pool;
+        this.histogram = new int[blocks][RADIX];
+        this.blockCounts = new int[blocks];
+    }
+    
+    /**
+     * Sorts all suffixes of the given text.
+     * 
+     * @param text the symbols to sort
+     * @param sa output suffix array, length text.length()
+     * @param rank output inverse suffix array, length text.length()
+     * @param threads number of worker threads, at least 1
+     */
+    static void sort(SymbolText text, int[] sa, int[] rank, int threads) {
+        if (threads < 1) {
+            throw new IllegalArgumentException("Thread count must be positive: " + threads);
+        }
+        int n = text.length();
+        if (n == 0) {
+            return;
+        }
+        
+        ExecutorService pool = Executors.newFixedThreadPool(threads);
+        try {
+            new ParallelDoubling(n, threads, pool).run(text, sa, rank);
+        } finally {
+            pool.shutdown();
+        }
+    }
+    
+    private void run(SymbolText text, int[] sa, int[] rank) {
+        int[] order = new int[n];
+        int[] scratch = new int[n];
+        
+        // Step 1: Sort positions by their first symbol and rank them
+        forEachBlock((block, from, to) -> {
+            int max = 0;
+            for (int i = from; i < to; i++) {
+                order[i] = i;
+                max = Math.max(max, text.symbolAt(i));
+            }
+            blockCounts[block] = max;
+        });
+        int upper = 0;
+        for (int count : blockCounts) {
+            upper = Math.max(upper, count);
+        }
+        sortByKey(order, sa, scratch, text::symbolAt, upper);
+        int classes = rename(sa, rank, (a, b) -> text.symbolAt(a) != text.symbolAt(b));
+        
+        // Step 2: Double the compared prefix length until ranks are unique
+        int[] cur = rank;
+        int[] next = order;
+        for (int k = 1; classes < n; k <<= 1) {
+            int gap = k;
+            int[] ranks = cur;
+            
+            orderBySecondKey(sa, next, gap);
+            sortByKey(next, sa, scratch, x -> ranks[x], classes - 1);
+            classes = rename(sa, next, (a, b) -> ranks[a] != ranks[b]
+                || secondRank(ranks, a, gap) != secondRank(ranks, b, gap));
+            
+            int[] swap = cur;
+            cur = next;
+            next = swap;
+        }
+        
+        if (cur != rank) {
+            System.arraycopy(cur, 0, rank, 0, n);
+        }
+    }
+    
+    private int secondRank(int[] ranks, int suffix, int gap) {
+        return (suffix + gap < n) ? ranks[suffix + gap] : -1;
+    }
+    
+    /**
+     * Writes the suffixes in order of their second key: those without a
+     * second half first, then sa[i] - k for every sa[i] >= k in SA order.
+     */
+    private void orderBySecondKey(int[] sa, int[] out, int k) {
+        forEachBlock((block, from, to) -> {
+            int count = 0;
+            for (int i = from; i < to; i++) {
+                if (i < k) {
+                    out[i] = n - k + i;
+                }
+                if (sa[i] >= k) {
+                    count++;
+                }
+            }
+            blockCounts[block] = count;
+        });
+        prefixSums(k);
+        forEachBlock((block, from, to) -> {
+            int p = blockCounts[block];
+            for (int i = from; i < to; i++) {
+                if (sa[i] >= k) {
+                    out[p++] = sa[i] - k;
+                }
+            }
+        });
+    }
+    
+    /**
+     * Stable sort of src into dst by key, keys in [0, maxKey].
+     */
+    private void sortByKey(int[] src, int[] dst, int[] scratch,
+                           IntUnaryOperator key, int maxKey) {
+        if (maxKey <= DIGIT_MASK) {
+            radixPass(src, dst, key, 0, maxKey);
+        } else {
+            radixPass(src, scratch, key, 0, maxKey);
+            radixPass(scratch, dst, key, DIGIT_BITS, maxKey);
+        }
+    }
+    
+    private void radixPass(int[] src, int[] dst, IntUnaryOperator key,
+                           int shift, int maxKey) {
+        int digits = Math.min(RADIX, (maxKey >>> shift) + 1);
+        
+        forEachBlock((block, from, to) -> {
+            int[] counts = histogram[block];
+            Arrays.fill(counts, 0, digits, 0);
+            for (int i = from; i < to; i++) {
+                counts[(key.applyAsInt(src[i]) >>> shift) & DIGIT_MASK]++;
+            }
+        });
+        
+        // Offsets in (digit, block) order keep the scatter stable
+        int sum = 0;
+        for (int d = 0; d < digits; d++) {
+            for (int b = 0; b < blocks; b++) {
+                int count = histogram[b][d];
+                histogram[b][d] = sum;
+                sum += count;
+            }
+        }
+        
+        forEachBlock((block, from, to) -> {
+            int[] offsets = histogram[block];
+            for (int i = from; i < to; i++) {
+                int x = src[i];
+                dst[offsets[(key.applyAsInt(x) >>> shift) & DIGIT_MASK]++] = x;
+            }
+        });
+    }
+    
+    /**
+     * Assigns ranks in suffix array order, starting a new rank wherever
+     * the boundary test reports adjacent suffixes as different.
+     * 
+     * @return the number of distinct ranks
+     */
+    private int rename(int[] sa, int[] out, Boundary boundary) {
+        forEachBlock((block, from, to) -> {
+            int count = 0;
+            for (int i = Math.max(from, 1); i < to; i++) {
+                if (boundary.differs(sa[i - 1], sa[i])) {
+                    count++;
+                }
+            }
+            blockCounts[block] = count;
+        });
+        int boundaries = prefixSums(0);
+        forEachBlock((block, from, to) -> {
+            int current = blockCounts[block];
+            for (int i = from; i < to; i++) {
+                if (i > 0 && boundary.differs(sa[i - 1], sa[i])) {
+                    current++;
+                }
+                out[sa[i]] = current;
+            }
+        });
+        return boundaries + 1;
+    }
+    
+    /**
+     * Replaces blockCounts with exclusive prefix sums starting at base.
+     * 
+     * @return base plus the sum of all block counts
+     */
+    private int prefixSums(int base) {
+        int sum = base;
+        for (int b = 0; b < blocks; b++) {
+            int count = blockCounts[b];
+            blockCounts[b] = sum;
+            sum += count;
+        }
+        return sum - base;
+    }
+    
+    /**
+     * Runs the task once per block on the pool and waits for all blocks.
+     */
+    private void forEachBlock(BlockTask task) {
+        List<Callable<Void>> tasks = new ArrayList<>(blocks);
+        for (int b = 0; b < blocks; b++) {
+            int block = b;
+            int from = (int) ((long) n * b / blocks);
+            int to = (int) ((long) n * (b + 1) / blocks);
+            tasks.add(() -> {
+                task.run(block, from, to);
+                return null;
+            });
+        }
+        
+        try {
+            for (Future<Void> future : pool.invokeAll(tasks)) {
+                future.get();
+            }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new IllegalStateException("Suffix array construction was interrupted", e);
+        } catch (ExecutionException e) {
+            throw new IllegalStateException("Suffix array construction failed", e.getCause());
+        }
+    }
+    
+    @FunctionalInterface
+    private interface BlockTask {
+        void run(int block, int from, int to);
+    }
+    
+    @FunctionalInterface
+    private interface Boundary {
+        boolean differs(int a, int b);
+    }
+}
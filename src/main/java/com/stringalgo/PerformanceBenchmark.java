@@ -1,6 +1,7 @@
 package com.stringalgo;
 
 import java.io.*;
+import java.lang.management.ManagementFactory;
 import java.util.*;
 
 /**
@@ -33,6 +34,24 @@ public class PerformanceBenchmark {
                     result.distinctTime / 1_000_000.0);
         }
         
+        // Parallel construction speedup
+        benchmarkParallel(1_000_000);
+        
+        // LCP construction on a large input
+        benchmarkLCP(10_000_000);
+        
+        // Search strategies on long patterns in a repetitive text
+        benchmarkSearch(1_000_000, 2_000);
+        
+        // Heap allocation per search query
+        benchmarkSearchAllocations(1_000_000);
+        
+        // Batched against independent range searches
+        benchmarkBatchSearch(1_000_000, 10_000);
+        
+        // FM-index locate time against suffix array sample rate
+        benchmarkLocate(1_000_000, 1_000);
+        
         // Export results
         exportToCSV(results, "/home/claude/suffix-array-project/docs/benchmark_results.csv");
         generateComplexityReport(results);
@@ -87,6 +106,222 @@ public class PerformanceBenchmark {
                                   searchTime, distinctTime);
     }
     
+    private static void benchmarkParallel(int size) {
+        System.out.println("\nParallel SA construction (n = " + size + "):");
+        String text = generateRandomString(size, "ACGT");
+        
+        List<Integer> threadCounts = new ArrayList<>();
+        int maxThreads = Runtime.getRuntime().availableProcessors();
+        for (int threads = 1; threads < maxThreads; threads *= 2) {
+            threadCounts.add(threads);
+        }
+        threadCounts.add(maxThreads);
+        
+        long baseline = 0;
+        for (int threads : threadCounts) {
+            long time = timeParallelBuild(text, threads);
+            if (threads == 1) {
+                baseline = time;
+            }
+            System.out.printf("  Threads: %3d | SA: %10.3f ms | Speedup: %.2fx%n",
+                threads, time / 1_000_000.0, (double) baseline / time);
+        }
+    }
+    
+    private static void benchmarkLCP(int size) {
+        System.out.println("\nLCP construction (n = " + size + "):");
+        SuffixArray sa = new SuffixArray(generateRandomString(size, "ACGT"), true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        
+        for (SuffixArray.LCPAlgorithm algorithm : SuffixArray.LCPAlgorithm.values()) {
+            long best = Long.MAX_VALUE;
+            
+            // First run is warm up
+            for (int run = 0; run < 4; run++) {
+                if (algorithm == SuffixArray.LCPAlgorithm.PHI_IN_PLACE) {
+                    // The in-place build consumes the inverse suffix array
+                    sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+                }
+                long start = System.nanoTime();
+                sa.buildLCP(algorithm);
+                long time = System.nanoTime() - start;
+                if (run > 0) {
+                    best = Math.min(best, time);
+                }
+            }
+            System.out.printf("  %-12s | LCP: %10.3f ms%n", algorithm, best / 1_000_000.0);
+        }
+    }
+    
+    private static void benchmarkSearch(int size, int patternLength) {
+        System.out.println("\nSearch (n = " + size + ", m = " + patternLength + "):");
+        String unit = generateRandomString(10_000, "ACGT");
+        StringBuilder sb = new StringBuilder(size);
+        while (sb.length() < size) {
+            sb.append(unit);
+        }
+        String text = sb.substring(0, size);
+        
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        sa.buildLCPLR();
+        
+        Random rand = new Random(42);
+        String[] patterns = new String[1_000];
+        for (int i = 0; i < patterns.length; i++) {
+            int start = rand.nextInt(size - patternLength);
+            patterns[i] = text.substring(start, start + patternLength);
+        }
+        
+        for (SuffixArray.SearchAlgorithm algorithm : SuffixArray.SearchAlgorithm.values()) {
+            long best = Long.MAX_VALUE;
+            
+            // First run is warm up
+            for (int run = 0; run < 4; run++) {
+                long start = System.nanoTime();
+                for (String pattern : patterns) {
+                    sa.search(pattern, algorithm);
+                }
+                long time = System.nanoTime() - start;
+                if (run > 0) {
+                    best = Math.min(best, time);
+                }
+            }
+            System.out.printf("  %-6s | %8.3f us/query%n",
+                algorithm, best / 1_000.0 / patterns.length);
+        }
+    }
+    
+    private static void benchmarkSearchAllocations(int queries) {
+        System.out.println("\nSearch allocations (" + queries + " queries):");
+        java.lang.management.ThreadMXBean threads = ManagementFactory.getThreadMXBean();
+        if (!(threads instanceof com.sun.management.ThreadMXBean)) {
+            System.out.println("  Allocation counters are not supported by this JVM");
+            return;
+        }
+        com.sun.management.ThreadMXBean counters = (com.sun.management.ThreadMXBean) threads;
+        long thread = Thread.currentThread().getId();
+        
+        String text = generateRandomString(100_000, "ACGT");
+        SuffixArray sa = new SuffixArray(text);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        String[] patterns = new String[1_000];
+        for (int i = 0; i < patterns.length; i++) {
+            patterns[i] = text.substring(i * 50, i * 50 + 20);
+        }
+        
+        // Warm up so the measured loop runs compiled code
+        int hits = 0;
+        for (int i = 0; i < queries; i++) {
+            if (sa.search(patterns[i % patterns.length]) >= 0) {
+                hits++;
+            }
+        }
+        
+        long before = counters.getThreadAllocatedBytes(thread);
+        long start = System.nanoTime();
+        for (int i = 0; i < queries; i++) {
+            if (sa.search(patterns[i % patterns.length]) >= 0) {
+                hits++;
+            }
+        }
+        long time = System.nanoTime() - start;
+        long allocated = counters.getThreadAllocatedBytes(thread) - before;
+        
+        System.out.printf("  Time: %.3f us/query | Allocated: %.3f bytes/query | Hits: %d%n",
+            time / 1_000.0 / queries, (double) allocated / queries, hits);
+    }
+    
+    private static void benchmarkBatchSearch(int size, int batchSize) {
+        System.out.println("\nBatch search (n = " + size + ", " + batchSize + " patterns):");
+        String text = generateRandomString(size, "ACGT");
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        
+        Random rand = new Random(42);
+        String[] patterns = new String[batchSize];
+        for (int i = 0; i < batchSize; i++) {
+            int start = rand.nextInt(size - 20);
+            patterns[i] = text.substring(start, start + 8 + rand.nextInt(12));
+        }
+        
+        long single = Long.MAX_VALUE;
+        long batch = Long.MAX_VALUE;
+        
+        // First run is warm up
+        for (int run = 0; run < 4; run++) {
+            long start = System.nanoTime();
+            for (String pattern : patterns) {
+                sa.findRange(pattern);
+            }
+            long time = System.nanoTime() - start;
+            
+            start = System.nanoTime();
+            sa.findRanges(patterns);
+            long batchTime = System.nanoTime() - start;
+            
+            if (run > 0) {
+                single = Math.min(single, time);
+                batch = Math.min(batch, batchTime);
+            }
+        }
+        System.out.printf("  Independent: %10.3f ms | Batch: %10.3f ms | Speedup: %.2fx%n",
+            single / 1_000_000.0, batch / 1_000_000.0, (double) single / batch);
+    }
+    
+    private static void benchmarkLocate(int size, int queries) {
+        System.out.println("\nFM-index locate (n = " + size + ", " + queries + " patterns):");
+        String text = generateRandomString(size, "ACGT");
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        long textAndSA = 2L * size + 4L * sa.getSuffixArray().length;
+        System.out.printf("  Text + SA: %10.3f MB%n", textAndSA / 1_000_000.0);
+        
+        Random rand = new Random(42);
+        String[] patterns = new String[queries];
+        for (int i = 0; i < queries; i++) {
+            int start = rand.nextInt(size - 10);
+            patterns[i] = text.substring(start, start + 10);
+        }
+        
+        for (int s : new int[] {1, 4, 16, 32, 64, 256}) {
+            FMIndex fm = new FMIndex(sa, FMIndex.DEFAULT_SAMPLE_RATE, s);
+            long best = Long.MAX_VALUE;
+            long located = 0;
+            
+            // First run is warm up
+            for (int run = 0; run < 4; run++) {
+                located = 0;
+                long start = System.nanoTime();
+                for (String pattern : patterns) {
+                    located += fm.locateAll(pattern).toArray().length;
+                }
+                long time = System.nanoTime() - start;
+                if (run > 0) {
+                    best = Math.min(best, time);
+                }
+            }
+            System.out.printf("  s = %-4d | %10.3f MB | %8.3f us/occurrence%n",
+                s, fm.memoryBytes() / 1_000_000.0, best / 1_000.0 / located);
+        }
+    }
+    
+    private static long timeParallelBuild(String text, int threads) {
+        long best = Long.MAX_VALUE;
+        
+        // First run is warm up
+        for (int run = 0; run < 4; run++) {
+            SuffixArray sa = new SuffixArray(text);
+            long start = System.nanoTime();
+            sa.buildSuffixArrayParallel(threads);
+            long time = System.nanoTime() - start;
+            if (run > 0) {
+                best = Math.min(best, time);
+            }
+        }
+        return best;
+    }
+    
     private static void exportToCSV(List<BenchmarkResult> results, String filename) 
             throws IOException {
         try (PrintWriter writer = new PrintWriter(new FileWriter(filename))) {
@@ -0,0 +1,112 @@
+package com.stringalgo;
+
+import java.util.Arrays;
+
+/**
+ * Prefix doubling suffix array construction with counting sort on
+ * primitive int rank pairs.
+ * 
+ * Each round sorts the suffixes by the pair (rank[i], rank[i+k]) with an
+ * LSD radix sort: the order by the second key falls out of the previous
+ * round's suffix array, and one stable counting sort by the first key
+ * finishes the round. All scratch buffers are allocated once and reused.
+ * 
+ * Time Complexity: O(n log n)
+ * Space Complexity: O(n + σ)
+ */
+final class RadixDoubling {
+    
+    private RadixDoubling() {
+    }
+    
+    /**
+     * Sorts all suffixes of the given text.
+     * 
+     * @param text the symbols to sort
+     * @param sa output suffix array, length text.length()
+     * @param rank output inverse suffix array, length text.length()
+     */
+    static void sort(SymbolText text, int[] sa, int[] rank) {
+        int n = text.length();
+        if (n == 0) {
+            return;
+        }
+        
+        int upper = 0;
+        for (int i = 0; i < n; i++) {
+            upper = Math.max(upper, text.symbolAt(i));
+        }
+        
+        int[] other = new int[n];
+        int[] count = new int[Math.max(n, upper + 1)];
+        
+        // Step 1: Counting sort by the first symbol
+        for (int i = 0; i < n; i++) {
+            count[text.symbolAt(i)]++;
+        }
+        for (int c = 1; c <= upper; c++) {
+            count[c] += count[c - 1];
+        }
+        for (int i = n - 1; i >= 0; i--) {
+            sa[--count[text.symbolAt(i)]] = i;
+        }
+        
+        rank[sa[0]] = 0;
+        int classes = 1;
+        for (int i = 1; i < n; i++) {
+            if (text.symbolAt(sa[i]) != text.symbolAt(sa[i - 1])) {
+                classes++;
+            }
+            rank[sa[i]] = classes - 1;
+        }
+        
+        int[] cur = rank;
+        for (int k = 1; classes < n; k <<= 1) {
+            // Step 2: Order by second key. Suffixes without a second half
+            // come first, the rest follow the previous suffix array order.
+            int p = 0;
+            for (int i = n - k; i < n; i++) {
+                other[p++] = i;
+            }
+            for (int i = 0; i < n; i++) {
+                if (sa[i] >= k) {
+                    other[p++] = sa[i] - k;
+                }
+            }
+            
+            // Step 3: Stable counting sort by first key
+            Arrays.fill(count, 0, classes, 0);
+            for (int i = 0; i < n; i++) {
+                count[cur[i]]++;
+            }
+            for (int c = 1; c < classes; c++) {
+                count[c] += count[c - 1];
+            }
+            for (int i = n - 1; i >= 0; i--) {
+                sa[--count[cur[other[i]]]] = other[i];
+            }
+            
+            // Step 4: Assign new ranks into the free buffer
+            other[sa[0]] = 0;
+            classes = 1;
+            for (int i = 1; i < n; i++) {
+                int a = sa[i - 1];
+                int b = sa[i];
+                int secondA = (a + k < n) ? cur[a + k] : -1;
+                int secondB = (b + k < n) ? cur[b + k] : -1;
+                if (cur[a] != cur[b] || secondA != secondB) {
+                    classes++;
+                }
+                other[b] = classes - 1;
+            }
+            
+            int[] swap = cur;
+            cur = other;
+            other = swap;
+        }
+        
+        if (cur != rank) {
+            System.arraycopy(cur, 0, rank, 0, n);
+        }
+    }
+}
@@ -0,0 +1,106 @@
+package com.stringalgo;
+
+import java.util.function.IntUnaryOperator;
+
+/**
+ * Constant-time range minimum queries over a read-only sequence.
+ * 
+ * The sequence is cut into blocks of 64 values:
+ * 1. Inside a block, every position keeps a 64-bit mask of the stack of
+ *    suffix minima ending there; the lowest bit at or after the query
+ *    start marks the minimum
+ * 2. Across blocks, a sparse table over the block minima answers any run
+ *    of whole blocks with two overlapping lookups
+ * 
+ * Time Complexity: O(n) construction, O(1) per query
+ * Space Complexity: O(n) words, n longs plus O(n / 64 log n) ints
+ */
+final class RangeMinimum {
+    
+    private static final int BLOCK_BITS = 6;
+    private static final int BLOCK = 1 << BLOCK_BITS;
+    
+    private final IntUnaryOperator values;
+    private final long[] masks;
+    private final int[][] sparse;
+    
+    /**
+     * @param values the sequence, read through value(i) for i in [0, n)
+     * @param n the length of the sequence
+     */
+    RangeMinimum(IntUnaryOperator values, int n) {
+        this.values = values;
+        this.masks = new long[n];
+        
+        // Step 1: Stack masks inside each block
+        for (int base = 0; base < n; base += BLOCK) {
+            long stack = 0;
+            for (int i = base; i < Math.min(n, base + BLOCK); i++) {
+                int value = values.applyAsInt(i);
+                while (stack != 0) {
+                    int top = base + (BLOCK - 1) - Long.numberOfLeadingZeros(stack);
+                    if (values.applyAsInt(top) <= value) {
+                        break;
+                    }
+                    stack ^= 1L << (top - base);
+                }
+                stack |= 1L << (i - base);
+                masks[i] = stack;
+            }
+        }
+        
+        // Step 2: Sparse table of block minimum positions
+        int blocks = (n + BLOCK - 1) >>> BLOCK_BITS;
+        int levels = (blocks == 0) ? 1 : 32 - Integer.numberOfLeadingZeros(blocks);
+        this.sparse = new int[levels][];
+        sparse[0] = new int[blocks];
+        for (int b = 0; b < blocks; b++) {
+            sparse[0][b] = inBlock(b << BLOCK_BITS, Math.min(n, (b + 1) << BLOCK_BITS) - 1);
+        }
+        for (int k = 1; k < levels; k++) {
+            int half = 1 << (k - 1);
+            int[] previous = sparse[k - 1];
+            sparse[k] = new int[blocks - (1 << k) + 1];
+            for (int b = 0; b < sparse[k].length; b++) {
+                sparse[k][b] = better(previous[b], previous[b + half]);
+            }
+        }
+    }
+    
+    /**
+     * @param lo first position of the range
+     * @param hi last position of the range, inclusive, hi >= lo
+     * @return a position of the minimum value in [lo, hi]
+     */
+    int argmin(int lo, int hi) {
+        int left = lo >>> BLOCK_BITS;
+        int right = hi >>> BLOCK_BITS;
+        if (left == right) {
+            return inBlock(lo, hi);
+        }
+        
+        int best = inBlock(lo, (left << BLOCK_BITS) + BLOCK - 1);
+        if (right - left > 1) {
+            int count = right - left - 1;
+            int k = 31 - Integer.numberOfLeadingZeros(count);
+            best = better(best, better(sparse[k][left + 1], sparse[k][right - (1 << k)]));
+        }
+        return better(best, inBlock(right << BLOCK_BITS, hi));
+    }
+    
+    /**
+     * @return the minimum value in [lo, hi]
+     */
+    int min(int lo, int hi) {
+        return values.applyAsInt(argmin(lo, hi));
+    }
+    
+    private int inBlock(int lo, int hi) {
+        long stack = masks[hi] & (-1L << (lo & (BLOCK - 1)));
+        return (hi & ~(BLOCK - 1)) + Long.numberOfTrailingZeros(stack);
+    }
+    
+    private int better(int a, int b) {
+        return values.applyAsInt(a) <= values.applyAsInt(b) ? a : b;
+    }
+}
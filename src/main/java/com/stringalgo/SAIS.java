@@ -0,0 +1,173 @@
+package com.stringalgo;
+
+import java.util.Arrays;
+
+/**
+ * Suffix array construction by induced sorting (SA-IS).
+ * 
+ * Based on Nong, Zhang and Chan (2009). The text is treated as if it were
+ * followed by a unique symbol smaller than every other symbol, so a suffix
+ * that is a prefix of another suffix sorts first. This is the same order the
+ * prefix doubling builder in {@link SuffixArray} produces.
+ * 
+ * Time Complexity: O(n + σ) where σ = largest symbol value
+ * Space Complexity: O(n + σ)
+ */
+final class SAIS {
+    
+    private SAIS() {
+    }
+    
+    /**
+     * Sorts all suffixes of the given text.
+     * 
+     * @param text the symbols to sort
+     * @param sa output array, at least text.length() long
+     */
+    static void sort(SymbolText text, int[] sa) {
+        int n = text.length();
+        int upper = 0;
+        for (int i = 0; i < n; i++) {
+            upper = Math.max(upper, text.symbolAt(i));
+        }
+        sort(text, n, upper, sa);
+    }
+    
+    private static void sort(SymbolText s, int n, int upper, int[] sa) {
+        if (n == 0) {
+            return;
+        }
+        if (n == 1) {
+            sa[0] = 0;
+            return;
+        }
+        if (n == 2) {
+            boolean ordered = s.symbolAt(0) < s.symbolAt(1);
+            sa[0] = ordered ? 0 : 1;
+            sa[1] = ordered ? 1 : 0;
+            return;
+        }
+        
+        // Step 1: Classify positions as S-type (true) or L-type (false)
+        boolean[] ls = new boolean[n];
+        for (int i = n - 2; i >= 0; i--) {
+            int a = s.symbolAt(i);
+            int b = s.symbolAt(i + 1);
+            ls[i] = (a == b) ? ls[i + 1] : (a < b);
+        }
+        
+        // Step 2: Bucket boundaries. sumS[c] is the start of the S-part of
+        // bucket c, sumL[c] the start of the whole bucket c.
+        int[] sumL = new int[upper + 1];
+        int[] sumS = new int[upper + 1];
+        for (int i = 0; i < n; i++) {
+            int c = s.symbolAt(i);
+            if (!ls[i]) {
+                sumS[c]++;
+            } else {
+                sumL[c + 1]++;
+            }
+        }
+        for (int c = 0; c <= upper; c++) {
+            sumS[c] += sumL[c];
+            if (c < upper) {
+                sumL[c + 1] += sumS[c];
+            }
+        }
+        
+        // Step 3: Collect LMS positions (S-type with an L-type predecessor)
+        int[] lmsMap = new int[n + 1];
+        Arrays.fill(lmsMap, -1);
+        int m = 0;
+        for (int i = 1; i < n; i++) {
+            if (!ls[i - 1] && ls[i]) {
+                lmsMap[i] = m++;
+            }
+        }
+        int[] lms = new int[m];
+        for (int i = 1, j = 0; i < n; i++) {
+            if (!ls[i - 1] && ls[i]) {
+                lms[j++] = i;
+            }
+        }
+        
+        // Step 4: Induce an order of the LMS substrings
+        induce(s, n, ls, sumS, sumL, lms, sa);
+        
+        if (m == 0) {
+            return;
+        }
+        
+        // Step 5: Name the LMS substrings and sort them recursively
+        int[] sortedLms = new int[m];
+        for (int i = 0, j = 0; i < n; i++) {
+            if (lmsMap[sa[i]] != -1) {
+                sortedLms[j++] = sa[i];
+            }
+        }
+        
+        int[] reduced = new int[m];
+        int reducedUpper = 0;
+        reduced[lmsMap[sortedLms[0]]] = 0;
+        for (int i = 1; i < m; i++) {
+            int l = sortedLms[i - 1];
+            int r = sortedLms[i];
+            int endL = (lmsMap[l] + 1 < m) ? lms[lmsMap[l] + 1] : n;
+            int endR = (lmsMap[r] + 1 < m) ? lms[lmsMap[r] + 1] : n;
+            
+            boolean same = (endL - l == endR - r);
+            if (same) {
+                while (l < endL && s.symbolAt(l) == s.symbolAt(r)) {
+                    l++;
+                    r++;
+                }
+                same = l < n && r < n && s.symbolAt(l) == s.symbolAt(r);
+            }
+            
+            if (!same) {
+                reducedUpper++;
+            }
+            reduced[lmsMap[sortedLms[i]]] = reducedUpper;
+        }
+        
+        int[] reducedSA = new int[m];
+        sort(SymbolText.of(reduced, reducedUpper + 1), m, reducedUpper, reducedSA);
+        
+        // Step 6: Induce the final order from the sorted LMS suffixes
+        for (int i = 0; i < m; i++) {
+            sortedLms[i] = lms[reducedSA[i]];
+        }
+        induce(s, n, ls, sumS, sumL, sortedLms, sa);
+    }
+    
+    /**
+     * Places the given LMS suffixes at the ends of their buckets, then
+     * induces L-type suffixes left to right and S-type suffixes right to left.
+     */
+    private static void induce(SymbolText s, int n, boolean[] ls,
+                               int[] sumS, int[] sumL, int[] lms, int[] sa) {
+        Arrays.fill(sa, 0, n, -1);
+        
+        int[] buf = sumS.clone();
+        for (int d : lms) {
+            sa[buf[s.symbolAt(d)]++] = d;
+        }
+        
+        System.arraycopy(sumL, 0, buf, 0, buf.length);
+        sa[buf[s.symbolAt(n - 1)]++] = n - 1;
+        for (int i = 0; i < n; i++) {
+            int v = sa[i];
+            if (v >= 1 && !ls[v - 1]) {
+                sa[buf[s.symbolAt(v - 1)]++] = v - 1;
+            }
+        }
+        
+        System.arraycopy(sumL, 0, buf, 0, buf.length);
+        for (int i = n - 1; i >= 0; i--) {
+            int v = sa[i];
+            if (v >= 1 && ls[v - 1]) {
+                sa[--buf[s.symbolAt(v - 1) + 1]] = v - 1;
+            }
+        }
+    }
+}
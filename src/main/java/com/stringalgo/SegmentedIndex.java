@@ -0,0 +1,497 @@
+package com.stringalgo;
+
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.List;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.function.Function;
+
+/**
+ * Record index for continuous ingest, organized like a log-structured
+ * merge tree: immutable segments plus a small in-memory tail.
+ * 
+ * - Added records collect in the tail, which queries scan directly
+ * - A full tail is flushed into a new level-0 segment, a
+ *   {@link GeneralizedSuffixArray} over its records; the segment is built
+ *   outside the lock, and until it is published queries scan its records
+ *   like the tail, so adds and queries never wait for a build
+ * - A background thread merges every run of mergeFactor segments of the
+ *   same level into one segment of the next level
+ * 
+ * Each record is therefore rebuilt once per level, O(log n) times in
+ * total, and at most mergeFactor - 1 segments per level stay unmerged, so
+ * queries fan out over O(mergeFactor log n) segments. Queries read an
+ * immutable snapshot of the segment list and never wait for a merge.
+ * 
+ * A flush whose segment fails to build still publishes its records, as an
+ * unindexed segment that queries scan like the tail until a merge indexes
+ * them, so later flushes are not held back; the failure is thrown to the
+ * caller of the flush. A failed merge leaves its segments unmerged. Both
+ * are reported by {@link #awaitMerges()} and {@link #close()}.
+ * 
+ * Records are numbered from 0 in the order they are added; an occurrence
+ * is reported as {record, offset} and never spans two records.
+ * 
+ * Time Complexity: amortized O(log n) per added symbol, O(tailCapacity)
+ *                  for a flush; per count O(m log n) for each segment plus
+ *                  a scan of the tail
+ * Space Complexity: O(n)
+ */
+public final class SegmentedIndex implements AutoCloseable {
+    
+    /** Default number of records in the tail before it is flushed. */
+    public static final int DEFAULT_TAIL_CAPACITY = 1024;
+    
+    /** Default number of same-level segments merged together. */
+    public static final int DEFAULT_MERGE_FACTOR = 4;
+    
+    /**
+     * An immutable run of consecutive records, with its index or, if
+     * building that failed, the records themselves.
+     */
+    private static final class Segment {
+        final int firstRecord;
+        final int level;
+        final GeneralizedSuffixArray index;
+        final List<String> records;
+        
+        Segment(int firstRecord, int level, GeneralizedSuffixArray index) {
+            this.firstRecord = firstRecord;
+            this.level = level;
+            this.index = index;
+            this.records = null;
+        }
+        
+        Segment(int firstRecord, int level, List<String> records) {
+            this.firstRecord = firstRecord;
+            this.level = level;
+            this.index = null;
+            this.records = records;
+        }
+        
+        int recordCount() {
+            return index != null ? index.documentCount() : records.size();
+        }
+        
+        String record(int i) {
+            return index != null ? index.getDocument(i) : records.get(i);
+        }
+    }
+    
+    /**
+     * Records taken from the tail whose segment is being built.
+     */
+    private static final class Batch {
+        final int firstRecord;
+        final List<String> records;
+        Segment segment;
+        
+        Batch(int firstRecord, List<String> records) {
+            this.firstRecord = firstRecord;
+            this.records = records;
+        }
+    }
+    
+    private final int tailCapacity;
+    private final int mergeFactor;
+    private final Function<List<String>, GeneralizedSuffixArray> indexer;
+    private final ExecutorService merger;
+    private final Object lock = new Object();
+    
+    // Replaced, never modified, under the lock
+    private volatile List<Segment> segments = Collections.emptyList();
+    
+    // Guarded by the lock; batches are in record order and published in
+    // that order
+    private final List<String> tail = new ArrayList<>();
+    private final List<Batch> flushing = new ArrayList<>();
+    private int tailFirstRecord;
+    private boolean closed;
+    private Future<?> lastMerge;
+    private Throwable failure;
+    
+    public SegmentedIndex() {
+        this(DEFAULT_TAIL_CAPACITY, DEFAULT_MERGE_FACTOR);
+    }
+    
+    /**
+     * @param tailCapacity records held in the tail before a flush
+     * @param mergeFactor number of same-level segments merged together, at
+     *        least 2
+     */
+    public SegmentedIndex(int tailCapacity, int mergeFactor) {
+        this(tailCapacity, mergeFactor, GeneralizedSuffixArray::new);
+    }
+    
+    /**
+     * @param indexer builds the index of a segment from its records
+     */
+    SegmentedIndex(int tailCapacity, int mergeFactor,
+                   Function<List<String>, GeneralizedSuffixArray> indexer) {
+        if (tailCapacity < 1) {
+            throw new IllegalArgumentException("Tail capacity must be positive: " + tailCapacity);
+        }
+        if (mergeFactor < 2) {
+            throw new IllegalArgumentException("Merge factor must be at least 2: " + mergeFactor);
+        }
+        this.tailCapacity = tailCapacity;
+        this.mergeFactor = mergeFactor;
+        this.indexer = indexer;
+        this.merger = Executors.newSingleThreadExecutor(task -> {
+            Thread thread = new Thread(task, "segment-merge");
+            thread.setDaemon(true);
+            return thread;
+        });
+    }
+    
+    /**
+     * Adds a record, flushing the tail into a new segment when it is full.
+     * 
+     * @param record the record text
+     * @return the record's number
+     * @throws RuntimeException if building the flushed segment fails; the
+     *         record is added all the same
+     */
+    public int add(String record) {
+        int id;
+        Batch batch = null;
+        synchronized (lock) {
+            id = tailFirstRecord + tail.size();
+            tail.add(record);
+            if (tail.size() >= tailCapacity) {
+                batch = takeTail();
+            }
+        }
+        if (batch != null) {
+            build(batch);
+        }
+        return id;
+    }
+    
+    /**
+     * Moves the records in the tail into a new segment.
+     * 
+     * @throws RuntimeException if building the segment fails; its records
+     *         stay searchable
+     */
+    public void flush() {
+        Batch batch;
+        synchronized (lock) {
+            batch = takeTail();
+        }
+        if (batch != null) {
+            build(batch);
+        }
+    }
+    
+    /**
+     * Moves the tail into a new batch, still visible to queries.
+     * 
+     * @return the batch, or null if the tail is empty
+     */
+    private Batch takeTail() {
+        if (tail.isEmpty()) {
+            return null;
+        }
+        Batch batch = new Batch(tailFirstRecord, new ArrayList<>(tail));
+        flushing.add(batch);
+        tailFirstRecord += tail.size();
+        tail.clear();
+        return batch;
+    }
+    
+    /**
+     * Builds the segment of a batch without holding the lock and publishes
+     * it; if the build fails, publishes the records unindexed instead.
+     */
+    private void build(Batch batch) {
+        Segment segment;
+        try {
+            segment = new Segment(batch.firstRecord, 0, indexer.apply(batch.records));
+        } catch (RuntimeException | Error e) {
+            recordFailure(e);
+            publish(batch, new Segment(batch.firstRecord, 0, batch.records));
+            throw e;
+        }
+        publish(batch, segment);
+    }
+    
+    /**
+     * Publishes every leading batch whose segment is ready, so segments
+     * stay in record order when flushes finish out of order.
+     */
+    private void publish(Batch batch, Segment segment) {
+        synchronized (lock) {
+            batch.segment = segment;
+            List<Segment> updated = new ArrayList<>(segments);
+            while (!flushing.isEmpty() && flushing.get(0).segment != null) {
+                updated.add(flushing.remove(0).segment);
+            }
+            segments = Collections.unmodifiableList(updated);
+            if (!closed) {
+                lastMerge = merger.submit(this::mergeSegments);
+            }
+        }
+    }
+    
+    /**
+     * Merges runs of mergeFactor same-level segments, oldest first, until
+     * none is left. Runs on the merge thread only, so the segments of a run
+     * cannot be replaced by anyone else while their merge is built.
+     */
+    private void mergeSegments() {
+        try {
+            mergeRuns();
+        } catch (RuntimeException | Error e) {
+            recordFailure(e);
+            throw e;
+        }
+    }
+    
+    private void recordFailure(Throwable e) {
+        synchronized (lock) {
+            if (failure == null) {
+                failure = e;
+            }
+        }
+    }
+    
+    private void mergeRuns() {
+        while (true) {
+            List<Segment> snapshot = segments;
+            int start = findRun(snapshot);
+            if (start < 0) {
+                return;
+            }
+            
+            // Build the merged segment without holding the lock
+            List<Segment> run = snapshot.subList(start, start + mergeFactor);
+            List<String> records = new ArrayList<>();
+            for (Segment segment : run) {
+                for (int d = 0; d < segment.recordCount(); d++) {
+                    records.add(segment.record(d));
+                }
+            }
+            Segment first = run.get(0);
+            GeneralizedSuffixArray index = indexer.apply(records);
+            Segment merged = new Segment(first.firstRecord, first.level + 1, index);
+            
+            synchronized (lock) {
+                List<Segment> updated = new ArrayList<>(segments);
+                int position = updated.indexOf(run.get(0));
+                updated.subList(position, position + mergeFactor).clear();
+                updated.add(position, merged);
+                segments = Collections.unmodifiableList(updated);
+            }
+        }
+    }
+    
+    /**
+     * @return the start of the oldest run of mergeFactor consecutive
+     *         segments of one level, or -1
+     */
+    private int findRun(List<Segment> snapshot) {
+        int length = 0;
+        for (int i = 0; i < snapshot.size(); i++) {
+            boolean same = i > 0 && snapshot.get(i).level == snapshot.get(i - 1).level;
+            length = same ? length + 1 : 1;
+            if (length == mergeFactor) {
+                return i - mergeFactor + 1;
+            }
+        }
+        return -1;
+    }
+    
+    /**
+     * Counts the occurrences of a pattern over all records.
+     * 
+     * @param pattern the pattern to count, not empty
+     * @return the number of occurrences, overlapping ones included
+     * @throws IllegalArgumentException if the pattern is empty
+     */
+    public int count(String pattern) {
+        requireNonEmpty(pattern);
+        List<Segment> snapshot;
+        List<String> tailRecords = new ArrayList<>();
+        synchronized (lock) {
+            snapshot = segments;
+            for (Batch batch : flushing) {
+                tailRecords.addAll(batch.records);
+            }
+            tailRecords.addAll(tail);
+        }
+        
+        int count = 0;
+        for (Segment segment : snapshot) {
+            count += segment.index != null
+                ? segment.index.count(pattern)
+                : scan(segment.records, 0, pattern).size();
+        }
+        return count + scan(tailRecords, 0, pattern).size();
+    }
+    
+    /**
+     * Finds every occurrence of a pattern, merging the results of all
+     * segments and the tail.
+     * 
+     * @param pattern the pattern to locate, not empty
+     * @return pairs {record, offset}, sorted by record and then offset
+     * @throws IllegalArgumentException if the pattern is empty
+     */
+    public List<int[]> locateAll(String pattern) {
+        requireNonEmpty(pattern);
+        List<Segment> snapshot;
+        List<String> tailRecords = new ArrayList<>();
+        int firstTailRecord;
+        synchronized (lock) {
+            snapshot = segments;
+            for (Batch batch : flushing) {
+                tailRecords.addAll(batch.records);
+            }
+            tailRecords.addAll(tail);
+            firstTailRecord = flushing.isEmpty() ? tailFirstRecord : flushing.get(0).firstRecord;
+        }
+        
+        // Segments cover increasing record numbers, so sorting each one's
+        // hits sorts them all
+        List<int[]> result = new ArrayList<>();
+        for (Segment segment : snapshot) {
+            GeneralizedSuffixArray index = segment.index;
+            if (index == null) {
+                result.addAll(scan(segment.records, segment.firstRecord, pattern));
+                continue;
+            }
+            int[] range = index.findRange(pattern);
+            int from = result.size();
+            for (int i = range[0]; i < range[1]; i++) {
+                int record = segment.firstRecord + index.documentOf(i);
+                result.add(new int[] {record, index.offsetOf(i)});
+            }
+            result.subList(from, result.size()).sort((x, y) ->
+                x[0] != y[0] ? Integer.compare(x[0], y[0]) : Integer.compare(x[1], y[1]));
+        }
+        result.addAll(scan(tailRecords, firstTailRecord, pattern));
+        return result;
+    }
+    
+    /**
+     * Finds a pattern in records by direct search.
+     * 
+     * @return pairs {record, offset}, sorted, numbering the records from
+     *         firstRecord
+     */
+    private static List<int[]> scan(List<String> records, int firstRecord, String pattern) {
+        List<int[]> result = new ArrayList<>();
+        for (int r = 0; r < records.size(); r++) {
+            String record = records.get(r);
+            for (int i = record.indexOf(pattern); i >= 0; i = record.indexOf(pattern, i + 1)) {
+                result.add(new int[] {firstRecord + r, i});
+            }
+        }
+        return result;
+    }
+    
+    private static void requireNonEmpty(String pattern) {
+        if (pattern.isEmpty()) {
+            throw new IllegalArgumentException("Pattern must not be empty");
+        }
+    }
+    
+    /**
+     * @param id a record number
+     * @return the record's text
+     */
+    public String getRecord(int id) {
+        List<Segment> snapshot;
+        synchronized (lock) {
+            if (id >= tailFirstRecord) {
+                return tail.get(id - tailFirstRecord);
+            }
+            for (Batch batch : flushing) {
+                if (id >= batch.firstRecord && id < batch.firstRecord + batch.records.size()) {
+                    return batch.records.get(id - batch.firstRecord);
+                }
+            }
+            snapshot = segments;
+        }
+        int lo = 0, hi = snapshot.size() - 1;
+        while (lo < hi) {
+            int mid = (lo + hi + 1) >>> 1;
+            if (snapshot.get(mid).firstRecord <= id) {
+                lo = mid;
+            } else {
+                hi = mid - 1;
+            }
+        }
+        Segment segment = snapshot.get(lo);
+        return segment.record(id - segment.firstRecord);
+    }
+    
+    /**
+     * @return the number of records added
+     */
+    public int size() {
+        synchronized (lock) {
+            return tailFirstRecord + tail.size();
+        }
+    }
+    
+    /**
+     * @return the number of segments, not counting the tail
+     */
+    public int segmentCount() {
+        return segments.size();
+    }
+    
+    /**
+     * Waits until every merge scheduled so far has finished. The merge
+     * thread runs merges in order, so waiting for the last one suffices.
+     * 
+     * @throws IllegalStateException if a segment build or a merge has failed
+     */
+    public void awaitMerges() {
+        Future<?> last;
+        synchronized (lock) {
+            last = lastMerge;
+        }
+        if (last != null) {
+            try {
+                last.get();
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+                throw new IllegalStateException("Interrupted while waiting for merges", e);
+            } catch (ExecutionException e) {
+                // Recorded as the failure below
+            }
+        }
+        checkFailures();
+    }
+    
+    private void checkFailures() {
+        Throwable first;
+        synchronized (lock) {
+            first = failure;
+        }
+        if (first != null) {
+            throw new IllegalStateException("Building a segment failed", first);
+        }
+    }
+    
+    /**
+     * Stops the merge thread after the merges already scheduled. Later
+     * flushes still publish their segments but schedule no merges.
+     * 
+     * @throws IllegalStateException if a segment build or a merge has failed
+     */
+    @Override
+    public void close() {
+        synchronized (lock) {
+            closed = true;
+        }
+        merger.shutdown();
+        checkFailures();
+    }
+}
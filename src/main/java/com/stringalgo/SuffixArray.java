@@ -1,23 +1,84 @@
 package com.stringalgo;
 
+import java.nio.ByteBuffer;
 import java.util.Arrays;
+import java.util.stream.IntStream;
 
 /**
  * Suffix Array implementation with LCP (Longest Common Prefix) array
  * using Kasai's algorithm for efficient construction.
  * 
  * Time Complexity:
- * - SA construction: O(n log n) using prefix doubling
- * - LCP construction: O(n) using Kasai's algorithm
+ * - SA construction: O(n log n) using prefix doubling, O(n) using SA-IS
+ * - LCP construction: O(n) using Kasai's algorithm or the Φ array
  * 
  * Space Complexity: O(n)
  */
 public class SuffixArray {
     
+    /**
+     * Suffix array construction algorithms that can be picked at build time.
+     * All of them produce the same suffix array. RADIX_DOUBLING and SA_IS
+     * allocate buckets up to the largest symbol value, so prefer DC3 for
+     * sparse integer alphabets.
+     */
+    public enum Algorithm {
+        /** Prefix doubling with comparison sorting. */
+        PREFIX_DOUBLING,
+        /** Prefix doubling with counting sort, see {@link RadixDoubling}. */
+        RADIX_DOUBLING,
+        /** Linear-time induced sorting, see {@link SAIS}. */
+        SA_IS,
+        /** Linear-time skew algorithm for any integer alphabet, see {@link com.stringalgo.DC3}. */
+        DC3,
+        /** Multi-threaded radix prefix doubling on all available processors. */
+        PARALLEL_DOUBLING
+    }
+    
+    /**
+     * LCP array construction algorithms that can be picked at build time.
+     * All of them produce the same LCP array.
+     */
+    public enum LCPAlgorithm {
+        /** Kasai's algorithm over the inverse suffix array. */
+        KASAI,
+        /** Permuted LCP through the Φ array, see {@link PhiLCP}. */
+        PHI,
+        /**
+         * Φ algorithm run inside the rank buffer. Only the suffix array and
+         * one more int array stay alive, instead of four with Kasai; the
+         * inverse suffix array is given up to hold the LCP array.
+         */
+        PHI_IN_PLACE
+    }
+    
+    /**
+     * Pattern search strategies. All of them return the same position.
+     */
+    public enum SearchAlgorithm {
+        /** Binary search restarting every comparison at offset 0: O(m log n). */
+        BINARY,
+        /**
+         * Binary search that starts each comparison after the prefix the
+         * pattern shares with both interval bounds (the mlr heuristic).
+         */
+        MLR,
+        /**
+         * Manber-Myers search with precomputed LCP-LR values: O(m + log n).
+         * The table is built on first use, see {@link #buildLCPLR()}.
+         */
+        LCP_LR
+    }
+    
     private String text;
+    private SymbolText symbols;
+    private boolean implicitSentinel;
     private int n;
     private int[] suffixArray;
     private int[] lcp;
+    private CompactLCPArray compactLCP;
+    private LCPLRTable lcpLR;
+    private KmerTable kmerTable;
     private int[] rank;
     
     /**
@@ -27,17 +88,111 @@ public class SuffixArray {
      * @param text the input string
      */
     public SuffixArray(String text) {
+        this(text, false);
+    }
+    
+    /**
+     * Constructs a Suffix Array for the given text, choosing how the end of
+     * the text is marked. With an implicit sentinel the string is stored
+     * without a copy and end of text acts as a virtual symbol smaller than
+     * every character, so texts containing '$' are indexed correctly. There
+     * are then text.length() + 1 suffixes and the empty suffix comes first.
+     * 
+     * @param text the input string
+     * @param implicitSentinel true for a virtual sentinel, false to append
+     *        '$' as {@link #SuffixArray(String)} does
+     */
+    public SuffixArray(String text, boolean implicitSentinel) {
         // Add sentinel if not present
-        if (!text.endsWith("$")) {
-            this.text = text + "$";
-        } else {
+        if (implicitSentinel || text.endsWith("$")) {
             this.text = text;
+        } else {
+            this.text = text + "$";
         }
-        this.n = this.text.length();
+        this.symbols = SymbolText.of(this.text);
+        this.implicitSentinel = implicitSentinel;
+        this.n = this.text.length() + (implicitSentinel ? 1 : 0);
         this.suffixArray = new int[n];
         this.rank = new int[n];
     }
     
+    /**
+     * Constructs a Suffix Array over integer symbols such as token ids.
+     * The array is not copied. End of text acts as a virtual sentinel that
+     * is smaller than every symbol, so there are tokens.length + 1 suffixes
+     * and the empty suffix always comes first.
+     * 
+     * @param tokens the input symbols, each in [0, Integer.MAX_VALUE)
+     */
+    public SuffixArray(int[] tokens) {
+        this(SymbolText.of(tokens, alphabetSize(tokens)));
+    }
+    
+    /**
+     * Constructs a Suffix Array over raw bytes, one unsigned symbol per
+     * byte. The array is not copied and is followed by a virtual sentinel,
+     * as for {@link #SuffixArray(int[])}.
+     * 
+     * @param bytes the input bytes
+     */
+    public SuffixArray(byte[] bytes) {
+        this(SymbolText.of(bytes));
+    }
+    
+    /**
+     * Constructs a Suffix Array over the remaining bytes of a buffer, one
+     * unsigned symbol per byte. The bytes are read in place, so direct and
+     * memory-mapped buffers are never copied onto the heap. A virtual
+     * sentinel follows, as for {@link #SuffixArray(int[])}.
+     * 
+     * @param buffer the input bytes between position and limit
+     */
+    public SuffixArray(ByteBuffer buffer) {
+        this(SymbolText.of(buffer));
+    }
+    
+    /**
+     * Creates a Suffix Array over a character sequence without copying it.
+     * Unlike {@link #SuffixArray(String)} no '$' is appended; a virtual
+     * sentinel follows instead, as for {@link #SuffixArray(int[])}. This is
+     * a named factory rather than a constructor overload, so the sentinel
+     * mode never depends on the static type of the argument; for a String
+     * it matches {@code new SuffixArray(text, true)}.
+     * 
+     * @param text the input characters
+     * @return an unbuilt suffix array over the sequence
+     */
+    public static SuffixArray ofSequence(CharSequence text) {
+        return new SuffixArray(SymbolText.of(text));
+    }
+    
+    private SuffixArray(SymbolText symbols) {
+        this.symbols = symbols;
+        this.implicitSentinel = true;
+        this.n = symbols.length() + 1;
+        this.suffixArray = new int[n];
+        this.rank = new int[n];
+    }
+    
+    private static int alphabetSize(int[] tokens) {
+        int upper = -1;
+        for (int token : tokens) {
+            if (token < 0 || token == Integer.MAX_VALUE) {
+                throw new IllegalArgumentException("Symbol out of range: " + token);
+            }
+            upper = Math.max(upper, token);
+        }
+        return upper + 1;
+    }
+    
+    /**
+     * Returns the symbols the construction algorithms sort: the stored
+     * text, followed by the virtual sentinel when there is one.
+     */
+    private SymbolText constructionText() {
+        return implicitSentinel ? SymbolText.withSentinel(symbols) : symbols;
+    }
+    
     /**
      * Builds the suffix array using prefix doubling algorithm.
      * 
@@ -57,8 +212,10 @@ public class SuffixArray {
         }
         
         // Step 2: Initialize ranks based on character values
+        ensureRank();
+        SymbolText source = constructionText();
         for (int i = 0; i < n; i++) {
-            rank[i] = text.charAt(i);
+            rank[i] = source.symbolAt(i);
         }
         
         // Temporary array for next rank values
@@ -76,11 +233,11 @@ public class SuffixArray {
             // Comparator: compare by (rank[i], rank[i+k])
             Arrays.sort(indices, (a, b) -> {
                 if (rank[a] != rank[b]) {
-                    return rank[a] - rank[b];
+                    return Integer.compare(rank[a], rank[b]);
                 }
                 int rankA = (a + gap < n) ? rank[a + gap] : -1;
                 int rankB = (b + gap < n) ? rank[b + gap] : -1;
-                return rankA - rankB;
+                return Integer.compare(rankA, rankB);
             });
             
             // Update suffix array
@@ -115,6 +272,99 @@ public class SuffixArray {
         }
     }
     
+    /**
+     * Builds the suffix array using the given construction algorithm.
+     * 
+     * @param algorithm the construction algorithm to use
+     */
+    public void buildSuffixArray(Algorithm algorithm) {
+        ensureRank();
+        switch (algorithm) {
+            case PREFIX_DOUBLING:
+                buildSuffixArray();
+                break;
+            case RADIX_DOUBLING:
+                RadixDoubling.sort(constructionText(), suffixArray, rank);
+                break;
+            case SA_IS:
+                SAIS.sort(constructionText(), suffixArray);
+                buildRankFromSuffixArray();
+                break;
+            case DC3:
+                DC3.sort(constructionText(), suffixArray);
+                buildRankFromSuffixArray();
+                break;
+            case PARALLEL_DOUBLING:
+                buildSuffixArrayParallel(Runtime.getRuntime().availableProcessors());
+                break;
+            default:
+                throw new IllegalArgumentException("Unknown algorithm: " + algorithm);
+        }
+    }
+    
+    /**
+     * Builds the suffix array with multi-threaded prefix doubling.
+     * The result is identical to the sequential builders.
+     * 
+     * Time Complexity: O(n log n / threads) plus per-round synchronization
+     * 
+     * @param threads number of worker threads, at least 1
+     */
+    public void buildSuffixArrayParallel(int threads) {
+        ensureRank();
+        ParallelDoubling.sort(constructionText(), suffixArray, rank, threads);
+    }
+    
+    /**
+     * Allocates the rank array again after an in-place LCP build took it
+     * over.
+     */
+    private void ensureRank() {
+        if (rank == null) {
+            rank = new int[n];
+        }
+    }
+    
+    /**
+     * Fills the rank array with the inverse suffix array, the state that
+     * prefix doubling leaves behind.
+     */
+    private void buildRankFromSuffixArray() {
+        for (int i = 0; i < n; i++) {
+            rank[suffixArray[i]] = i;
+        }
+    }
+    
+    /**
+     * Builds the LCP array with the chosen algorithm.
+     * 
+     * Time Complexity: O(n) for every algorithm
+     * 
+     * @param algorithm the LCP construction algorithm to use
+     */
+    public void buildLCP(LCPAlgorithm algorithm) {
+        switch (algorithm) {
+            case KASAI:
+                buildLCP();
+                break;
+            case PHI:
+                lcp = PhiLCP.build(symbols, suffixArray);
+                break;
+            case PHI_IN_PLACE:
+                // Not every builder leaves the inverse suffix array behind,
+                // e.g. prefix doubling stops early for a single suffix
+                ensureRank();
+                buildRankFromSuffixArray();
+                PhiLCP.buildInPlace(symbols, suffixArray, rank);
+                lcp = rank;
+                rank = null;
+                break;
+            default:
+                throw new IllegalArgumentException("Unknown algorithm: " + algorithm);
+        }
+        compactLCP = null;
+    }
+    
     /**
      * Builds the LCP array using Kasai's algorithm.
      * 
@@ -127,6 +377,7 @@ public class SuffixArray {
      */
     public void buildLCP() {
         lcp = new int[n];
+        compactLCP = null;
         
         // Build inverse suffix array (rank array)
         int[] invSA = new int[n];
@@ -135,9 +386,10 @@ public class SuffixArray {
         }
         
         int k = 0; // Length of current LCP
+        int length = symbols.length(); // Excludes a virtual sentinel
         
         // Process suffixes in text order
-        for (int i = 0; i < n; i++) {
+        for (int i = 0; i < length; i++) {
             // Skip the first suffix in sorted order (no predecessor)
             if (invSA[i] == 0) {
                 k = 0;
@@ -148,8 +400,8 @@ public class SuffixArray {
             int j = suffixArray[invSA[i] - 1];
             
             // Extend LCP while characters match
-            while (i + k < n && j + k < n && 
-                   text.charAt(i + k) == text.charAt(j + k)) {
+            while (i + k < length && j + k < length && 
+                   symbols.symbolAt(i + k) == symbols.symbolAt(j + k)) {
                 k++;
             }
             
@@ -164,6 +416,8 @@ public class SuffixArray {
     
     /**
      * Searches for a pattern in the text using binary search on suffix array.
+     * The pattern is compared with the text in place, so a query does not
+     * allocate.
      * 
      * Time Complexity: O(m log n) where m = pattern length
      * 
@@ -171,56 +425,518 @@ public class SuffixArray {
      * @return the starting index of first occurrence, or -1 if not found
      */
     public int search(String pattern) {
+        // Binary search for leftmost occurrence
+        int left = bound(pattern, false);
+        
+        // Check if pattern exists at found position
+        if (left < n && compareWithSuffix(suffixArray[left], pattern) == 0) {
+            return suffixArray[left];
+        }
+        return -1;
+    }
+    
+    /**
+     * Precomputes the suffix array interval of every k-symbol prefix, so
+     * String searches start from the interval of the pattern's first k
+     * symbols instead of the whole array; patterns of at most k symbols
+     * need no binary search at all. The largest k up to maxK whose table
+     * fits in maxBytes is used. Requires the suffix array to be built.
+     * 
+     * Time Complexity: O(n k log σ + (σ+1)^k)
+     * Space Complexity: O((σ+1)^k), at most maxBytes
+     * 
+     * @param maxK the largest prefix length to index, at least 1
+     * @param maxBytes memory budget for the table
+     * @return the prefix length k actually indexed
+     * @throws IllegalArgumentException if the budget is too small for k = 1
+     */
+    public int buildKmerTable(int maxK, long maxBytes) {
+        kmerTable = KmerTable.build(symbols, suffixArray, maxK, maxBytes);
+        return kmerTable.k();
+    }
+    
+    /**
+     * Searches for a sequence of integer symbols using binary search on
+     * the suffix array.
+     * 
+     * Time Complexity: O(m log n) where m = pattern length
+     * 
+     * @param pattern the symbols to search
+     * @return the starting index of first occurrence, or -1 if not found
+     */
+    public int search(int[] pattern) {
+        return search(SymbolText.of(pattern, Integer.MAX_VALUE));
+    }
+    
+    /**
+     * Searches for a byte sequence using binary search on the suffix array.
+     * Bytes compare as unsigned symbols.
+     * 
+     * Time Complexity: O(m log n) where m = pattern length
+     * 
+     * @param pattern the bytes to search
+     * @return the starting index of first occurrence, or -1 if not found
+     */
+    public int search(byte[] pattern) {
+        return search(SymbolText.of(pattern));
+    }
+    
+    /**
+     * Searches for a pattern with the chosen search strategy.
+     * 
+     * Time Complexity: O(m log n) for BINARY and MLR, O(m + log n) for LCP_LR
+     * 
+     * @param pattern the pattern to search
+     * @param algorithm the search strategy
+     * @return the starting index of first occurrence, or -1 if not found
+     */
+    public int search(String pattern, SearchAlgorithm algorithm) {
+        switch (algorithm) {
+            case BINARY:
+                return search(pattern);
+            case MLR:
+                return searchAccelerated(SymbolText.of(pattern), null);
+            case LCP_LR:
+                if (lcpLR == null) {
+                    buildLCPLR();
+                }
+                return searchAccelerated(SymbolText.of(pattern), lcpLR);
+            default:
+                throw new IllegalArgumentException("Unknown algorithm: " + algorithm);
+        }
+    }
+    
+    /**
+     * Precomputes the LCP-LR table used by {@link SearchAlgorithm#LCP_LR},
+     * building the LCP array first if needed.
+     * 
+     * Time Complexity: O(n)
+     * Space Complexity: O(n), two int arrays
+     */
+    public void buildLCPLR() {
+        lcpLR = new LCPLRTable(lcpArray());
+    }
+    
+    private int search(SymbolText pattern) {
         int left = 0, right = n - 1;
-        int m = pattern.length();
         
-        // Binary search for leftmost occurrence
+        // Binary search for leftmost suffix not smaller than the pattern
         while (left < right) {
             int mid = (left + right) / 2;
-            String suffix = text.substring(suffixArray[mid], 
-                                          Math.min(suffixArray[mid] + m, n));
-            
-            if (suffix.compareTo(pattern) < 0) {
+            if (compareWithSuffix(suffixArray[mid], pattern) < 0) {
                 left = mid + 1;
             } else {
                 right = mid;
             }
         }
         
-        // Check if pattern exists at found position
-        if (left < n) {
-            int start = suffixArray[left];
-            if (start + m <= n) {
-                String suffix = text.substring(start, start + m);
-                if (suffix.equals(pattern)) {
-                    return start;
+        if (compareWithSuffix(suffixArray[left], pattern) == 0) {
+            return suffixArray[left];
+        }
+        return -1;
+    }
+    
+    /**
+     * Finds the interval of the suffix array holding every suffix that
+     * starts with the pattern, using two binary searches.
+     * 
+     * Time Complexity: O(m log n)
+     * 
+     * @param pattern the pattern to search
+     * @return {lo, hi}, the half-open interval of matching SA indices;
+     *         empty (lo == hi) if the pattern does not occur
+     */
+    public int[] findRange(String pattern) {
+        return new int[] {bound(pattern, false), bound(pattern, true)};
+    }
+    
+    /**
+     * Finds the suffix array interval of every pattern in a batch, with
+     * the same results as {@link #findRange(String)} per pattern.
+     * 
+     * Lower bounds grow with the patterns in sorted order, so the batch is
+     * solved divide and conquer: the middle pattern is searched first and
+     * splits both the remaining patterns and the suffix array range left
+     * to search for them. All patterns and suffixes between two solved
+     * neighbours share the neighbours' common prefix, so comparisons
+     * start after it. Upper bounds are found the same way, in the order
+     * where a pattern sorts after its own extensions.
+     * 
+     * Time Complexity: O(k log k) pattern comparisons for sorting plus
+     * O(k log(n/k)) probes when the k patterns are spread out, instead of
+     * O(k log n) for independent searches
+     * 
+     * @param patterns the patterns to search
+     * @return {lo, hi} for each pattern, in input order
+     */
+    public int[][] findRanges(String[] patterns) {
+        int k = patterns.length;
+        int[][] ranges = new int[k][2];
+        Integer[] order = new Integer[k];
+        for (int i = 0; i < k; i++) {
+            order[i] = i;
+        }
+        
+        // Step 1: Lower bounds, patterns in lexicographic order
+        Arrays.sort(order, (a, b) -> patterns[a].compareTo(patterns[b]));
+        batchBounds(patterns, order, false, 0, k, 0, n, ranges);
+        
+        // Step 2: Upper bounds, each pattern after all its extensions
+        Arrays.sort(order, (a, b) -> compareExtended(patterns[a], patterns[b]));
+        batchBounds(patterns, order, true, 0, k, 0, n, ranges);
+        
+        return ranges;
+    }
+    
+    /**
+     * Solves the bounds of patterns order[from..to), which are known to
+     * lie in [lo, hi], middle pattern first.
+     */
+    private void batchBounds(String[] patterns, Integer[] order, boolean upper,
+                             int from, int to, int lo, int hi, int[][] ranges) {
+        if (from >= to) {
+            return;
+        }
+        int skip = 0;
+        if (from > 0 && to < order.length) {
+            skip = commonPrefix(patterns[order[from - 1]], patterns[order[to]]);
+        }
+        
+        int mid = (from + to) >>> 1;
+        int result = bound(patterns[order[mid]], upper, lo, hi, skip);
+        ranges[order[mid]][upper ? 1 : 0] = result;
+        
+        batchBounds(patterns, order, upper, from, mid, lo, result, ranges);
+        batchBounds(patterns, order, upper, mid + 1, to, result, hi, ranges);
+    }
+    
+    /**
+     * Orders patterns by their upper bounds: lexicographic, except that a
+     * proper prefix sorts after the strings it is a prefix of.
+     */
+    private static int compareExtended(String a, String b) {
+        int common = commonPrefix(a, b);
+        if (common == a.length() || common == b.length()) {
+            return Integer.compare(b.length(), a.length());
+        }
+        return Character.compare(a.charAt(common), b.charAt(common));
+    }
+    
+    private static int commonPrefix(String a, String b) {
+        int limit = Math.min(a.length(), b.length());
+        int k = 0;
+        while (k < limit && a.charAt(k) == b.charAt(k)) {
+            k++;
+        }
+        return k;
+    }
+    
+    /**
+     * Integer symbol version of {@link #findRange(String)}.
+     * 
+     * @param pattern the symbols to search
+     * @return {lo, hi}, the half-open interval of matching SA indices
+     */
+    public int[] findRange(int[] pattern) {
+        return findRange(SymbolText.of(pattern, Integer.MAX_VALUE));
+    }
+    
+    /**
+     * Byte version of {@link #findRange(String)}; bytes are unsigned.
+     * 
+     * @param pattern the bytes to search
+     * @return {lo, hi}, the half-open interval of matching SA indices
+     */
+    public int[] findRange(byte[] pattern) {
+        return findRange(SymbolText.of(pattern));
+    }
+    
+    private int[] findRange(SymbolText pattern) {
+        return new int[] {bound(pattern, false), bound(pattern, true)};
+    }
+    
+    /**
+     * Counts the occurrences of a pattern without allocating.
+     * 
+     * Time Complexity: O(m log n)
+     * 
+     * @param pattern the pattern to count
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(String pattern) {
+        return bound(pattern, true) - bound(pattern, false);
+    }
+    
+    /**
+     * @param pattern the symbols to count
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(int[] pattern) {
+        int[] range = findRange(pattern);
+        return range[1] - range[0];
+    }
+    
+    /**
+     * @param pattern the bytes to count
+     * @return the number of occurrences, overlapping ones included
+     */
+    public int count(byte[] pattern) {
+        int[] range = findRange(pattern);
+        return range[1] - range[0];
+    }
+    
+    /**
+     * Streams the start position of every occurrence of a pattern, read
+     * lazily from its suffix array interval. Positions come in suffix
+     * array order, not text order.
+     * 
+     * Time Complexity: O(m log n + occ)
+     * 
+     * @param pattern the pattern to locate
+     * @return the positions of all occurrences
+     */
+    public IntStream locateAll(String pattern) {
+        return locate(findRange(pattern));
+    }
+    
+    /**
+     * @param pattern the symbols to locate
+     * @return the positions of all occurrences, in suffix array order
+     */
+    public IntStream locateAll(int[] pattern) {
+        return locate(findRange(pattern));
+    }
+    
+    /**
+     * @param pattern the bytes to locate
+     * @return the positions of all occurrences, in suffix array order
+     */
+    public IntStream locateAll(byte[] pattern) {
+        return locate(findRange(pattern));
+    }
+    
+    private IntStream locate(int[] range) {
+        int[] sa = suffixArray;
+        return IntStream.range(range[0], range[1]).map(i -> sa[i]);
+    }
+    
+    /**
+     * Binary search over [0, n] for the first suffix that is not smaller
+     * than the pattern or, for the upper bound, the first one that is
+     * greater and does not start with it. A k-mer table narrows the range
+     * to the bucket of the pattern's first k symbols.
+     */
+    private int bound(String pattern, boolean upper) {
+        if (kmerTable != null) {
+            int lo = kmerTable.lower(pattern);
+            if (lo >= 0) {
+                int hi = kmerTable.upper(pattern);
+                if (pattern.length() <= kmerTable.k()) {
+                    return upper ? hi : lo;
                 }
+                return bound(pattern, upper, lo, hi, kmerTable.k());
+            }
+        }
+        return bound(pattern, upper, 0, n, 0);
+    }
+    
+    /**
+     * Bound search restricted to [lo, hi], for suffixes known to share the
+     * first skip symbols of the pattern.
+     */
+    private int bound(String pattern, boolean upper, int lo, int hi, int skip) {
+        int left = lo, right = hi;
+        while (left < right) {
+            int mid = (left + right) >>> 1;
+            int cmp = compareWithSuffix(suffixArray[mid], pattern, skip);
+            if (cmp < 0 || (upper && cmp == 0)) {
+                left = mid + 1;
+            } else {
+                right = mid;
             }
         }
+        return left;
+    }
+    
+    private int bound(SymbolText pattern, boolean upper) {
+        int left = 0, right = n;
+        while (left < right) {
+            int mid = (left + right) >>> 1;
+            int cmp = compareWithSuffix(suffixArray[mid], pattern);
+            if (cmp < 0 || (upper && cmp == 0)) {
+                left = mid + 1;
+            } else {
+                right = mid;
+            }
+        }
+        return left;
+    }
+    
+    /**
+     * Binary search for the leftmost suffix not smaller than the pattern,
+     * keeping the length of the prefix the pattern shares with each bound.
+     * Every suffix between the bounds shares at least the smaller of the
+     * two, so comparisons skip it. With an LCP-LR table, a mid whose LCP
+     * with the closer bound decides the comparison is not compared at all.
+     * 
+     * @param table LCP-LR values, or null for the mlr heuristic alone
+     */
+    private int searchAccelerated(SymbolText pattern, LCPLRTable table) {
+        int m = pattern.length();
+        
+        // Suffixes up to left are smaller than the pattern, those from
+        // right on are not; -1 and n are virtual bounds
+        int left = -1, right = n;
+        int leftMatch = 0, rightMatch = 0;
         
+        while (right - left > 1) {
+            int mid = (left + right) >>> 1;
+            int match = Math.min(leftMatch, rightMatch);
+            
+            if (table != null && leftMatch > rightMatch) {
+                int shared = table.left(mid);
+                if (shared > leftMatch) {
+                    left = mid;
+                    continue;
+                } else if (shared < leftMatch) {
+                    right = mid;
+                    rightMatch = shared;
+                    continue;
+                }
+                match = leftMatch;
+            } else if (table != null && rightMatch > leftMatch) {
+                int shared = table.right(mid);
+                if (shared > rightMatch) {
+                    right = mid;
+                    continue;
+                } else if (shared < rightMatch) {
+                    left = mid;
+                    leftMatch = shared;
+                    continue;
+                }
+                match = rightMatch;
+            }
+            
+            int start = suffixArray[mid];
+            match = matchLength(start, pattern, match);
+            if (suffixLess(start, pattern, match)) {
+                left = mid;
+                leftMatch = match;
+            } else {
+                right = mid;
+                rightMatch = match;
+            }
+        }
+        
+        if (right < n && rightMatch == m) {
+            return suffixArray[right];
+        }
         return -1;
     }
     
+    /**
+     * @return the length of the common prefix of the pattern and the
+     *         suffix at start, given that the first from symbols match
+     */
+    private int matchLength(int start, SymbolText pattern, int from) {
+        int length = symbols.length();
+        int m = pattern.length();
+        int k = from;
+        while (k < m && start + k < length &&
+               symbols.symbolAt(start + k) == pattern.symbolAt(k)) {
+            k++;
+        }
+        return k;
+    }
+    
+    /**
+     * @return whether the suffix at start, sharing exactly match symbols
+     *         with the pattern, sorts before the pattern
+     */
+    private boolean suffixLess(int start, SymbolText pattern, int match) {
+        if (match == pattern.length()) {
+            return false;
+        }
+        return start + match >= symbols.length() ||
+               symbols.symbolAt(start + match) < pattern.symbolAt(match);
+    }
+    
+    /**
+     * Compares the suffix at the given position, cut to the pattern length,
+     * with the pattern in place, without creating substrings. A suffix that
+     * ends early compares smaller.
+     * 
+     * @return negative, zero or positive; zero means the pattern is a
+     *         prefix of the suffix
+     */
+    private int compareWithSuffix(int start, String pattern) {
+        return compareWithSuffix(start, pattern, 0);
+    }
+    
+    /**
+     * Same as {@link #compareWithSuffix(int, String)} for a suffix known
+     * to start with the first from symbols of the pattern.
+     */
+    private int compareWithSuffix(int start, String pattern, int from) {
+        int length = symbols.length();
+        int m = pattern.length();
+        for (int k = from; k < m; k++) {
+            if (start + k >= length) {
+                return -1;
+            }
+            int a = symbols.symbolAt(start + k);
+            int b = pattern.charAt(k);
+            if (a != b) {
+                return a < b ? -1 : 1;
+            }
+        }
+        return 0;
+    }
+    
+    /**
+     * Compares the suffix at the given position, cut to the pattern length,
+     * with the pattern. A suffix that ends early compares smaller.
+     * 
+     * @return negative, zero or positive; zero means the pattern is a
+     *         prefix of the suffix
+     */
+    private int compareWithSuffix(int start, SymbolText pattern) {
+        int length = symbols.length();
+        int m = pattern.length();
+        for (int k = 0; k < m; k++) {
+            if (start + k >= length) {
+                return -1;
+            }
+            int a = symbols.symbolAt(start + k);
+            int b = pattern.symbolAt(k);
+            if (a != b) {
+                return a < b ? -1 : 1;
+            }
+        }
+        return 0;
+    }
+    
     /**
      * Counts the number of distinct substrings in the text.
      * 
      * Formula: Total substrings - Duplicate substrings
      *        = n(n+1)/2 - Σ(lcp[i])
+     * where n is the number of stored symbols, so a virtual sentinel
+     * contributes nothing.
      * 
      * Time Complexity: O(n)
      * 
      * @return number of distinct substrings
      */
     public long countDistinctSubstrings() {
-        if (lcp == null) {
-            buildLCP();
-        }
+        LCPArray lcp = lcpArray();
         
-        long totalSubstrings = (long) n * (n + 1) / 2;
+        int length = symbols.length();
+        long totalSubstrings = (long) length * (length + 1) / 2;
         long duplicates = 0;
         
         for (int i = 0; i < n; i++) {
-            duplicates += lcp[i];
+            duplicates += lcp.get(i);
         }
         
         return totalSubstrings - duplicates;
@@ -234,16 +950,14 @@ public class SuffixArray {
      * @return the longest repeated substring
      */
     public String longestRepeatedSubstring() {
-        if (lcp == null) {
-            buildLCP();
-        }
+        LCPArray lcp = lcpArray();
         
         int maxLen = 0;
         int maxIndex = 0;
         
         for (int i = 0; i < n; i++) {
-            if (lcp[i] > maxLen) {
-                maxLen = lcp[i];
+            if (lcp.get(i) > maxLen) {
+                maxLen = lcp.get(i);
                 maxIndex = i;
             }
         }
@@ -252,8 +966,68 @@ public class SuffixArray {
             return "";
         }
         
-        return text.substring(suffixArray[maxIndex], 
-                             suffixArray[maxIndex] + maxLen);
+        return substring(suffixArray[maxIndex], 
+                         suffixArray[maxIndex] + maxLen);
+    }
+    
+    /**
+     * Returns text positions [start, end) as a String. Integer symbols are
+     * written as one char each when the alphabet fits in a char, and as
+     * space separated numbers otherwise.
+     */
+    private String substring(int start, int end) {
+        if (text != null) {
+            return text.substring(start, end);
+        }
+        
+        boolean wide = symbols.alphabetSize() > Character.MAX_VALUE + 1;
+        StringBuilder sb = new StringBuilder();
+        for (int i = start; i < end; i++) {
+            if (wide) {
+                if (i > start) {
+                    sb.append(' ');
+                }
+                sb.append(symbols.symbolAt(i));
+            } else {
+                sb.append((char) symbols.symbolAt(i));
+            }
+        }
+        return sb.toString();
+    }
+    
+    /**
+     * Replaces the LCP array with a {@link CompactLCPArray} that stores
+     * values below 255 in one byte each, building the LCP array first if
+     * needed. Afterwards {@link #getLCP()} returns null and the values are
+     * read through {@link #getLCPArray()}.
+     */
+    public void compactLCP() {
+        if (compactLCP != null) {
+            return;
+        }
+        if (lcp == null) {
+            buildLCP();
+        }
+        compactLCP = new CompactLCPArray(lcp);
+        lcp = null;
+    }
+    
+    /**
+     * Returns the LCP values in whatever form they are stored, building
+     * them with Kasai's algorithm if needed.
+     */
+    private LCPArray lcpArray() {
+        if (lcp == null && compactLCP == null) {
+            buildLCP();
+        }
+        return getLCPArray();
+    }
+    
+    /**
+     * @return the stored symbols, without a virtual sentinel
+     */
+    SymbolText symbols() {
+        return symbols;
     }
     
     // Getters
@@ -261,10 +1035,28 @@ public class SuffixArray {
         return suffixArray;
     }
     
+    /**
+     * @return the LCP array, or null if it was not built or was compacted
+     */
     public int[] getLCP() {
         return lcp;
     }
     
+    /**
+     * @return read access to the LCP values in plain or compact form, or
+     *         null if the LCP array was not built
+     */
+    public LCPArray getLCPArray() {
+        if (compactLCP != null) {
+            return compactLCP;
+        }
+        return lcp != null ? LCPArray.of(lcp) : null;
+    }
+    
+    /**
+     * @return the indexed text, including the '$' sentinel unless it is
+     *         implicit, or null when the text was not given as a String
+     */
     public String getText() {
         return text;
     }
@@ -279,15 +1071,19 @@ public class SuffixArray {
     @Override
     public String toString() {
         StringBuilder sb = new StringBuilder();
-        sb.append("Suffix Array for: \"").append(text).append("\"\n");
+        int length = symbols.length();
+        String sentinel = implicitSentinel ? "$" : "";
+        sb.append("Suffix Array for: \"").append(substring(0, length))
+          .append(sentinel).append("\"\n");
         sb.append("Index | SA[i] | LCP[i] | Suffix\n");
         sb.append("------|-------|--------|-------\n");
         
+        LCPArray lcp = getLCPArray();
         for (int i = 0; i < n; i++) {
             sb.append(String.format("%5d | %5d | %6d | %s\n", 
                 i, suffixArray[i], 
-                (lcp != null ? lcp[i] : -1),
-                text.substring(suffixArray[i])));
+                (lcp != null ? lcp.get(i) : -1),
+                substring(suffixArray[i], length) + sentinel));
         }
         
         return sb.toString();
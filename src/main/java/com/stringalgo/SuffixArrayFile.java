@@ -0,0 +1,127 @@
+package com.stringalgo;
+
+import java.io.Closeable;
+import java.io.IOException;
+import java.io.RandomAccessFile;
+import java.nio.file.Path;
+
+/**
+ * Query side of {@link ExternalSuffixArrayBuilder}: answers searches
+ * from a text file and its suffix array file without loading either.
+ * 
+ * Every binary search step reads one suffix array entry and at most m
+ * text bytes with positioned reads. Instances are not thread-safe.
+ * 
+ * Time Complexity: O(m log n) per search, with O(log n) random reads
+ * Space Complexity: O(m)
+ */
+public final class SuffixArrayFile implements Closeable {
+    
+    private final RandomAccessFile text;
+    private final RandomAccessFile suffixArray;
+    private final long textLength;
+    private final int size;
+    private byte[] buffer = new byte[0];
+    
+    /**
+     * Opens a text and the suffix array file built from it.
+     * 
+     * @param textFile the indexed text
+     * @param suffixArrayFile the builder's output for that text
+     * @throws IOException if the files cannot be opened, do not match, or
+     *         the text is too large for int positions
+     */
+    public SuffixArrayFile(Path textFile, Path suffixArrayFile) throws IOException {
+        this.text = new RandomAccessFile(textFile.toFile(), "r");
+        this.suffixArray = new RandomAccessFile(suffixArrayFile.toFile(), "r");
+        this.textLength = text.length();
+        
+        // Positions and the suffix count are ints
+        if (textLength >= Integer.MAX_VALUE) {
+            close();
+            throw new IOException("Text too large: " + textLength + " bytes");
+        }
+        if (suffixArray.length() != (textLength + 1) * Integer.BYTES) {
+            close();
+            throw new IOException("Suffix array file does not match the text: "
+                                  + suffixArrayFile);
+        }
+        this.size = (int) (textLength + 1);
+    }
+    
+    /**
+     * @return the number of suffixes, including the virtual sentinel
+     */
+    public int size() {
+        return size;
+    }
+    
+    /**
+     * @param i index in suffix array order
+     * @return the text position of the i-th smallest suffix
+     * @throws IOException if reading fails
+     */
+    public int get(int i) throws IOException {
+        if (i < 0 || i >= size) {
+            throw new IndexOutOfBoundsException("Index " + i + " out of range [0, " + size + ")");
+        }
+        suffixArray.seek((long) i * Integer.BYTES);
+        return suffixArray.readInt();
+    }
+    
+    /**
+     * Searches for a pattern using binary search on the suffix array file.
+     * 
+     * @param pattern the bytes to search
+     * @return the starting index of first occurrence, or -1 if not found
+     * @throws IOException if reading fails
+     */
+    public int search(byte[] pattern) throws IOException {
+        int left = 0, right = size - 1;
+        
+        // Binary search for leftmost suffix not smaller than the pattern
+        while (left < right) {
+            int mid = (left + right) / 2;
+            if (compareWithSuffix(get(mid), pattern) < 0) {
+                left = mid + 1;
+            } else {
+                right = mid;
+            }
+        }
+        
+        int start = get(left);
+        return compareWithSuffix(start, pattern) == 0 ? start : -1;
+    }
+    
+    /**
+     * Compares the suffix at the given position, cut to the pattern length,
+     * with the pattern as unsigned bytes. A suffix that ends early compares
+     * smaller.
+     */
+    private int compareWithSuffix(int start, byte[] pattern) throws IOException {
+        int available = (int) Math.min(pattern.length, textLength - start);
+        if (buffer.length < available) {
+            buffer = new byte[pattern.length];
+        }
+        text.seek(start);
+        text.readFully(buffer, 0, available);
+        
+        for (int k = 0; k < available; k++) {
+            int a = buffer[k] & 0xFF;
+            int b = pattern[k] & 0xFF;
+            if (a != b) {
+                return a < b ? -1 : 1;
+            }
+        }
+        return available < pattern.length ? -1 : 0;
+    }
+    
+    @Override
+    public void close() throws IOException {
+        try {
+            text.close();
+        } finally {
+            suffixArray.close();
+        }
+    }
+}
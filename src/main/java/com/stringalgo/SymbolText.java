@@ -0,0 +1,144 @@
+package com.stringalgo;
+
+import java.nio.ByteBuffer;
+
+/**
+ * Read-only view of a sequence of integer symbols.
+ * 
+ * Construction algorithms read their input through this interface so the
+ * same code runs over the original text and over the reduced integer
+ * strings produced during recursion.
+ */
+interface SymbolText {
+    
+    /**
+     * @return the number of symbols in the sequence
+     */
+    int length();
+    
+    /**
+     * @param i position in [0, length())
+     * @return the symbol at position i, in [0, alphabetSize())
+     */
+    int symbolAt(int i);
+    
+    /**
+     * @return exclusive upper bound on the symbol values
+     */
+    int alphabetSize();
+    
+    /**
+     * Wraps a character sequence without copying it.
+     */
+    static SymbolText of(CharSequence text) {
+        return new SymbolText() {
+            @Override
+            public int length() {
+                return text.length();
+            }
+            
+            @Override
+            public int symbolAt(int i) {
+                return text.charAt(i);
+            }
+            
+            @Override
+            public int alphabetSize() {
+                return Character.MAX_VALUE + 1;
+            }
+        };
+    }
+    
+    /**
+     * Wraps a byte array without copying it. Bytes are unsigned symbols.
+     */
+    static SymbolText of(byte[] bytes) {
+        return new SymbolText() {
+            @Override
+            public int length() {
+                return bytes.length;
+            }
+            
+            @Override
+            public int symbolAt(int i) {
+                return bytes[i] & 0xFF;
+            }
+            
+            @Override
+            public int alphabetSize() {
+                return 1 << Byte.SIZE;
+            }
+        };
+    }
+    
+    /**
+     * Wraps the remaining bytes of a buffer without copying them. Later
+     * changes to the buffer's position or limit do not affect the view.
+     */
+    static SymbolText of(ByteBuffer buffer) {
+        ByteBuffer view = buffer.slice();
+        int length = view.remaining();
+        return new SymbolText() {
+            @Override
+            public int length() {
+                return length;
+            }
+            
+            @Override
+            public int symbolAt(int i) {
+                return view.get(i) & 0xFF;
+            }
+            
+            @Override
+            public int alphabetSize() {
+                return 1 << Byte.SIZE;
+            }
+        };
+    }
+    
+    /**
+     * Wraps an integer array without copying it.
+     */
+    static SymbolText of(int[] symbols, int alphabetSize) {
+        return new SymbolText() {
+            @Override
+            public int length() {
+                return symbols.length;
+            }
+            
+            @Override
+            public int symbolAt(int i) {
+                return symbols[i];
+            }
+            
+            @Override
+            public int alphabetSize() {
+                return alphabetSize;
+            }
+        };
+    }
+    
+    /**
+     * Appends a virtual sentinel that is smaller than every symbol of the
+     * given text. The other symbols are shifted up by one to make room.
+     */
+    static SymbolText withSentinel(SymbolText text) {
+        int length = text.length();
+        return new SymbolText() {
+            @Override
+            public int length() {
+                return length + 1;
+            }
+            
+            @Override
+            public int symbolAt(int i) {
+                return (i == length) ? 0 : text.symbolAt(i) + 1;
+            }
+            
+            @Override
+            public int alphabetSize() {
+                return text.alphabetSize() + 1;
+            }
+        };
+    }
+}
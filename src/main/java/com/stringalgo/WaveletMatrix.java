@@ -0,0 +1,186 @@
+package com.stringalgo;
+
+/**
+ * Wavelet matrix of Claude, Navarro and Ordóñez (2015): rank, select and
+ * access over a sequence of integer symbols in O(log σ) time, using about
+ * n log σ bits.
+ * 
+ * Symbols are split into their bits from the most significant one down.
+ * Level l stores the l-th most significant bit of every symbol, in the
+ * order that results from stably sorting the sequence by its higher bits,
+ * zeros before ones. A
+ * query follows one position interval down the levels with one bit vector
+ * rank per level: an interval of zeros maps to the same rank among the
+ * zeros, an interval of ones to the zero count plus its rank among the ones.
+ * 
+ * Each level is a bit vector with the number of ones before every 64-bit
+ * word, so bit vector rank is O(1) and select O(log n).
+ * 
+ * Time Complexity: O(n log σ) construction, O(log σ) rank and access,
+ *                  O(log σ log n) select
+ * Space Complexity: 1.5 n bits per level, ⌈log σ⌉ levels
+ */
+final class WaveletMatrix {
+    
+    private final int n;
+    private final int levels;
+    private final long[][] bits;
+    private final int[][] ones;
+    private final int[] zeros;
+    
+    /**
+     * @param values the sequence, every value in [0, sigma)
+     * @param sigma the alphabet size, at least 1
+     */
+    WaveletMatrix(int[] values, int sigma) {
+        this.n = values.length;
+        this.levels = Math.max(1, 32 - Integer.numberOfLeadingZeros(sigma - 1));
+        int words = (n >>> 6) + 1;
+        this.bits = new long[levels][words];
+        this.ones = new int[levels][words];
+        this.zeros = new int[levels];
+        
+        int[] current = values.clone();
+        int[] next = new int[n];
+        for (int level = 0; level < levels; level++) {
+            int shift = levels - 1 - level;
+            long[] vector = bits[level];
+            
+            // Step 1: Bits of this level, and the number of zeros
+            int zeroCount = 0;
+            for (int i = 0; i < n; i++) {
+                if (((current[i] >>> shift) & 1) != 0) {
+                    vector[i >>> 6] |= 1L << i;
+                } else {
+                    zeroCount++;
+                }
+            }
+            zeros[level] = zeroCount;
+            
+            // Step 2: Ones before each word
+            int[] counts = ones[level];
+            for (int w = 1; w < words; w++) {
+                counts[w] = counts[w - 1] + Long.bitCount(vector[w - 1]);
+            }
+            
+            // Step 3: Stable partition by the bit for the next level
+            int z = 0, o = zeroCount;
+            for (int i = 0; i < n; i++) {
+                if (((current[i] >>> shift) & 1) != 0) {
+                    next[o++] = current[i];
+                } else {
+                    next[z++] = current[i];
+                }
+            }
+            int[] swap = current;
+            current = next;
+            next = swap;
+        }
+    }
+    
+    /**
+     * @return the number of ones among the first i bits of a level
+     */
+    private int rank1(int level, int i) {
+        return ones[level][i >>> 6] + Long.bitCount(bits[level][i >>> 6] & ((1L << i) - 1));
+    }
+    
+    /**
+     * @return the position of the k-th (0-based) bit of the given value in
+     *         a level, which must exist
+     */
+    private int select(int level, int bit, int k) {
+        int[] counts = ones[level];
+        
+        // Last word with at most k matching bits before it
+        int lo = 0, hi = counts.length - 1;
+        while (lo < hi) {
+            int mid = (lo + hi + 1) >>> 1;
+            int before = (bit == 1) ? counts[mid] : 64 * mid - counts[mid];
+            if (before <= k) {
+                lo = mid;
+            } else {
+                hi = mid - 1;
+            }
+        }
+        long word = (bit == 1) ? bits[level][lo] : ~bits[level][lo];
+        int remaining = k - ((bit == 1) ? counts[lo] : 64 * lo - counts[lo]);
+        for (int j = 0; j < remaining; j++) {
+            word &= word - 1;
+        }
+        return 64 * lo + Long.numberOfTrailingZeros(word);
+    }
+    
+    /**
+     * @return the position that interval boundary i of a level maps to on
+     *         the next level, following the symbols with the given bit
+     */
+    private int step(int level, int bit, int i) {
+        return (bit == 0) ? i - rank1(level, i) : zeros[level] + rank1(level, i);
+    }
+    
+    /**
+     * @return the number of occurrences of c in positions [0, i)
+     */
+    int rank(int c, int i) {
+        int start = 0, end = i;
+        for (int level = 0; level < levels; level++) {
+            int bit = (c >>> (levels - 1 - level)) & 1;
+            start = step(level, bit, start);
+            end = step(level, bit, end);
+        }
+        return end - start;
+    }
+    
+    /**
+     * @return the symbol at position i
+     */
+    int access(int i) {
+        int c = 0;
+        for (int level = 0; level < levels; level++) {
+            int bit = (int) (bits[level][i >>> 6] >>> i) & 1;
+            c = (c << 1) | bit;
+            i = step(level, bit, i);
+        }
+        return c;
+    }
+    
+    /**
+     * @return the position of the k-th (0-based) occurrence of c, or -1 if
+     *         c occurs at most k times
+     */
+    int select(int c, int k) {
+        if (k < 0 || c < 0 || c >>> levels != 0 || k >= rank(c, n)) {
+            return -1;
+        }
+        
+        // Find where the occurrences of c start on the last level, then
+        // map the k-th one back up level by level
+        int start = 0;
+        for (int level = 0; level < levels; level++) {
+            start = step(level, (c >>> (levels - 1 - level)) & 1, start);
+        }
+        int position = start + k;
+        for (int level = levels - 1; level >= 0; level--) {
+            int bit = (c >>> (levels - 1 - level)) & 1;
+            position = (bit == 0)
+                ? select(level, 0, position)
+                : select(level, 1, position - zeros[level]);
+        }
+        return position;
+    }
+    
+    /**
+     * @return the sequence length
+     */
+    int length() {
+        return n;
+    }
+    
+    /**
+     * @return the approximate heap footprint in bytes
+     */
+    long memoryBytes() {
+        return levels * ((long) bits[0].length * (Long.BYTES + Integer.BYTES)) + 4L * levels;
+    }
+}
@@ -0,0 +1,119 @@
+package com.stringalgo;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.DisplayName;
+import static org.junit.jupiter.api.Assertions.*;
+
+import java.util.*;
+
+/**
+ * Tests for the appendable suffix array.
+ */
+public class AppendableSuffixArrayTest {
+    
+    @Test
+    @DisplayName("Queries after appends match the whole text")
+    public void testAppendsMatchNaive() {
+        AppendableSuffixArray index =
+            new AppendableSuffixArray(TestTexts.randomString(101, 500, "ab"));
+        StringBuilder expected = new StringBuilder(index.getText());
+        Random rand = new Random(7);
+        
+        for (int round = 0; round < 200; round++) {
+            int length = rand.nextInt(round % 50 == 0 ? 3000 : 40);
+            String chunk = TestTexts.randomString(rand, length, "ab");
+            index.append(chunk);
+            expected.append(chunk);
+            assertEquals(expected.length(), index.length());
+            
+            for (int q = 0; q < 5; q++) {
+                String pattern = TestTexts.randomString(rand, 1 + rand.nextInt(8), "ab");
+                List<Integer> positions = occurrences(expected.toString(), pattern);
+                assertEquals(positions.size(), index.count(pattern), "pattern \"" + pattern + "\"");
+                assertArrayEquals(positions.stream().mapToInt(Integer::intValue).toArray(),
+                                  index.locateAll(pattern).sorted().toArray());
+            }
+        }
+        assertEquals(expected.toString(), index.getText());
+    }
+    
+    @Test
+    @DisplayName("Occurrences across the end of a level are found")
+    public void testBoundaryCrossing() {
+        // Long enough not to be absorbed by the appended level
+        String padding = "-".repeat(30);
+        AppendableSuffixArray index = new AppendableSuffixArray(padding + "hello wor");
+        index.append("ld, hello world");
+        assertEquals("ld, hello world".length(), index.deltaLength());
+        
+        assertEquals(2, index.count("world"));
+        assertEquals(2, index.levelCount());
+        assertArrayEquals(new int[] {36, 49}, index.locateAll("world").sorted().toArray());
+        assertEquals(2, index.count("or"));
+        assertEquals(2, index.count("o w"));
+        assertEquals(0, index.count("worlds"));
+        assertEquals(index.length() + 1, index.count(""));
+        
+        index.merge();
+        assertEquals(0, index.deltaLength());
+        assertEquals(2, index.count("world"));
+    }
+    
+    @Test
+    @DisplayName("Levels stay logarithmic in number as the text grows")
+    public void testLevels() {
+        AppendableSuffixArray index = new AppendableSuffixArray();
+        assertEquals(0, index.count("a"));
+        index.append("");
+        assertEquals(0, index.length());
+        assertEquals(0, index.levelCount());
+        
+        String text = TestTexts.randomString(102, 20_000, "ACGT");
+        for (int i = 0; i < text.length(); i += 100) {
+            index.append(text.substring(i, i + 100));
+            assertEquals(occurrences(text.substring(0, i + 100), "ACG").size(), index.count("ACG"));
+            int bound = 32 - Integer.numberOfLeadingZeros(index.length());
+            assertTrue(index.levelCount() <= bound, "levels: " + index.levelCount());
+        }
+        assertEquals(occurrences(text, "ACGTA").size(), index.count("ACGTA"));
+        
+        index.merge();
+        assertEquals(1, index.levelCount());
+        assertEquals(0, index.deltaLength());
+    }
+    
+    @Test
+    @DisplayName("Alternating appends and queries rebuild each symbol O(log n) times")
+    public void testAlternatingAppendsAndQueries() {
+        AppendableSuffixArray index =
+            new AppendableSuffixArray(TestTexts.randomString(103, 1000, "ab"));
+        StringBuilder expected = new StringBuilder(index.getText());
+        Random rand = new Random(11);
+        for (int i = 0; i < 20_000; i++) {
+            String symbol = rand.nextBoolean() ? "a" : "b";
+            index.append(symbol);
+            expected.append(symbol);
+            if (i % 1000 == 0) {
+                assertEquals(occurrences(expected.toString(), "abba").size(), index.count("abba"));
+            } else {
+                index.count("ab");
+            }
+        }
+        
+        // Each symbol is built once and then only by runs that grow its
+        // level by half, so at most 1 + log_1.5(n) times
+        int n = index.length();
+        double bound = n * (1 + Math.log(n) / Math.log(1.5));
+        assertTrue(index.rebuiltSymbols() <= bound,
+                   index.rebuiltSymbols() + " symbols rebuilt for n = " + n);
+        assertEquals(occurrences(expected.toString(), "aab").size(), index.count("aab"));
+    }
+    
+    private List<Integer> occurrences(String text, String pattern) {
+        List<Integer> positions = new ArrayList<>();
+        for (int i = text.indexOf(pattern); i >= 0; i = text.indexOf(pattern, i + 1)) {
+            positions.add(i);
+        }
+        return positions;
+    }
+}
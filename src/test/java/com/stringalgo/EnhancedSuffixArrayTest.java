@@ -0,0 +1,157 @@
+package com.stringalgo;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.DisplayName;
+import static org.junit.jupiter.api.Assertions.*;
+
+import java.util.*;
+
+/**
+ * Tests for the child table and traversals of the enhanced suffix array.
+ */
+public class EnhancedSuffixArrayTest {
+    
+    @Test
+    @DisplayName("Top-down search matches binary search")
+    public void testFindRangeMatchesBinarySearch() {
+        String[] texts = {
+            "banana", "a", "", "mississippi", "cost: $5 or $10$", "aaaaaaaa",
+            TestTexts.randomString(201, 5000, "ACGT"), TestTexts.randomString(202, 3000, "ab")
+        };
+        Random rand = new Random(5);
+        
+        for (String text : texts) {
+            for (boolean implicitSentinel : new boolean[] {false, true}) {
+                SuffixArray sa = new SuffixArray(text, implicitSentinel);
+                sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+                EnhancedSuffixArray esa = new EnhancedSuffixArray(sa);
+                
+                for (int q = 0; q < 300; q++) {
+                    String pattern;
+                    if (!text.isEmpty() && q % 4 != 0) {
+                        int start = rand.nextInt(text.length());
+                        pattern = text.substring(start,
+                            Math.min(text.length(), start + rand.nextInt(20)));
+                    } else {
+                        pattern = TestTexts.randomString(rand, q % 6, "ACGTabns$");
+                    }
+                    
+                    int[] expected = sa.findRange(pattern);
+                    int[] actual = esa.findRange(pattern);
+                    assertEquals(expected[1] - expected[0], actual[1] - actual[0],
+                                 "\"" + pattern + "\" in text of length " + text.length());
+                    if (expected[1] > expected[0]) {
+                        assertArrayEquals(expected, actual);
+                    }
+                }
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("Top-down search on integer symbols")
+    public void testFindRangeIntegerSymbols() {
+        int[] tokens = {9, 4, 9, 4, 9, 1_000_000, 9, 4};
+        SuffixArray sa = new SuffixArray(tokens);
+        sa.buildSuffixArray(SuffixArray.Algorithm.DC3);
+        EnhancedSuffixArray esa = new EnhancedSuffixArray(sa);
+        
+        int[] range = esa.findRange(new int[] {9, 4});
+        assertEquals(3, range[1] - range[0]);
+        assertEquals(1, esa.findRange(new int[] {1_000_000, 9})[1]
+                     - esa.findRange(new int[] {1_000_000, 9})[0]);
+        int[] missing = esa.findRange(new int[] {4, 4});
+        assertEquals(missing[0], missing[1]);
+    }
+    
+    @Test
+    @DisplayName("Bottom-up traversal reports exactly the lcp-intervals")
+    public void testForEachIntervalMatchesBruteForce() {
+        String[] texts = {"banana", "mississippi", "abababab", "a", "ACGTTGCAACGT"};
+        
+        for (String text : texts) {
+            SuffixArray sa = new SuffixArray(text, true);
+            sa.buildSuffixArray();
+            sa.buildLCP();
+            int[] lcp = sa.getLCP();
+            int n = lcp.length;
+            
+            Set<List<Integer>> expected = new HashSet<>();
+            for (int lo = 0; lo < n; lo++) {
+                for (int hi = lo + 2; hi <= n; hi++) {
+                    int min = Integer.MAX_VALUE;
+                    for (int i = lo + 1; i < hi; i++) {
+                        min = Math.min(min, lcp[i]);
+                    }
+                    boolean leftClosed = lo == 0 || lcp[lo] < min;
+                    boolean rightClosed = hi == n || lcp[hi] < min;
+                    if (leftClosed && rightClosed) {
+                        expected.add(Arrays.asList(min, lo, hi));
+                    }
+                }
+            }
+            
+            List<List<Integer>> actual = new ArrayList<>();
+            new EnhancedSuffixArray(sa).forEachInterval(
+                (l, lo, hi) -> actual.add(Arrays.asList(l, lo, hi)));
+            
+            assertEquals(expected.size(), actual.size(), text);
+            assertEquals(expected, new HashSet<>(actual), text);
+            
+            // Children come before their parent, the root comes last
+            assertEquals(Arrays.asList(0, 0, n), actual.get(actual.size() - 1));
+        }
+    }
+    
+    @Test
+    @DisplayName("Root is reported once, with the prefix every suffix shares")
+    public void testRootInterval() {
+        // An explicit '$' text whose suffixes all start with '$'
+        SuffixArray shared = new SuffixArray("$$$$");
+        shared.buildSuffixArray();
+        List<List<Integer>> intervals = new ArrayList<>();
+        new EnhancedSuffixArray(shared).forEachInterval(
+            (l, lo, hi) -> intervals.add(Arrays.asList(l, lo, hi)));
+        assertEquals(Arrays.asList(Arrays.asList(3, 2, 4), Arrays.asList(2, 1, 4),
+                                   Arrays.asList(1, 0, 4)), intervals);
+        
+        SuffixArray runs = new SuffixArray("aaaa", true);
+        runs.buildSuffixArray();
+        intervals.clear();
+        new EnhancedSuffixArray(runs).forEachInterval(
+            (l, lo, hi) -> intervals.add(Arrays.asList(l, lo, hi)));
+        assertEquals(Arrays.asList(Arrays.asList(3, 3, 5), Arrays.asList(2, 2, 5),
+                                   Arrays.asList(1, 1, 5), Arrays.asList(0, 0, 5)), intervals);
+    }
+    
+    @Test
+    @DisplayName("Bottom-up traversal finds the longest substring repeated three times")
+    public void testRepeatAnalysis() {
+        String text = TestTexts.randomString(203, 2000, "ACG");
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        
+        int[] best = {0};
+        new EnhancedSuffixArray(sa).forEachInterval((lcp, lo, hi) -> {
+            if (hi - lo >= 3) {
+                best[0] = Math.max(best[0], lcp);
+            }
+        });
+        
+        int expected = 0;
+        for (int length = 1; length <= text.length(); length++) {
+            Map<String, Integer> counts = new HashMap<>();
+            boolean found = false;
+            for (int i = 0; i + length <= text.length(); i++) {
+                if (counts.merge(text.substring(i, i + length), 1, Integer::sum) >= 3) {
+                    found = true;
+                }
+            }
+            if (!found) {
+                break;
+            }
+            expected = length;
+        }
+        assertEquals(expected, best[0]);
+    }
+}
@@ -0,0 +1,120 @@
+package com.stringalgo;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.io.TempDir;
+import static org.junit.jupiter.api.Assertions.*;
+
+import java.io.*;
+import java.nio.file.*;
+import java.util.*;
+
+/**
+ * Tests for disk-backed suffix array construction and the file reader.
+ */
+public class ExternalSuffixArrayBuilderTest {
+    
+    @TempDir
+    Path tempDir;
+    
+    @Test
+    @DisplayName("External builder matches the in-memory suffix array")
+    public void testMatchesInMemory() throws IOException {
+        byte[] bytes = TestTexts.randomBytes(701, 20000, 4);
+        
+        // A small run length forces many spilled runs per round
+        int[] sa = buildExternal(bytes, 1000);
+        
+        SuffixArray expected = new SuffixArray(toSymbols(bytes));
+        expected.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        assertArrayEquals(expected.getSuffixArray(), sa);
+    }
+    
+    @Test
+    @DisplayName("External builder handles tiny and repetitive inputs")
+    public void testEdgeCases() throws IOException {
+        assertArrayEquals(new int[] {0}, buildExternal(new byte[0], 4));
+        assertArrayEquals(new int[] {1, 0}, buildExternal(new byte[] {7}, 4));
+        assertArrayEquals(new int[] {3, 2, 1, 0}, buildExternal(new byte[] {9, 9, 9}, 2));
+        
+        byte[] banana = "banana".getBytes("US-ASCII");
+        assertArrayEquals(new int[] {6, 5, 3, 1, 0, 4, 2}, buildExternal(banana, 3));
+        
+        byte[] high = {(byte) 0xFF, 0x01, (byte) 0x80};
+        assertArrayEquals(new int[] {3, 1, 2, 0}, buildExternal(high, 16));
+    }
+    
+    @Test
+    @DisplayName("SuffixArrayFile searches the built index")
+    public void testSuffixArrayFileSearch() throws IOException {
+        byte[] bytes = "the quick brown fox jumps over the lazy dog".getBytes("US-ASCII");
+        Path textFile = tempDir.resolve("text.bin");
+        Path saFile = tempDir.resolve("text.sa");
+        Files.write(textFile, bytes);
+        new ExternalSuffixArrayBuilder(tempDir, 8).build(textFile, saFile);
+        
+        try (SuffixArrayFile index = new SuffixArrayFile(textFile, saFile)) {
+            assertEquals(bytes.length + 1, index.size());
+            assertEquals(bytes.length, index.get(0));
+            
+            int pos = index.search("fox".getBytes("US-ASCII"));
+            assertEquals(16, pos);
+            assertEquals(-1, index.search("cat".getBytes("US-ASCII")));
+            assertEquals(-1, index.search("dogs".getBytes("US-ASCII")));
+            
+            int the = index.search("the".getBytes("US-ASCII"));
+            assertTrue(the == 0 || the == 31);
+        }
+    }
+    
+    @Test
+    @DisplayName("SuffixArrayFile rejects texts too large for int positions")
+    public void testSuffixArrayFileTooLarge() throws IOException {
+        Path textFile = tempDir.resolve("huge.bin");
+        Path saFile = tempDir.resolve("huge.sa");
+        // Sparse where the file system allows; only the length is read
+        try (RandomAccessFile file = new RandomAccessFile(textFile.toFile(), "rw")) {
+            file.setLength(Integer.MAX_VALUE);
+        }
+        Files.write(saFile, new byte[0]);
+        IOException e = assertThrows(IOException.class,
+                                     () -> new SuffixArrayFile(textFile, saFile));
+        assertTrue(e.getMessage().contains("too large"), e.getMessage());
+    }
+    
+    @Test
+    @DisplayName("Run buffers are sized to the text, not the run length")
+    public void testHugeRunLength() throws IOException {
+        byte[] banana = "banana".getBytes("US-ASCII");
+        // Buffers of Integer.MAX_VALUE records could never be allocated
+        assertArrayEquals(new int[] {6, 5, 3, 1, 0, 4, 2},
+                          buildExternal(banana, Integer.MAX_VALUE));
+        assertArrayEquals(new int[] {0}, buildExternal(new byte[0], Integer.MAX_VALUE));
+    }
+    
+    private int[] buildExternal(byte[] bytes, int runLength) throws IOException {
+        Path textFile = Files.createTempFile(tempDir, "text", ".bin");
+        Path saFile = Files.createTempFile(tempDir, "text", ".sa");
+        Files.write(textFile, bytes);
+        
+        new ExternalSuffixArrayBuilder(tempDir, runLength).build(textFile, saFile);
+        
+        int[] sa = new int[bytes.length + 1];
+        try (DataInputStream in = new DataInputStream(
+                 new BufferedInputStream(Files.newInputStream(saFile)))) {
+            for (int i = 0; i < sa.length; i++) {
+                sa[i] = in.readInt();
+            }
+            assertEquals(-1, in.read(), "Suffix array file has trailing data");
+        }
+        return sa;
+    }
+    
+    private int[] toSymbols(byte[] bytes) {
+        int[] symbols = new int[bytes.length];
+        for (int i = 0; i < bytes.length; i++) {
+            symbols[i] = bytes[i] & 0xFF;
+        }
+        return symbols;
+    }
+}
@@ -0,0 +1,307 @@
+package com.stringalgo;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.DisplayName;
+import static org.junit.jupiter.api.Assertions.*;
+
+import java.util.*;
+
+/**
+ * Tests for the FM-index.
+ */
+public class FMIndexTest {
+    
+    @Test
+    @DisplayName("Backward search counts match the suffix array")
+    public void testCountMatchesSuffixArray() {
+        String[] texts = {
+            "banana", "mississippi", "a", "aaaaaaaaaa", "cost: $5 or $10$",
+            TestTexts.randomString(301, 3000, "AB"), TestTexts.randomString(302, 2000, "ACGT"),
+            TestTexts.randomString(303, 1000, "abcdefghij ")
+        };
+        Random rand = new Random(7);
+        
+        for (String text : texts) {
+            for (boolean implicit : new boolean[] {false, true}) {
+                SuffixArray sa = new SuffixArray(text, implicit);
+                sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+                String indexed = sa.getText();
+                
+                for (int sampleRate : new int[] {1, 3, 64}) {
+                    FMIndex fm = new FMIndex(sa, sampleRate);
+                    assertEquals(indexed.length() + 1, fm.size());
+                    
+                    for (int q = 0; q < 300; q++) {
+                        int start = rand.nextInt(indexed.length());
+                        int end = Math.min(indexed.length(), start + 1 + rand.nextInt(8));
+                        String pattern = indexed.substring(start, end);
+                        assertEquals(sa.count(pattern), fm.count(pattern),
+                                     "\"" + pattern + "\" in text of length " + indexed.length());
+                    }
+                    assertEquals(0, fm.count("#"));
+                    assertEquals(sa.count(indexed), fm.count(indexed));
+                    assertEquals(0, fm.count(indexed + indexed.charAt(0)));
+                }
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("Sampled suffix array locates every occurrence")
+    public void testLocateMatchesSuffixArray() {
+        String[] texts = {
+            "banana", "mississippi", "a", "cost: $5 or $10$",
+            TestTexts.randomString(304, 3000, "AB"), TestTexts.randomString(305, 2000, "ACGT")
+        };
+        Random rand = new Random(11);
+        
+        for (String text : texts) {
+            for (boolean implicit : new boolean[] {false, true}) {
+                SuffixArray sa = new SuffixArray(text, implicit);
+                sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+                String indexed = sa.getText();
+                
+                for (int locateSampleRate : new int[] {1, 2, 7, 32, 1000}) {
+                    FMIndex fm = new FMIndex(sa, 16, locateSampleRate);
+                    for (int q = 0; q < 100; q++) {
+                        int start = rand.nextInt(indexed.length());
+                        int end = Math.min(indexed.length(), start + 1 + rand.nextInt(6));
+                        String pattern = indexed.substring(start, end);
+                        assertArrayEquals(sa.locateAll(pattern).sorted().toArray(),
+                                          fm.locateAll(pattern).sorted().toArray(),
+                                          "\"" + pattern + "\", s = " + locateSampleRate);
+                    }
+                    assertEquals(0, fm.locateAll("#").count());
+                }
+            }
+        }
+        
+        int[] tokens = {7, 1000, 7, 1000, 7, 3, 70000, 7, 1000};
+        SuffixArray tokenSA = new SuffixArray(tokens);
+        tokenSA.buildSuffixArray();
+        FMIndex tokenFM = new FMIndex(tokenSA, 4, 3);
+        assertArrayEquals(new int[] {0, 2},
+                          tokenFM.locateAll(new int[] {7, 1000, 7}).sorted().toArray());
+    }
+    
+    @Test
+    @DisplayName("Sparser suffix array samples take less memory")
+    public void testLocateSampleRateMemory() {
+        String text = TestTexts.randomString(306, 50_000, "ACGT");
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        
+        long previous = Long.MAX_VALUE;
+        for (int locateSampleRate : new int[] {1, 4, 16, 64}) {
+            long bytes = new FMIndex(sa, 64, locateSampleRate).memoryBytes();
+            assertTrue(bytes < previous, "s = " + locateSampleRate + " takes " + bytes + " bytes");
+            previous = bytes;
+        }
+        assertThrows(IllegalArgumentException.class, () -> new FMIndex(sa, 64, 0));
+    }
+    
+    @Test
+    @DisplayName("Integer and byte alphabets")
+    public void testIntegerAlphabet() {
+        int[] tokens = {7, 1000, 7, 1000, 7, 3, 70000, 7, 1000};
+        SuffixArray sa = new SuffixArray(tokens);
+        sa.buildSuffixArray();
+        FMIndex fm = new FMIndex(sa);
+        
+        assertEquals(2, fm.count(new int[] {7, 1000, 7}));
+        assertEquals(1, fm.count(new int[] {70000}));
+        assertEquals(4, fm.count(new int[] {7}));
+        assertEquals(0, fm.count(new int[] {1000, 3}));
+        assertEquals(0, fm.count(new int[] {5}));
+        
+        byte[] bytes = new byte[256];
+        for (int i = 0; i < bytes.length; i++) {
+            bytes[i] = (byte) (i % 200 + 50);
+        }
+        SuffixArray byteSA = new SuffixArray(bytes);
+        byteSA.buildSuffixArray();
+        FMIndex byteFM = new FMIndex(byteSA);
+        assertEquals(2, byteFM.count(new int[] {60, 61}));
+        assertEquals(1, byteFM.count(new int[] {249, 50}));
+    }
+    
+    @Test
+    @DisplayName("Index is much smaller than the text and suffix array")
+    public void testMemoryFootprint() {
+        String text = TestTexts.randomString(307, 100_000, "ACGT");
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        FMIndex fm = new FMIndex(sa);
+        
+        long textAndSA = 2L * text.length() + 4L * sa.getSuffixArray().length;
+        assertTrue(fm.memoryBytes() * 3 < textAndSA,
+                   "FM-index takes " + fm.memoryBytes() + " bytes");
+    }
+    
+    @Test
+    @DisplayName("Sparse occurrence samples over ASCII text span several superblocks")
+    public void testAsciiFootprint() {
+        StringBuilder alphabet = new StringBuilder();
+        for (char c = ' '; c < ' ' + 90; c++) {
+            alphabet.append(c);
+        }
+        String text = TestTexts.randomString(308, 150_000, alphabet.toString());
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        FMIndex fm = new FMIndex(sa, 1024);
+        assertFalse(fm.usesWaveletMatrix());
+        
+        Random rand = new Random(5);
+        for (int q = 0; q < 300; q++) {
+            int start = rand.nextInt(text.length() - 3);
+            String pattern = text.substring(start, start + 1 + rand.nextInt(3));
+            assertEquals(sa.count(pattern), fm.count(pattern), "pattern at " + start);
+        }
+        
+        long textAndSA = 2L * text.length() + 4L * sa.getSuffixArray().length;
+        assertTrue(fm.memoryBytes() < textAndSA,
+                   "FM-index takes " + fm.memoryBytes() + " bytes");
+    }
+    
+    @Test
+    @DisplayName("Rank structure is chosen by estimated size")
+    public void testRankStructureChoice() {
+        assertTrue(FMIndex.useWaveletMatrix(5, 64));
+        assertTrue(FMIndex.useWaveletMatrix(5, 1 << 20));
+        assertTrue(FMIndex.useWaveletMatrix(91, 64));
+        assertFalse(FMIndex.useWaveletMatrix(91, 1024));
+        assertTrue(FMIndex.useWaveletMatrix(201, 64));
+        assertFalse(FMIndex.useWaveletMatrix(201, 1 << 20));
+        assertTrue(FMIndex.useWaveletMatrix(300, 1 << 20));
+        
+        // DNA takes about 0.56 bytes per row in the wavelet matrix, 1.16 as bytes
+        String text = TestTexts.randomString(309, 10_000, "ACGT");
+        SuffixArray dna = new SuffixArray(text, true);
+        dna.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        FMIndex dnaFM = new FMIndex(dna);
+        assertTrue(dnaFM.usesWaveletMatrix());
+        assertTrue(dnaFM.memoryBytes() < text.length(),
+                   "FM-index takes " + dnaFM.memoryBytes() + " bytes");
+        
+        // Byte data over 200 symbols stays below the bytes and their suffix array
+        Random rand = new Random(9);
+        byte[] bytes = new byte[100_000];
+        for (int i = 0; i < bytes.length; i++) {
+            bytes[i] = (byte) rand.nextInt(200);
+        }
+        SuffixArray sa = new SuffixArray(bytes);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        FMIndex fm = new FMIndex(sa);
+        assertTrue(fm.usesWaveletMatrix());
+        assertEquals(sa.count(new int[] {bytes[500] & 0xFF, bytes[501] & 0xFF}),
+                     fm.count(new int[] {bytes[500] & 0xFF, bytes[501] & 0xFF}));
+        long bytesAndSA = bytes.length + 4L * sa.getSuffixArray().length;
+        assertTrue(fm.memoryBytes() * 2 < bytesAndSA,
+                   "FM-index takes " + fm.memoryBytes() + " bytes");
+    }
+    
+    @Test
+    @DisplayName("The empty pattern matches like in the suffix array")
+    public void testEmptyPattern() {
+        for (String text : new String[] {"banana", "a", "", "cost: $5$"}) {
+            for (boolean implicit : new boolean[] {false, true}) {
+                SuffixArray sa = new SuffixArray(text, implicit);
+                sa.buildSuffixArray();
+                FMIndex fm = new FMIndex(sa, 4, 2);
+                String mode = "\"" + text + "\", implicit " + implicit;
+                assertEquals(sa.count(""), fm.count(""), mode);
+                assertEquals(sa.count(new int[0]), fm.count(new int[0]), mode);
+                assertArrayEquals(sa.locateAll("").sorted().toArray(),
+                                  fm.locateAll("").sorted().toArray(), mode);
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("Invalid sample rates are rejected")
+    public void testInvalidInput() {
+        SuffixArray sa = new SuffixArray("banana");
+        sa.buildSuffixArray();
+        assertThrows(IllegalArgumentException.class, () -> new FMIndex(sa, 0));
+    }
+    
+    @Test
+    @DisplayName("Wavelet matrix rank, select and access match a linear scan")
+    public void testWaveletMatrix() {
+        Random rand = new Random(42);
+        for (int sigma : new int[] {1, 2, 3, 5, 64, 1000}) {
+            for (int n : new int[] {0, 1, 63, 64, 65, 500}) {
+                int[] values = new int[n];
+                for (int i = 0; i < n; i++) {
+                    values[i] = rand.nextInt(sigma);
+                }
+                WaveletMatrix wavelet = new WaveletMatrix(values, sigma);
+                assertEquals(n, wavelet.length());
+                
+                for (int i = 0; i < n; i++) {
+                    assertEquals(values[i], wavelet.access(i));
+                }
+                for (int q = 0; q < 200; q++) {
+                    int c = rand.nextInt(sigma);
+                    int i = rand.nextInt(n + 1);
+                    int expected = 0;
+                    for (int k = 0; k < i; k++) {
+                        if (values[k] == c) {
+                            expected++;
+                        }
+                    }
+                    assertEquals(expected, wavelet.rank(c, i), "sigma = " + sigma + ", n = " + n);
+                }
+                for (int c = 0; c < Math.min(sigma, 20); c++) {
+                    int k = 0;
+                    for (int i = 0; i < n; i++) {
+                        if (values[i] == c) {
+                            assertEquals(i, wavelet.select(c, k++));
+                        }
+                    }
+                    assertEquals(-1, wavelet.select(c, k));
+                }
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("Large alphabets use the wavelet matrix")
+    public void testLargeAlphabet() {
+        Random rand = new Random(13);
+        StringBuilder sb = new StringBuilder();
+        for (int i = 0; i < 5000; i++) {
+            sb.append((char) (0x4E00 + rand.nextInt(i % 7 == 0 ? 2000 : 40)));
+        }
+        String text = sb.toString();
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        FMIndex fm = new FMIndex(sa, 64, 8);
+        
+        for (int q = 0; q < 500; q++) {
+            int start = rand.nextInt(text.length());
+            int end = Math.min(text.length(), start + 1 + rand.nextInt(4));
+            String pattern = text.substring(start, end);
+            assertEquals(sa.count(pattern), fm.count(pattern), "pattern at " + start);
+            assertArrayEquals(sa.locateAll(pattern).sorted().toArray(),
+                              fm.locateAll(pattern).sorted().toArray());
+        }
+        assertEquals(0, fm.count("a"));
+        
+        // Bits per row grow with log σ instead of the per-symbol counts
+        long occurrenceSamples = 4L * 1000 * text.length() / 64;
+        assertTrue(fm.memoryBytes() < occurrenceSamples,
+                   "FM-index takes " + fm.memoryBytes() + " bytes");
+        
+        int[] tokens = new int[300];
+        for (int i = 0; i < tokens.length; i++) {
+            tokens[i] = (i * 7) % 300;
+        }
+        SuffixArray tokenSA = new SuffixArray(tokens);
+        tokenSA.buildSuffixArray();
+        FMIndex tokenFM = new FMIndex(tokenSA);
+        assertEquals(1, tokenFM.count(new int[] {7, 14, 21}));
+        assertEquals(0, tokenFM.count(new int[] {14, 7}));
+        assertArrayEquals(new int[] {3}, tokenFM.locateAll(new int[] {21, 28}).toArray());
+    }
+}
@@ -0,0 +1,183 @@
+package com.stringalgo;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.DisplayName;
+import static org.junit.jupiter.api.Assertions.*;
+
+import java.util.*;
+
+/**
+ * Tests for the generalized suffix array over document collections.
+ */
+public class GeneralizedSuffixArrayTest {
+    
+    @Test
+    @DisplayName("Counts and hit positions match every document")
+    public void testOccurrencesMatchDocuments() {
+        List<String> documents = randomDocuments(601, 300, 30, "ab");
+        Random rand = new Random(7);
+        
+        for (SuffixArray.Algorithm algorithm : new SuffixArray.Algorithm[] {
+                 SuffixArray.Algorithm.SA_IS, SuffixArray.Algorithm.DC3}) {
+            GeneralizedSuffixArray gsa = new GeneralizedSuffixArray(documents, algorithm);
+            assertEquals(documents.size(), gsa.documentCount());
+            
+            for (int q = 0; q < 200; q++) {
+                String pattern = TestTexts.randomString(rand, 1 + rand.nextInt(5), "ab");
+                Set<String> expected = new HashSet<>();
+                for (int d = 0; d < documents.size(); d++) {
+                    String document = documents.get(d);
+                    int i = document.indexOf(pattern);
+                    while (i >= 0) {
+                        expected.add(d + ":" + i);
+                        i = document.indexOf(pattern, i + 1);
+                    }
+                }
+                
+                int[] range = gsa.findRange(pattern);
+                Set<String> actual = new HashSet<>();
+                for (int i = range[0]; i < range[1]; i++) {
+                    actual.add(gsa.documentOf(i) + ":" + gsa.offsetOf(i));
+                }
+                assertEquals(expected, actual, "pattern \"" + pattern + "\"");
+                assertEquals(expected.size(), gsa.count(pattern));
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("LCP values stop at document boundaries")
+    public void testLCPWithinDocuments() {
+        List<String> documents = Arrays.asList("banana", "banana", "", "ananas", "nab", "banana");
+        GeneralizedSuffixArray gsa = new GeneralizedSuffixArray(documents);
+        int[] sa = gsa.getSuffixArray();
+        int[] lcp = gsa.getLCP();
+        
+        assertEquals(-1, gsa.documentOf(0));
+        for (int i = 1; i < sa.length; i++) {
+            int d = gsa.documentOf(i);
+            int offset = gsa.offsetOf(i);
+            String suffix = documents.get(d).substring(offset);
+            assertEquals(sa[i], sumLengths(documents, d) + offset);
+            
+            if (i > 1) {
+                String previous =
+                    documents.get(gsa.documentOf(i - 1)).substring(gsa.offsetOf(i - 1));
+                assertTrue(previous.compareTo(suffix) <= 0);
+                int common = 0;
+                while (common < previous.length() && common < suffix.length() &&
+                       previous.charAt(common) == suffix.charAt(common)) {
+                    common++;
+                }
+                assertEquals(common, lcp[i], "SA index " + i);
+            }
+        }
+        assertEquals(3, gsa.count("banana"));
+        assertEquals(0, gsa.count("nanaa"));
+        assertEquals(0, gsa.count("abb"));
+    }
+    
+    @Test
+    @DisplayName("Documents round trip and empty collections are rejected")
+    public void testDocumentsAndInvalidInput() {
+        List<String> documents = Arrays.asList("héllo", "", "wörld 中");
+        GeneralizedSuffixArray gsa = new GeneralizedSuffixArray(documents);
+        for (int d = 0; d < documents.size(); d++) {
+            assertEquals(documents.get(d), gsa.getDocument(d));
+        }
+        assertEquals(1, gsa.count("中"));
+        assertEquals(3, gsa.count("l"));
+        assertEquals(gsa.getSuffixArray().length, gsa.getDocumentArray().length);
+        
+        assertThrows(IllegalArgumentException.class,
+                     () -> new GeneralizedSuffixArray(Collections.emptyList()));
+    }
+    
+    @Test
+    @DisplayName("Document listing reports each containing document once")
+    public void testListDocuments() {
+        List<String> documents = randomDocuments(602, 500, 20, "abc");
+        GeneralizedSuffixArray gsa = new GeneralizedSuffixArray(documents);
+        DocumentListing listing = new DocumentListing(gsa);
+        Random rand = new Random(17);
+        
+        for (int q = 0; q < 300; q++) {
+            String pattern = TestTexts.randomString(rand, 1 + rand.nextInt(4), "abcd");
+            List<Integer> expected = new ArrayList<>();
+            for (int d = 0; d < documents.size(); d++) {
+                if (documents.get(d).contains(pattern)) {
+                    expected.add(d);
+                }
+            }
+            
+            int[] listed = listing.listDocuments(pattern);
+            Arrays.sort(listed);
+            assertArrayEquals(expected.stream().mapToInt(Integer::intValue).toArray(), listed,
+                              "pattern \"" + pattern + "\"");
+        }
+    }
+    
+    @Test
+    @DisplayName("Top-k documents by frequency")
+    public void testTopDocuments() {
+        List<String> documents = Arrays.asList(
+            "abab", "ababab", "b", "ab", "abababab", "xyz", "ab ab ab");
+        GeneralizedSuffixArray gsa = new GeneralizedSuffixArray(documents);
+        DocumentListing listing = new DocumentListing(gsa);
+        
+        int[][] top = listing.topDocuments("ab", 3);
+        assertArrayEquals(new int[] {4, 4}, top[0]);
+        assertArrayEquals(new int[] {1, 3}, top[1]);
+        assertArrayEquals(new int[] {6, 3}, top[2]);
+        
+        assertEquals(5, listing.topDocuments("ab", 10).length);
+        assertEquals(0, listing.topDocuments("abc", 2).length);
+        assertEquals(2, listing.frequency("ab", 0));
+        assertEquals(0, listing.frequency("ab", 5));
+        assertThrows(IllegalArgumentException.class, () -> listing.topDocuments("ab", 0));
+        
+        List<String> random = randomDocuments(603, 400, 40, "ab");
+        DocumentListing randomListing = new DocumentListing(new GeneralizedSuffixArray(random));
+        int[][] best = randomListing.topDocuments("aab", 5);
+        for (int i = 0; i < best.length; i++) {
+            assertEquals(occurrences(random.get(best[i][0]), "aab"), best[i][1]);
+            if (i > 0) {
+                assertTrue(best[i - 1][1] > best[i][1] ||
+                           (best[i - 1][1] == best[i][1] && best[i - 1][0] < best[i][0]));
+            }
+        }
+        int threshold = best[best.length - 1][1];
+        int better = 0;
+        for (String document : random) {
+            if (occurrences(document, "aab") > threshold) {
+                better++;
+            }
+        }
+        assertTrue(better < best.length);
+    }
+    
+    private int occurrences(String document, String pattern) {
+        int count = 0;
+        for (int i = document.indexOf(pattern); i >= 0; i = document.indexOf(pattern, i + 1)) {
+            count++;
+        }
+        return count;
+    }
+    
+    private int sumLengths(List<String> documents, int count) {
+        int sum = 0;
+        for (int d = 0; d < count; d++) {
+            sum += documents.get(d).length() + 1;
+        }
+        return sum;
+    }
+    
+    private List<String> randomDocuments(long seed, int count, int maxLength, String alphabet) {
+        Random rand = new Random(seed);
+        List<String> documents = new ArrayList<>();
+        for (int d = 0; d < count; d++) {
+            documents.add(TestTexts.randomString(rand, rand.nextInt(maxLength + 1), alphabet));
+        }
+        return documents;
+    }
+}
@@ -0,0 +1,94 @@
+package com.stringalgo;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.DisplayName;
+import static org.junit.jupiter.api.Assertions.*;
+
+import java.util.*;
+
+/**
+ * Tests for range minimum queries and longest common extensions.
+ */
+public class LCEIndexTest {
+    
+    @Test
+    @DisplayName("Range minimum matches a linear scan")
+    public void testRangeMinimum() {
+        Random rand = new Random(42);
+        for (int n : new int[] {1, 2, 63, 64, 65, 200, 1000, 5000}) {
+            int[] values = new int[n];
+            for (int i = 0; i < n; i++) {
+                values[i] = rand.nextInt(n % 3 == 0 ? 3 : 1000);
+            }
+            RangeMinimum rmq = new RangeMinimum(i -> values[i], n);
+            
+            for (int q = 0; q < 2000; q++) {
+                int lo = rand.nextInt(n);
+                int hi = lo + rand.nextInt(n - lo);
+                int expected = Integer.MAX_VALUE;
+                for (int i = lo; i <= hi; i++) {
+                    expected = Math.min(expected, values[i]);
+                }
+                int position = rmq.argmin(lo, hi);
+                assertTrue(position >= lo && position <= hi);
+                assertEquals(expected, values[position], "n = " + n + ", [" + lo + ", " + hi + "]");
+                assertEquals(expected, rmq.min(lo, hi));
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("LCE matches direct comparison of the suffixes")
+    public void testLCEMatchesNaive() {
+        String[] texts = {
+            "banana", "a", "mississippi", "aaaaaaaaaa",
+            TestTexts.randomString(401, 3000, "AB"), TestTexts.randomString(402, 2000, "ACGT")
+        };
+        Random rand = new Random(9);
+        
+        for (String text : texts) {
+            SuffixArray sa = new SuffixArray(text, true);
+            sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+            LCEIndex index = new LCEIndex(sa);
+            
+            for (int q = 0; q < 2000; q++) {
+                int i = rand.nextInt(text.length() + 1);
+                int j = (q % 10 == 0) ? i : rand.nextInt(text.length() + 1);
+                assertEquals(naiveLCE(text, i, j), index.lce(i, j),
+                             "lce(" + i + ", " + j + ") in text of length " + text.length());
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("LCE on a compacted LCP array and batch queries")
+    public void testBatchAndCompactLCP() {
+        String unit = TestTexts.randomString(403, 600, "ACGT");
+        String text = unit + "A" + unit + "C" + unit;
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        sa.compactLCP();
+        LCEIndex index = new LCEIndex(sa);
+        
+        assertEquals(600, index.lce(0, 601));
+        assertEquals(text.length(), index.lce(0, 0));
+        
+        int[] first = {0, 601, 5, 1202, 0};
+        int[] second = {601, 1202, 606, 1202, text.length()};
+        int[] result = index.lce(first, second);
+        for (int k = 0; k < first.length; k++) {
+            assertEquals(naiveLCE(text, first[k], second[k]), result[k]);
+        }
+        assertThrows(IllegalArgumentException.class,
+                     () -> index.lce(new int[] {0}, new int[0]));
+    }
+    
+    private int naiveLCE(String text, int i, int j) {
+        int k = 0;
+        while (i + k < text.length() && j + k < text.length() &&
+               text.charAt(i + k) == text.charAt(j + k)) {
+            k++;
+        }
+        return k;
+    }
+}
@@ -0,0 +1,181 @@
+package com.stringalgo;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.DisplayName;
+import org.junit.jupiter.api.io.TempDir;
+import static org.junit.jupiter.api.Assertions.*;
+
+import java.io.*;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.file.*;
+import java.util.*;
+
+/**
+ * Tests for the memory-mapped index file format.
+ */
+public class MappedSuffixArrayTest {
+    
+    @TempDir
+    Path tempDir;
+    
+    @Test
+    @DisplayName("Mapped index answers String queries like the in-memory index")
+    public void testStringRoundTrip() throws IOException {
+        String text = TestTexts.randomString(501, 5000, "ACGT");
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        sa.buildLCP();
+        
+        Path file = tempDir.resolve("dna.saix");
+        MappedSuffixArray.write(sa, file);
+        try (MappedSuffixArray mapped = new MappedSuffixArray(file)) {
+            assertEquals(text.length(), mapped.length());
+            assertEquals(text.length() + 1, mapped.size());
+            for (int i = 0; i < mapped.size(); i++) {
+                assertEquals(sa.getSuffixArray()[i], mapped.get(i));
+            }
+            
+            for (String pattern : new String[] {"A", "ACG", "GATTACA", "TTTT", "X", ""}) {
+                assertEquals(sa.count(pattern), mapped.count(pattern), pattern);
+                assertArrayEquals(sa.findRange(pattern), mapped.findRange(pattern), pattern);
+                assertArrayEquals(sa.locateAll(pattern).toArray(),
+                                  mapped.locateAll(pattern).toArray(), pattern);
+                int position = mapped.search(pattern);
+                if (sa.search(pattern) < 0) {
+                    assertEquals(-1, position);
+                } else {
+                    assertTrue(text.startsWith(pattern, position));
+                }
+            }
+            
+            LCPArray expected = sa.getLCPArray();
+            LCPArray lcp = mapped.getLCPArray();
+            assertEquals(expected.length(), lcp.length());
+            for (int i = 0; i < lcp.length(); i++) {
+                assertEquals(expected.get(i), lcp.get(i));
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("Legacy sentinel, byte and wide integer texts round trip")
+    public void testOtherTexts() throws IOException {
+        SuffixArray legacy = new SuffixArray("banana");
+        legacy.buildSuffixArray();
+        Path legacyFile = tempDir.resolve("legacy.saix");
+        MappedSuffixArray.write(legacy, legacyFile);
+        try (MappedSuffixArray mapped = new MappedSuffixArray(legacyFile)) {
+            assertEquals(legacy.getSuffixArray().length, mapped.size());
+            assertEquals(3, mapped.count("a"));
+            assertEquals(2, mapped.count("ana"));
+            assertEquals(1, mapped.count("a$"));
+            assertNull(mapped.getLCPArray());
+        }
+        
+        byte[] bytes = {5, -1, 5, -1, 5, 0};
+        SuffixArray byteIndex = new SuffixArray(bytes);
+        byteIndex.buildSuffixArray();
+        Path byteFile = tempDir.resolve("bytes.saix");
+        MappedSuffixArray.write(byteIndex, byteFile);
+        try (MappedSuffixArray mapped = new MappedSuffixArray(byteFile)) {
+            assertEquals(2, mapped.count(new byte[] {5, -1}));
+            assertEquals(1, mapped.count(new byte[] {-1, 5, 0}));
+            assertEquals(1, mapped.search(new byte[] {-1, 5, -1}));
+            assertEquals(-1, mapped.search(new byte[] {0, 5}));
+        }
+        
+        int[] tokens = {70000, 3, 70000, 3, 123456, 3};
+        SuffixArray wide = new SuffixArray(tokens);
+        wide.buildSuffixArray();
+        Path wideFile = tempDir.resolve("wide.saix");
+        MappedSuffixArray.write(wide, wideFile);
+        try (MappedSuffixArray mapped = new MappedSuffixArray(wideFile)) {
+            assertArrayEquals(wide.getSuffixArray(), toArray(mapped));
+            assertEquals(2, mapped.count(new int[] {70000, 3}));
+            assertEquals(3, mapped.count(new int[] {3}));
+            assertArrayEquals(wide.findRange(new int[] {3, 123456}),
+                              mapped.findRange(new int[] {3, 123456}));
+        }
+    }
+    
+    @Test
+    @DisplayName("Sections mapped in many small windows answer the same queries")
+    public void testChunkedMapping() throws IOException {
+        String text = TestTexts.randomString(502, 3000, "ACGT");
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        sa.buildLCP();
+        Path file = tempDir.resolve("chunked.saix");
+        MappedSuffixArray.write(sa, file);
+        
+        for (int chunkBytes : new int[] {4, 16, 1024}) {
+            try (MappedSuffixArray mapped = new MappedSuffixArray(file, chunkBytes)) {
+                assertArrayEquals(sa.getSuffixArray(), toArray(mapped), "chunk " + chunkBytes);
+                for (String pattern : new String[] {"A", "CGT", "TTAC", "GGGGGG"}) {
+                    assertArrayEquals(sa.findRange(pattern), mapped.findRange(pattern));
+                }
+                LCPArray lcp = mapped.getLCPArray();
+                for (int i = 0; i < lcp.length(); i++) {
+                    assertEquals(sa.getLCP()[i], lcp.get(i));
+                }
+            }
+        }
+        
+        int[] tokens = new int[1000];
+        for (int i = 0; i < tokens.length; i++) {
+            tokens[i] = 70000 + (i * 31) % 17;
+        }
+        SuffixArray wide = new SuffixArray(tokens);
+        wide.buildSuffixArray();
+        Path wideFile = tempDir.resolve("wide-chunked.saix");
+        MappedSuffixArray.write(wide, wideFile);
+        try (MappedSuffixArray mapped = new MappedSuffixArray(wideFile, 8)) {
+            assertArrayEquals(wide.getSuffixArray(), toArray(mapped));
+            int[] pattern = {tokens[500], tokens[501], tokens[502]};
+            assertEquals(wide.count(pattern), mapped.count(pattern));
+        }
+        
+        assertThrows(IllegalArgumentException.class, () -> new MappedSuffixArray(file, 2));
+        assertThrows(IllegalArgumentException.class, () -> new MappedSuffixArray(file, 24));
+    }
+    
+    @Test
+    @DisplayName("Foreign, newer and truncated files are rejected")
+    public void testInvalidFiles() throws IOException {
+        SuffixArray sa = new SuffixArray("mississippi", true);
+        sa.buildSuffixArray();
+        Path file = tempDir.resolve("valid.saix");
+        MappedSuffixArray.write(sa, file);
+        byte[] valid = Files.readAllBytes(file);
+        
+        Path foreign = tempDir.resolve("foreign.saix");
+        byte[] bytes = valid.clone();
+        bytes[0] ^= 1;
+        Files.write(foreign, bytes);
+        assertThrows(IOException.class, () -> new MappedSuffixArray(foreign));
+        
+        Path newer = tempDir.resolve("newer.saix");
+        bytes = valid.clone();
+        ByteBuffer.wrap(bytes).order(ByteOrder.LITTLE_ENDIAN)
+            .putInt(4, MappedSuffixArray.VERSION + 1);
+        Files.write(newer, bytes);
+        assertThrows(IOException.class, () -> new MappedSuffixArray(newer));
+        
+        Path truncated = tempDir.resolve("truncated.saix");
+        Files.write(truncated, Arrays.copyOf(valid, valid.length - 4));
+        assertThrows(IOException.class, () -> new MappedSuffixArray(truncated));
+        
+        Path empty = tempDir.resolve("empty.saix");
+        Files.write(empty, new byte[0]);
+        assertThrows(IOException.class, () -> new MappedSuffixArray(empty));
+    }
+    
+    private int[] toArray(MappedSuffixArray mapped) {
+        int[] sa = new int[mapped.size()];
+        for (int i = 0; i < sa.length; i++) {
+            sa[i] = mapped.get(i);
+        }
+        return sa;
+    }
+}
@@ -0,0 +1,197 @@
+package com.stringalgo;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.DisplayName;
+import static org.junit.jupiter.api.Assertions.*;
+
+import java.util.*;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.atomic.AtomicReference;
+
+/**
+ * Tests for the segmented index.
+ */
+public class SegmentedIndexTest {
+    
+    @Test
+    @DisplayName("Queries over segments and tail match all records")
+    public void testQueriesMatchNaive() {
+        List<String> records = new ArrayList<>();
+        Random rand = new Random(42);
+        try (SegmentedIndex index = new SegmentedIndex(16, 3)) {
+            for (int r = 0; r < 1000; r++) {
+                String record = TestTexts.randomString(rand, rand.nextInt(20), "abc");
+                assertEquals(r, index.add(record));
+                records.add(record);
+                
+                if (r % 37 == 0) {
+                    String pattern = TestTexts.randomString(rand, 1 + rand.nextInt(3), "abc");
+                    List<int[]> expected = occurrences(records, pattern);
+                    assertEquals(expected.size(), index.count(pattern));
+                    
+                    List<int[]> actual = index.locateAll(pattern);
+                    assertEquals(expected.size(), actual.size());
+                    for (int i = 0; i < expected.size(); i++) {
+                        assertArrayEquals(expected.get(i), actual.get(i),
+                                          "pattern \"" + pattern + "\"");
+                    }
+                }
+            }
+            
+            index.awaitMerges();
+            assertEquals(records.size(), index.size());
+            for (int r = 0; r < records.size(); r += 7) {
+                assertEquals(records.get(r), index.getRecord(r));
+            }
+            
+            // 62 flushed segments at merge factor 3 leave at most two per level
+            assertTrue(index.segmentCount() <= 2 * 4, "segments: " + index.segmentCount());
+            index.flush();
+            index.awaitMerges();
+            assertEquals(occurrences(records, "abc").size(), index.count("abc"));
+        }
+    }
+    
+    @Test
+    @DisplayName("Counts never go backwards while records are added and merged")
+    public void testConcurrentQueries() throws InterruptedException {
+        try (SegmentedIndex index = new SegmentedIndex(8, 2)) {
+            AtomicReference<Throwable> failure = new AtomicReference<>();
+            Thread reader = new Thread(() -> {
+                int previous = 0;
+                try {
+                    while (index.size() < 4000) {
+                        int count = index.count("ab");
+                        assertTrue(count >= previous, count + " after " + previous);
+                        previous = count;
+                    }
+                } catch (Throwable t) {
+                    failure.set(t);
+                }
+            });
+            reader.start();
+            for (int r = 0; r < 4000; r++) {
+                index.add("xabyab");
+            }
+            reader.join();
+            assertNull(failure.get());
+            
+            index.awaitMerges();
+            assertEquals(8000, index.count("ab"));
+        }
+    }
+    
+    @Test
+    @DisplayName("Flushes from concurrent writers publish segments in record order")
+    public void testConcurrentWriters() throws InterruptedException {
+        try (SegmentedIndex index = new SegmentedIndex(5, 3)) {
+            Thread[] writers = new Thread[4];
+            for (int w = 0; w < writers.length; w++) {
+                String record = "w" + w + "ab";
+                writers[w] = new Thread(() -> {
+                    for (int r = 0; r < 500; r++) {
+                        index.add(record);
+                    }
+                });
+                writers[w].start();
+            }
+            for (Thread writer : writers) {
+                writer.join();
+            }
+            index.flush();
+            index.awaitMerges();
+            
+            assertEquals(2000, index.size());
+            assertEquals(2000, index.count("ab"));
+            assertEquals(500, index.count("w2"));
+            List<int[]> hits = index.locateAll("ab");
+            for (int i = 0; i < hits.size(); i++) {
+                assertEquals(i, hits.get(i)[0]);
+                assertTrue(index.getRecord(i).endsWith("ab"));
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("Empty patterns are rejected, with records in the tail and in segments")
+    public void testEmptyPattern() {
+        try (SegmentedIndex index = new SegmentedIndex(4, 2)) {
+            for (int r = 0; r < 6; r++) {
+                index.add("abc");
+            }
+            assertThrows(IllegalArgumentException.class, () -> index.count(""));
+            assertThrows(IllegalArgumentException.class, () -> index.locateAll(""));
+            assertEquals(6, index.count("b"));
+        }
+    }
+    
+    @Test
+    @DisplayName("Records can still be added and flushed after close")
+    public void testAddAfterClose() {
+        SegmentedIndex index = new SegmentedIndex(2, 2);
+        index.add("abc");
+        index.close();
+        for (int r = 0; r < 9; r++) {
+            index.add("abc");
+        }
+        index.flush();
+        index.awaitMerges();
+        assertEquals(10, index.count("bc"));
+        assertEquals(5, index.segmentCount());
+    }
+    
+    @Test
+    @DisplayName("A failed flush keeps its records searchable and later flushes are published")
+    public void testFailedFlush() {
+        AtomicInteger builds = new AtomicInteger();
+        SegmentedIndex index = new SegmentedIndex(2, 3, records -> {
+            if (builds.incrementAndGet() == 2) {
+                throw new IllegalStateException("injected");
+            }
+            return new GeneralizedSuffixArray(records);
+        });
+        index.add("ab");
+        index.add("b");
+        index.add("ab");
+        assertThrows(IllegalStateException.class, () -> index.add("c"));
+        assertEquals(2, index.segmentCount());
+        assertEquals(4, index.size());
+        assertEquals("c", index.getRecord(3));
+        assertEquals(2, index.count("ab"));
+        
+        index.add("cab");
+        index.add("d");
+        assertEquals(3, index.count("ab"));
+        
+        // The merge of all three segments indexes the failed flush's records
+        IllegalStateException e = assertThrows(IllegalStateException.class, index::awaitMerges);
+        assertEquals("injected", e.getCause().getMessage());
+        assertEquals(4, builds.get());
+        assertEquals(1, index.segmentCount());
+        assertEquals(1, index.count("c"));
+        List<int[]> hits = index.locateAll("ab");
+        assertEquals(3, hits.size());
+        assertArrayEquals(new int[] {0, 0}, hits.get(0));
+        assertArrayEquals(new int[] {2, 0}, hits.get(1));
+        assertArrayEquals(new int[] {4, 1}, hits.get(2));
+        assertThrows(IllegalStateException.class, index::close);
+    }
+    
+    @Test
+    @DisplayName("Invalid settings are rejected")
+    public void testInvalidSettings() {
+        assertThrows(IllegalArgumentException.class, () -> new SegmentedIndex(0, 4));
+        assertThrows(IllegalArgumentException.class, () -> new SegmentedIndex(16, 1));
+    }
+    
+    private List<int[]> occurrences(List<String> records, String pattern) {
+        List<int[]> result = new ArrayList<>();
+        for (int r = 0; r < records.size(); r++) {
+            String record = records.get(r);
+            for (int i = record.indexOf(pattern); i >= 0; i = record.indexOf(pattern, i + 1)) {
+                result.add(new int[] {r, i});
+            }
+        }
+        return result;
+    }
+}
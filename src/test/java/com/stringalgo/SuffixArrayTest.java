@@ -3,10 +3,15 @@ package com.stringalgo;
 import org.junit.jupiter.api.Test;
 import org.junit.jupiter.api.DisplayName;
 import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.params.ParameterizedTest;
+import org.junit.jupiter.params.provider.EnumSource;
 import static org.junit.jupiter.api.Assertions.*;
+import static org.junit.jupiter.api.Assumptions.assumeTrue;
 
 import java.util.*;
 import java.io.*;
+import java.lang.management.ManagementFactory;
+import java.nio.ByteBuffer;
 
 /**
  * Comprehensive test suite for Suffix Array implementation with LCP.
@@ -479,8 +484,627 @@ public class SuffixArrayTest {
         testLongString("Long-25K", text);
     }
     
+    // ==================== CONSTRUCTION ALGORITHM TESTS ====================
+    
+    @ParameterizedTest(name = "{0}")
+    @EnumSource(value = SuffixArray.Algorithm.class, names = "PREFIX_DOUBLING",
+                mode = EnumSource.Mode.EXCLUDE)
+    @DisplayName("Construction algorithms match prefix doubling")
+    public void testMatchesPrefixDoubling(SuffixArray.Algorithm algorithm) {
+        String[] texts = {
+            "banana", "a", "aaa", "mississippi", "abcabc",
+            "The quick brown fox jumps over the lazy dog",
+            "cost: $5 or $10$", generateFibonacciString(15),
+            generateRandomString(5000, "ACGT"), generateRandomString(3000, "01")
+        };
+        
+        for (String text : texts) {
+            assertSameAsPrefixDoubling(text, algorithm);
+        }
+    }
+    
+    @Test
+    @DisplayName("DC3 on an integer alphabet")
+    public void testDC3IntegerAlphabet() {
+        Random rand = new Random(42);
+        int[] vocabulary = {7, 1_000_000, 42, 2_000_000_000, 65_536, 0};
+        int[] tokens = new int[3000];
+        for (int i = 0; i < tokens.length; i++) {
+            tokens[i] = vocabulary[rand.nextInt(vocabulary.length)];
+        }
+        
+        SuffixArray sa = new SuffixArray(tokens);
+        sa.buildSuffixArray(SuffixArray.Algorithm.DC3);
+        sa.buildLCP();
+        
+        assertEquals(tokens.length + 1, sa.getLength());
+        assertArrayEquals(naiveSuffixArray(tokens), sa.getSuffixArray());
+        assertArrayEquals(naiveLCP(tokens, sa.getSuffixArray()), sa.getLCP());
+        
+        SuffixArray doubling = new SuffixArray(tokens);
+        doubling.buildSuffixArray();
+        assertArrayEquals(doubling.getSuffixArray(), sa.getSuffixArray());
+        
+        int[] pattern = Arrays.copyOfRange(tokens, 100, 110);
+        int pos = sa.search(pattern);
+        assertTrue(pos >= 0);
+        assertArrayEquals(pattern, Arrays.copyOfRange(tokens, pos, pos + pattern.length));
+        assertEquals(-1, sa.search(new int[] {3}));
+    }
+    
+    @Test
+    @DisplayName("Distinct substrings of an integer text")
+    public void testIntegerDistinctSubstrings() {
+        int[] tokens = {5, 1, 5, 1, 5, 300_000};
+        SuffixArray sa = new SuffixArray(tokens);
+        sa.buildSuffixArray(SuffixArray.Algorithm.DC3);
+        
+        Set<List<Integer>> distinct = new HashSet<>();
+        for (int i = 0; i < tokens.length; i++) {
+            List<Integer> substring = new ArrayList<>();
+            for (int j = i; j < tokens.length; j++) {
+                substring.add(tokens[j]);
+                distinct.add(new ArrayList<>(substring));
+            }
+        }
+        
+        assertEquals(distinct.size(), sa.countDistinctSubstrings());
+    }
+    
+    @Test
+    @DisplayName("Parallel doubling matches prefix doubling for any thread count")
+    public void testParallelDoublingMatchesPrefixDoubling() {
+        String[] texts = {
+            "banana", "a", "mississippi", "cost: $5 or $10$",
+            generateFibonacciString(15), generateRandomString(20000, "ACGT")
+        };
+        
+        for (String text : texts) {
+            SuffixArray expected = new SuffixArray(text);
+            expected.buildSuffixArray();
+            
+            for (int threads : new int[] {1, 2, 3, 8}) {
+                SuffixArray actual = new SuffixArray(text);
+                actual.buildSuffixArrayParallel(threads);
+                assertArrayEquals(expected.getSuffixArray(), actual.getSuffixArray(),
+                                 threads + " threads, text length " + text.length());
+            }
+        }
+        
+        assertSameAsPrefixDoubling(generateRandomString(5000, "01"),
+                                   SuffixArray.Algorithm.PARALLEL_DOUBLING);
+        assertThrows(IllegalArgumentException.class,
+                     () -> new SuffixArray("abc").buildSuffixArrayParallel(0));
+    }
+    
+    @Test
+    @DisplayName("Parallel doubling on a wide integer alphabet")
+    public void testParallelDoublingIntegerAlphabet() {
+        Random rand = new Random(42);
+        int[] tokens = new int[5000];
+        for (int i = 0; i < tokens.length; i++) {
+            tokens[i] = rand.nextInt(4) * 1_000_000;
+        }
+        
+        SuffixArray sa = new SuffixArray(tokens);
+        sa.buildSuffixArrayParallel(4);
+        assertArrayEquals(naiveSuffixArray(tokens), sa.getSuffixArray());
+    }
+    
+    // ==================== BYTE AND CHARSEQUENCE INPUT TESTS ====================
+    
+    @Test
+    @DisplayName("Byte input sorts unsigned bytes with a virtual sentinel")
+    public void testByteInput() {
+        byte[] bytes = {(byte) 0xFF, 0x01, (byte) 0x80, 0x01, (byte) 0xFF, 0x00};
+        int[] symbols = new int[bytes.length];
+        for (int i = 0; i < bytes.length; i++) {
+            symbols[i] = bytes[i] & 0xFF;
+        }
+        int[] expected = naiveSuffixArray(symbols);
+        
+        for (SuffixArray.Algorithm algorithm : SuffixArray.Algorithm.values()) {
+            SuffixArray sa = new SuffixArray(bytes);
+            sa.buildSuffixArray(algorithm);
+            sa.buildLCP();
+            assertArrayEquals(expected, sa.getSuffixArray(), algorithm.toString());
+            assertArrayEquals(naiveLCP(symbols, expected), sa.getLCP(), algorithm.toString());
+        }
+        
+        SuffixArray sa = new SuffixArray(bytes);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        assertEquals(2, sa.search(new byte[] {(byte) 0x80, 0x01}));
+        assertEquals(5, sa.search(new byte[] {0x00}));
+        assertEquals(-1, sa.search(new byte[] {0x00, 0x00}));
+        assertNull(sa.getText());
+    }
+    
+    @Test
+    @DisplayName("ByteBuffer input indexes the bytes between position and limit")
+    public void testByteBufferInput() {
+        byte[] text = generateRandomString(3000, "ACGT").getBytes();
+        ByteBuffer buffer = ByteBuffer.allocateDirect(text.length + 20);
+        buffer.position(10);
+        buffer.put(text);
+        buffer.position(10).limit(10 + text.length);
+        
+        SuffixArray fromBuffer = new SuffixArray(buffer);
+        fromBuffer.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        SuffixArray fromArray = new SuffixArray(text);
+        fromArray.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        
+        assertEquals(text.length + 1, fromBuffer.getSuffixArray().length);
+        assertArrayEquals(fromArray.getSuffixArray(), fromBuffer.getSuffixArray());
+        assertEquals(10, buffer.position(), "Buffer position must not move");
+    }
+    
+    @Test
+    @DisplayName("ofSequence indexes a CharSequence without a '$' copy")
+    public void testCharSequenceInput() {
+        StringBuilder text = new StringBuilder("banana");
+        SuffixArray sa = SuffixArray.ofSequence(text);
+        sa.buildSuffixArray();
+        sa.buildLCP();
+        
+        assertArrayEquals(new int[] {6, 5, 3, 1, 0, 4, 2}, sa.getSuffixArray());
+        assertArrayEquals(new int[] {0, 0, 1, 3, 0, 0, 2}, sa.getLCP());
+        assertEquals(15, sa.countDistinctSubstrings());
+        assertEquals("ana", sa.longestRepeatedSubstring());
+        assertEquals(1, sa.search("ana") % 2);
+        assertEquals(-1, sa.search("nab"));
+        
+        String random = generateRandomString(5000, "abc");
+        SuffixArray expected = new SuffixArray(random);
+        expected.buildSuffixArray();
+        SuffixArray actual = SuffixArray.ofSequence(new StringBuilder(random));
+        actual.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        assertArrayEquals(expected.getSuffixArray(), actual.getSuffixArray());
+        
+        // The sentinel mode follows the factory, not the argument's type
+        CharSequence typed = "banana";
+        SuffixArray fromString = new SuffixArray("banana");
+        SuffixArray fromSequence = SuffixArray.ofSequence(typed);
+        assertEquals("banana$", fromString.getText());
+        assertNull(fromSequence.getText());
+        assertEquals(7, fromSequence.getSuffixArray().length);
+    }
+    
+    @Test
+    @DisplayName("Implicit sentinel handles '$' inside the text")
+    public void testImplicitSentinelWithDollar() {
+        String[] texts = {"cost: $5 or $10$", "$", "$$a$", "", "a$b$a$b"};
+        
+        for (String text : texts) {
+            int[] chars = text.chars().toArray();
+            int[] expectedSA = naiveSuffixArray(chars);
+            
+            for (SuffixArray.Algorithm algorithm : SuffixArray.Algorithm.values()) {
+                SuffixArray sa = new SuffixArray(text, true);
+                sa.buildSuffixArray(algorithm);
+                sa.buildLCP();
+                assertArrayEquals(expectedSA, sa.getSuffixArray(),
+                                 algorithm + " on \"" + text + "\"");
+                assertArrayEquals(naiveLCP(chars, expectedSA), sa.getLCP(),
+                                 algorithm + " on \"" + text + "\"");
+            }
+        }
+        
+        String text = "cost: $5 or $10$";
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray();
+        assertSame(text, sa.getText(), "Text must not be copied");
+        assertEquals(12, sa.search("$10$"));
+        assertEquals(-1, sa.search("$10$$"));
+        assertEquals('$', text.charAt(sa.search("$")));
+        
+        Set<String> distinct = new HashSet<>();
+        for (int i = 0; i < text.length(); i++) {
+            for (int j = i + 1; j <= text.length(); j++) {
+                distinct.add(text.substring(i, j));
+            }
+        }
+        assertEquals(distinct.size(), sa.countDistinctSubstrings());
+        assertEquals(" $", sa.longestRepeatedSubstring());
+    }
+    
+    // ==================== LCP ALGORITHM TESTS ====================
+    
+    @Test
+    @DisplayName("Phi LCP matches Kasai")
+    public void testPhiMatchesKasai() {
+        String[] texts = {
+            "banana", "a", "mississippi", "cost: $5 or $10$", "aaaaaaaa",
+            generateFibonacciString(15), generateRandomString(20000, "ACGT")
+        };
+        
+        for (String text : texts) {
+            for (boolean implicitSentinel : new boolean[] {false, true}) {
+                SuffixArray kasai = new SuffixArray(text, implicitSentinel);
+                kasai.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+                kasai.buildLCP(SuffixArray.LCPAlgorithm.KASAI);
+                
+                SuffixArray phi = new SuffixArray(text, implicitSentinel);
+                phi.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+                phi.buildLCP(SuffixArray.LCPAlgorithm.PHI);
+                
+                assertArrayEquals(kasai.getLCP(), phi.getLCP(),
+                                 "LCP mismatch for text length " + text.length());
+            }
+        }
+        
+        int[] tokens = {3, 1, 3, 1, 3, 2_000_000};
+        SuffixArray sa = new SuffixArray(tokens);
+        sa.buildSuffixArray(SuffixArray.Algorithm.DC3);
+        sa.buildLCP(SuffixArray.LCPAlgorithm.PHI);
+        assertArrayEquals(naiveLCP(tokens, sa.getSuffixArray()), sa.getLCP());
+    }
+    
+    @Test
+    @DisplayName("In-place Phi LCP matches Kasai and releases the rank buffer")
+    public void testInPlaceLCP() {
+        String[] texts = {
+            "banana", "a", "", "mississippi", "cost: $5 or $10$",
+            generateFibonacciString(15), generateRandomString(20000, "ACGT")
+        };
+        
+        for (String text : texts) {
+            for (SuffixArray.Algorithm algorithm : SuffixArray.Algorithm.values()) {
+                SuffixArray kasai = new SuffixArray(text, true);
+                kasai.buildSuffixArray(algorithm);
+                kasai.buildLCP(SuffixArray.LCPAlgorithm.KASAI);
+                
+                SuffixArray inPlace = new SuffixArray(text, true);
+                inPlace.buildSuffixArray(algorithm);
+                inPlace.buildLCP(SuffixArray.LCPAlgorithm.PHI_IN_PLACE);
+                
+                assertArrayEquals(kasai.getLCP(), inPlace.getLCP(),
+                                 algorithm + ", text length " + text.length());
+                assertArrayEquals(kasai.getSuffixArray(), inPlace.getSuffixArray());
+            }
+        }
+        
+        // Building again after the rank buffer was taken over
+        SuffixArray sa = new SuffixArray("mississippi");
+        sa.buildSuffixArray();
+        sa.buildLCP(SuffixArray.LCPAlgorithm.PHI_IN_PLACE);
+        int[] first = sa.getLCP().clone();
+        sa.buildLCP(SuffixArray.LCPAlgorithm.PHI_IN_PLACE);
+        assertArrayEquals(first, sa.getLCP());
+        sa.buildSuffixArray(SuffixArray.Algorithm.RADIX_DOUBLING);
+        sa.buildLCP();
+        assertArrayEquals(first, sa.getLCP());
+        assertEquals("issi", sa.longestRepeatedSubstring());
+    }
+    
+    @Test
+    @DisplayName("Every LCP algorithm handles the empty text")
+    public void testEmptyTextLCP() {
+        for (boolean implicit : new boolean[] {false, true}) {
+            for (SuffixArray.Algorithm algorithm : SuffixArray.Algorithm.values()) {
+                for (SuffixArray.LCPAlgorithm lcpAlgorithm : SuffixArray.LCPAlgorithm.values()) {
+                    SuffixArray sa = new SuffixArray("", implicit);
+                    sa.buildSuffixArray(algorithm);
+                    sa.buildLCP(lcpAlgorithm);
+                    assertArrayEquals(new int[] {0}, sa.getLCP(), algorithm + ", " + lcpAlgorithm);
+                }
+            }
+            
+            SuffixArray sa = new SuffixArray("", implicit);
+            sa.buildSuffixArray();
+            sa.buildLCP(SuffixArray.LCPAlgorithm.PHI_IN_PLACE);
+            assertArrayEquals(new int[] {0}, sa.getLCP());
+        }
+    }
+    
+    @Test
+    @DisplayName("Compact LCP array stores large values in the overflow table")
+    public void testCompactLCPArray() {
+        int[] values = {0, 3, 254, 255, 256, 0, 100_000, 1, Integer.MAX_VALUE};
+        CompactLCPArray compact = new CompactLCPArray(values);
+        
+        assertEquals(values.length, compact.length());
+        assertEquals(4, compact.overflowCount());
+        for (int i = 0; i < values.length; i++) {
+            assertEquals(values[i], compact.get(i), "Index " + i);
+        }
+        assertThrows(IllegalArgumentException.class,
+                     () -> new CompactLCPArray(new int[] {0, -1}));
+    }
+    
+    @Test
+    @DisplayName("Queries give the same answers on a compacted LCP array")
+    public void testCompactLCPQueries() {
+        // Long repeats push some LCP values past one byte
+        String unit = generateRandomString(400, "ACGT");
+        String text = unit + "T" + unit + "G" + generateRandomString(2000, "ACGT");
+        
+        SuffixArray plain = new SuffixArray(text);
+        plain.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        plain.buildLCP();
+        
+        SuffixArray compact = new SuffixArray(text);
+        compact.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        compact.compactLCP();
+        
+        assertNull(compact.getLCP());
+        assertTrue(compact.getLCPArray() instanceof CompactLCPArray);
+        assertTrue(((CompactLCPArray) compact.getLCPArray()).overflowCount() > 0);
+        for (int i = 0; i < plain.getLCP().length; i++) {
+            assertEquals(plain.getLCP()[i], compact.getLCPArray().get(i));
+        }
+        assertEquals(plain.countDistinctSubstrings(), compact.countDistinctSubstrings());
+        assertEquals(plain.longestRepeatedSubstring(), compact.longestRepeatedSubstring());
+        assertTrue(compact.longestRepeatedSubstring().length() >= 400);
+        
+        // Rebuilding brings back the plain array
+        compact.buildLCP(SuffixArray.LCPAlgorithm.PHI);
+        assertArrayEquals(plain.getLCP(), compact.getLCP());
+    }
+    
+    // ==================== SEARCH ALGORITHM TESTS ====================
+    
+    @Test
+    @DisplayName("MLR and LCP-LR search agree with binary search")
+    public void testAcceleratedSearchMatchesBinary() {
+        String unit = generateRandomString(300, "AC");
+        String[] texts = {
+            "banana", "a", "", "mississippi", "cost: $5 or $10$",
+            generateFibonacciString(18), unit + unit + unit + "G" + unit,
+            generateRandomString(5000, "ACGT")
+        };
+        Random rand = new Random(7);
+        
+        for (String text : texts) {
+            for (boolean implicitSentinel : new boolean[] {false, true}) {
+                SuffixArray sa = new SuffixArray(text, implicitSentinel);
+                sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+                
+                for (int q = 0; q < 200; q++) {
+                    String pattern;
+                    if (!text.isEmpty() && q % 3 != 0) {
+                        int start = rand.nextInt(text.length());
+                        int end = Math.min(text.length(), start + rand.nextInt(700));
+                        pattern = text.substring(start, end);
+                    } else {
+                        pattern = generateRandomString(rand.nextInt(8), "ACGTabn$");
+                    }
+                    if (q % 5 == 0 && !pattern.isEmpty()) {
+                        pattern = pattern.substring(0, pattern.length() - 1) + "Z";
+                    }
+                    
+                    int expected = sa.search(pattern);
+                    for (SuffixArray.SearchAlgorithm algorithm : SuffixArray.SearchAlgorithm.values()) {
+                        assertEquals(expected, sa.search(pattern, algorithm),
+                                    algorithm + " for \"" + pattern + "\"");
+                    }
+                }
+            }
+        }
+    }
+    
+    @Test
+    @DisplayName("LCP-LR search works on a compacted LCP array")
+    public void testLCPLRSearchWithCompactLCP() {
+        String text = generateFibonacciString(20);
+        SuffixArray sa = new SuffixArray(text);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        sa.compactLCP();
+        sa.buildLCPLR();
+        
+        String pattern = text.substring(1000, 3000);
+        int pos = sa.search(pattern, SuffixArray.SearchAlgorithm.LCP_LR);
+        assertEquals(sa.search(pattern), pos);
+        assertEquals(pattern, text.substring(pos, pos + pattern.length()));
+        assertEquals(-1, sa.search(pattern + "c", SuffixArray.SearchAlgorithm.LCP_LR));
+    }
+    
+    @Test
+    @DisplayName("search(String) does not allocate per query")
+    public void testSearchDoesNotAllocate() {
+        java.lang.management.ThreadMXBean threads = ManagementFactory.getThreadMXBean();
+        assumeTrue(threads instanceof com.sun.management.ThreadMXBean);
+        com.sun.management.ThreadMXBean counters = (com.sun.management.ThreadMXBean) threads;
+        assumeTrue(counters.isThreadAllocatedMemorySupported() &&
+                   counters.isThreadAllocatedMemoryEnabled());
+        long thread = Thread.currentThread().getId();
+        
+        String text = generateRandomString(10000, "ACGT");
+        SuffixArray sa = new SuffixArray(text);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        String[] patterns = {
+            text.substring(100, 120), text.substring(5000, 5003), "TTTTTTTTTTTTTTTTTTTT"
+        };
+        
+        int queries = 100000;
+        int hits = 0;
+        for (int i = 0; i < queries; i++) {
+            hits += sa.search(patterns[i % patterns.length]) >= 0 ? 1 : 0;
+        }
+        
+        long before = counters.getThreadAllocatedBytes(thread);
+        for (int i = 0; i < queries; i++) {
+            hits += sa.search(patterns[i % patterns.length]) >= 0 ? 1 : 0;
+        }
+        long allocated = counters.getThreadAllocatedBytes(thread) - before;
+        
+        assertTrue(hits > 0);
+        // Allow a little slack for the measurement itself, far below a byte per query
+        assertTrue(allocated < queries / 10, "Allocated " + allocated + " bytes");
+    }
+    
+    @Test
+    @DisplayName("findRange, count and locateAll report every occurrence")
+    public void testFindRangeCountLocateAll() {
+        String[] texts = {
+            "banana", "mississippi", "cost: $5 or $10$", "aaaaaaaaaa",
+            generateFibonacciString(12), generateRandomString(3000, "ACGT")
+        };
+        String[] patterns = {
+            "a", "an", "ana", "issi", "s", "$", "$1", "ABA", "ACG", "aaa", "x", ""
+        };
+        
+        for (String text : texts) {
+            for (boolean implicitSentinel : new boolean[] {false, true}) {
+                SuffixArray sa = new SuffixArray(text, implicitSentinel);
+                sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+                String indexed = implicitSentinel ? text : sa.getText();
+                
+                for (String pattern : patterns) {
+                    List<Integer> expected = new ArrayList<>();
+                    for (int i = 0; i < indexed.length(); i++) {
+                        if (indexed.startsWith(pattern, i)) {
+                            expected.add(i);
+                        }
+                    }
+                    if (implicitSentinel && pattern.isEmpty()) {
+                        expected.add(text.length()); // The empty suffix
+                    }
+                    
+                    int[] range = sa.findRange(pattern);
+                    assertEquals(expected.size(), range[1] - range[0], "\"" + pattern + "\"");
+                    assertEquals(expected.size(), sa.count(pattern));
+                    
+                    int[] located = sa.locateAll(pattern).sorted().toArray();
+                    assertArrayEquals(expected.stream().mapToInt(Integer::intValue).toArray(),
+                                     located);
+                }
+            }
+        }
+        
+        int[] tokens = {7, 3, 7, 3, 7, 1_000_000};
+        SuffixArray sa = new SuffixArray(tokens);
+        sa.buildSuffixArray(SuffixArray.Algorithm.DC3);
+        assertEquals(2, sa.count(new int[] {7, 3}));
+        assertArrayEquals(new int[] {0, 2, 4}, sa.locateAll(new int[] {7}).sorted().toArray());
+        assertEquals(0, sa.count(new int[] {3, 3}));
+        
+        SuffixArray bytes = new SuffixArray(new byte[] {1, (byte) 200, 1, (byte) 200});
+        bytes.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        assertEquals(2, bytes.count(new byte[] {1, (byte) 200}));
+        assertArrayEquals(new int[] {1, 3},
+                         bytes.locateAll(new byte[] {(byte) 200}).sorted().toArray());
+    }
+    
+    @Test
+    @DisplayName("Batch search returns the same ranges as single searches")
+    public void testFindRangesBatch() {
+        String text = generateRandomString(20000, "ACGT");
+        Random rand = new Random(11);
+        
+        List<String> list = new ArrayList<>();
+        for (int i = 0; i < 2000; i++) {
+            int start = rand.nextInt(text.length());
+            list.add(text.substring(start, Math.min(text.length(), start + rand.nextInt(15))));
+        }
+        // Prefixes of each other, duplicates, absent patterns and the empty pattern
+        list.addAll(Arrays.asList("A", "AC", "ACG", "ACGT", "AC", "", "N", "ACGN", "T", "TT"));
+        String[] patterns = list.toArray(new String[0]);
+        
+        for (boolean implicitSentinel : new boolean[] {false, true}) {
+            SuffixArray sa = new SuffixArray(text, implicitSentinel);
+            sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+            
+            int[][] ranges = sa.findRanges(patterns);
+            assertEquals(patterns.length, ranges.length);
+            for (int i = 0; i < patterns.length; i++) {
+                assertArrayEquals(sa.findRange(patterns[i]), ranges[i],
+                                 "\"" + patterns[i] + "\"");
+            }
+        }
+        
+        SuffixArray sa = new SuffixArray("mississippi");
+        sa.buildSuffixArray();
+        assertEquals(0, sa.findRanges(new String[0]).length);
+        int[][] ranges = sa.findRanges(new String[] {"ssi", "i", "issi", "x"});
+        assertEquals(2, ranges[0][1] - ranges[0][0]);
+        assertEquals(4, ranges[1][1] - ranges[1][0]);
+        assertEquals(2, ranges[2][1] - ranges[2][0]);
+        assertEquals(0, ranges[3][1] - ranges[3][0]);
+    }
+    
+    @Test
+    @DisplayName("k-mer table gives the same search results")
+    public void testKmerTableSearch() {
+        String text = generateRandomString(20000, "ACGT");
+        Random rand = new Random(3);
+        List<String> patterns = new ArrayList<>(
+            Arrays.asList("", "A", "N", "AN", "ACGTN", "$", "T$"));
+        for (int i = 0; i < 500; i++) {
+            int start = rand.nextInt(text.length());
+            patterns.add(text.substring(start, Math.min(text.length(), start + rand.nextInt(12))));
+        }
+        
+        for (boolean implicitSentinel : new boolean[] {false, true}) {
+            SuffixArray plain = new SuffixArray(text, implicitSentinel);
+            plain.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+            
+            for (int maxK : new int[] {1, 3, 6}) {
+                SuffixArray sa = new SuffixArray(text, implicitSentinel);
+                sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+                assertEquals(maxK, sa.buildKmerTable(maxK, 1 << 24));
+                
+                for (String pattern : patterns) {
+                    assertArrayEquals(plain.findRange(pattern), sa.findRange(pattern),
+                                     "k = " + maxK + ", \"" + pattern + "\"");
+                    assertEquals(plain.search(pattern), sa.search(pattern));
+                    assertEquals(plain.count(pattern), sa.count(pattern));
+                }
+            }
+        }
+        
+        // 4 symbols plus end of text: 5^3 + 1 entries fit, 5^4 + 1 do not
+        SuffixArray sa = new SuffixArray(text, true);
+        sa.buildSuffixArray(SuffixArray.Algorithm.SA_IS);
+        assertEquals(3, sa.buildKmerTable(10, 4 * (125 + 1)));
+        assertThrows(IllegalArgumentException.class, () -> sa.buildKmerTable(10, 8));
+        assertThrows(IllegalArgumentException.class, () -> sa.buildKmerTable(0, 1 << 20));
+    }
+    
     // ==================== HELPER METHODS ====================
     
+    private int[] naiveSuffixArray(int[] tokens) {
+        Integer[] order = new Integer[tokens.length + 1];
+        for (int i = 0; i < order.length; i++) {
+            order[i] = i;
+        }
+        Arrays.sort(order, (a, b) -> Arrays.compare(tokens, a, tokens.length,
+                                                    tokens, b, tokens.length));
+        
+        int[] sa = new int[order.length];
+        for (int i = 0; i < sa.length; i++) {
+            sa[i] = order[i];
+        }
+        return sa;
+    }
+    
+    private int[] naiveLCP(int[] tokens, int[] sa) {
+        int[] lcp = new int[sa.length];
+        for (int i = 1; i < sa.length; i++) {
+            int k = 0;
+            while (sa[i - 1] + k < tokens.length && sa[i] + k < tokens.length &&
+                   tokens[sa[i - 1] + k] == tokens[sa[i] + k]) {
+                k++;
+            }
+            lcp[i] = k;
+        }
+        return lcp;
+    }
+    
+    private void assertSameAsPrefixDoubling(String text, SuffixArray.Algorithm algorithm) {
+        SuffixArray expected = new SuffixArray(text);
+        expected.buildSuffixArray();
+        expected.buildLCP();
+        
+        SuffixArray actual = new SuffixArray(text);
+        actual.buildSuffixArray(algorithm);
+        actual.buildLCP();
+        
+        assertArrayEquals(expected.getSuffixArray(), actual.getSuffixArray(),
+                         algorithm + " SA mismatch for \"" + text + "\"");
+        assertArrayEquals(expected.getLCP(), actual.getLCP(),
+                         algorithm + " LCP mismatch for \"" + text + "\"");
+    }
+    
     private void testLongString(String name, String text) {
         SuffixArray sa = new SuffixArray(text);
         
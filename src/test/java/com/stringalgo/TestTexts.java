@@ -0,0 +1,52 @@
+package com.stringalgo;
+
+import java.util.Random;
+
+/**
+ * Random texts shared by the test classes. Each caller passes its own seed
+ * so that texts are reproducible but independent across tests.
+ */
+final class TestTexts {
+    
+    private TestTexts() {
+    }
+    
+    /**
+     * @param seed the seed of the generator
+     * @param length the length of the string
+     * @param alphabet the symbols to draw from
+     * @return a string of uniformly random symbols
+     */
+    static String randomString(long seed, int length, String alphabet) {
+        return randomString(new Random(seed), length, alphabet);
+    }
+    
+    /**
+     * @param rand the generator to draw from
+     * @param length the length of the string
+     * @param alphabet the symbols to draw from
+     * @return a string of uniformly random symbols
+     */
+    static String randomString(Random rand, int length, String alphabet) {
+        StringBuilder sb = new StringBuilder(length);
+        for (int i = 0; i < length; i++) {
+            sb.append(alphabet.charAt(rand.nextInt(alphabet.length())));
+        }
+        return sb.toString();
+    }
+    
+    /**
+     * @param seed the seed of the generator
+     * @param length the number of bytes
+     * @param alphabetSize the number of symbols, starting at 'a'
+     * @return bytes of uniformly random symbols
+     */
+    static byte[] randomBytes(long seed, int length, int alphabetSize) {
+        Random rand = new Random(seed);
+        byte[] bytes = new byte[length];
+        for (int i = 0; i < length; i++) {
+            bytes[i] = (byte) ('a' + rand.nextInt(alphabetSize));
+        }
+        return bytes;
+    }
+}